@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API响应数据模块
+保存一次接口调用的原始响应体、解析结果和响应元数据
+"""
+
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List
+
+from api.json_backend import JsonBackend, get_backend
+from models.app_info import AppInfo
+from utils.tracing import get_tracer
+
+
+@dataclass
+class ApiResponse:
+    """一次接口调用的响应，JSON在首次访问时才解码"""
+    
+    # 原始响应体
+    content: bytes
+    status_code: int
+    # 总耗时（秒，含限流等待和重试）
+    elapsed: float
+    attempts: int = 1
+    from_cache: bool = False
+    backend: Optional[JsonBackend] = field(default=None, repr=False)
+    _data: Optional[Dict[str, Any]] = field(default=None, repr=False)
+    
+    @property
+    def size(self) -> int:
+        """响应体大小（字节）"""
+        return len(self.content)
+    
+    @property
+    def data(self) -> Dict[str, Any]:
+        """解码后的JSON数据（首次访问时解码并缓存）"""
+        if self._data is None:
+            backend = self.backend or get_backend()
+            with get_tracer().span('json.loads', backend=backend.name, size=len(self.content)):
+                self._data = backend.loads(self.content)
+        return self._data
+    
+    def app_infos(self) -> List[AppInfo]:
+        """
+        将响应中的结果转换为AppInfo列表
+        
+        尚未解码为字典时，由解码后端直接从响应体构建AppInfo（惰性模式的后端返回LazyAppInfo）。
+        
+        Returns:
+            AppInfo对象列表
+        """
+        if self._data is not None:
+            results = self._data.get('results', [])
+            with get_tracer().span('model.build', count=len(results)):
+                return AppInfo.from_api_batch(results)
+        backend = self.backend or get_backend()
+        with get_tracer().span('json.decode_apps', backend=backend.name, size=len(self.content)):
+            return backend.decode_apps(self.content)
+
+
+@dataclass
+class LookupResult:
+    """单次 /lookup 请求的解析结果与原始响应"""
+    
+    app_info: Optional[AppInfo]
+    response: ApiResponse
+    
+    @property
+    def raw(self) -> Dict[str, Any]:
+        """原始响应数据"""
+        return self.response.data
+    
+    @property
+    def raw_bytes(self) -> bytes:
+        """原始响应体"""
+        return self.response.content
@@ -0,0 +1,233 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+应用信息内存缓存模块
+进程内的AppInfo对象LRU缓存，支持TTL、按条目数或近似字节数限制容量
+"""
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from typing import Optional, Dict, Tuple
+
+from models.app_info import AppInfo
+from models.lazy_app_info import LazyAppInfo
+
+
+CacheKey = Tuple[str, str, str]
+
+
+@dataclass
+class AppInfoCacheStats:
+    """内存缓存统计"""
+    
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    
+    @property
+    def hit_ratio(self) -> float:
+        """命中率"""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+@dataclass
+class _Entry:
+    """缓存条目"""
+    
+    app_info: AppInfo
+    expires_at: float
+    size: int
+    aliases: Tuple[CacheKey, ...]
+
+
+def make_cache_key(app_id: str, country: str) -> CacheKey:
+    """
+    生成缓存键 (ID类型, ID, 国家代码)
+    
+    Args:
+        app_id: 应用ID（trackId或bundleId）
+        country: 国家代码
+        
+    Returns:
+        缓存键元组
+    """
+    app_id = str(app_id).strip()
+    if app_id.isdigit():
+        return ('track', app_id, country.lower())
+    return ('bundle', app_id.lower(), country.lower())
+
+
+def estimate_size(app_info: AppInfo) -> int:
+    """
+    估算AppInfo对象占用的内存（字节）
+    
+    Args:
+        app_info: 应用信息
+        
+    Returns:
+        近似字节数
+    """
+    size = sys.getsizeof(app_info) + sys.getsizeof(app_info.__dict__)
+    for field in fields(app_info):
+        value = getattr(app_info, field.name)
+        if value is None:
+            continue
+        size += sys.getsizeof(value)
+        if isinstance(value, list):
+            size += sum(sys.getsizeof(item) for item in value)
+    return size
+
+
+class AppInfoCache:
+    """AppInfo对象LRU缓存类"""
+    
+    def __init__(self, max_entries: Optional[int] = 1024, max_bytes: Optional[int] = None,
+                 ttl: float = 600):
+        """
+        初始化内存缓存
+        
+        Args:
+            max_entries: 最大条目数（None表示不限制）
+            max_bytes: 近似内存上限（字节，None表示不限制）
+            ttl: 条目有效期（秒）
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.stats = AppInfoCacheStats()
+        
+        self._lock = threading.Lock()
+        # 主键 -> 条目，按最近使用排序
+        self._entries: 'OrderedDict[CacheKey, _Entry]' = OrderedDict()
+        # 别名键（trackId键与bundleId键）-> 主键
+        self._aliases: Dict[CacheKey, CacheKey] = {}
+        self._total_bytes = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    @property
+    def total_bytes(self) -> int:
+        """当前缓存的近似内存占用（字节）"""
+        return self._total_bytes
+    
+    def get(self, app_id: str, country: str) -> Optional[AppInfo]:
+        """
+        读取缓存
+        
+        Args:
+            app_id: 应用ID（trackId或bundleId）
+            country: 国家代码
+            
+        Returns:
+            缓存的AppInfo对象，未命中或已过期时为None
+        """
+        key = make_cache_key(app_id, country)
+        with self._lock:
+            primary = self._aliases.get(key)
+            entry = self._entries.get(primary) if primary is not None else None
+            
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            
+            if entry.expires_at < time.monotonic():
+                self._remove_locked(primary)
+                self.stats.expirations += 1
+                self.stats.misses += 1
+                return None
+            
+            self._entries.move_to_end(primary)
+            self.stats.hits += 1
+            return entry.app_info
+    
+    def put(self, app_info: AppInfo, country: str):
+        """
+        写入缓存，同一应用的trackId键和bundleId键指向同一条目
+        
+        LazyAppInfo会先转换为普通AppInfo：未解码字段是指向整个响应体的零拷贝片段，
+        缓存单个应用会让整页响应体一直存活，容量限制也就失去意义。
+        
+        Args:
+            app_info: 应用信息
+            country: 国家代码
+        """
+        if isinstance(app_info, LazyAppInfo):
+            app_info = app_info.to_app_info()
+        aliases = []
+        if app_info.track_id is not None:
+            aliases.append(make_cache_key(str(app_info.track_id), country))
+        if app_info.bundle_id:
+            aliases.append(make_cache_key(app_info.bundle_id, country))
+        if not aliases:
+            return
+        
+        primary = aliases[0]
+        entry = _Entry(
+            app_info=app_info,
+            expires_at=time.monotonic() + self.ttl,
+            size=estimate_size(app_info) if self.max_bytes is not None else 0,
+            aliases=tuple(aliases)
+        )
+        
+        with self._lock:
+            for alias in aliases:
+                old_primary = self._aliases.get(alias)
+                if old_primary is not None:
+                    self._remove_locked(old_primary)
+            
+            self._entries[primary] = entry
+            for alias in aliases:
+                self._aliases[alias] = primary
+            self._total_bytes += entry.size
+            self._evict_locked()
+    
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self._total_bytes = 0
+    
+    def _remove_locked(self, primary: CacheKey):
+        """删除条目及其别名（调用方需持有锁）"""
+        entry = self._entries.pop(primary, None)
+        if entry is None:
+            return
+        for alias in entry.aliases:
+            if self._aliases.get(alias) == primary:
+                del self._aliases[alias]
+        self._total_bytes -= entry.size
+    
+    def _evict_locked(self):
+        """超出容量时淘汰最久未使用的条目（调用方需持有锁）"""
+        while self._entries and (
+            (self.max_entries is not None and len(self._entries) > self.max_entries)
+            or (self.max_bytes is not None and self._total_bytes > self.max_bytes)
+        ):
+            primary = next(iter(self._entries))
+            self._remove_locked(primary)
+            self.stats.evictions += 1
+
+
+_default_app_cache = None
+_default_app_cache_lock = threading.Lock()
+
+
+def get_default_app_cache() -> AppInfoCache:
+    """
+    获取进程内共享的默认AppInfo缓存
+    
+    Returns:
+        AppInfoCache实例
+    """
+    global _default_app_cache
+    with _default_app_cache_lock:
+        if _default_app_cache is None:
+            _default_app_cache = AppInfoCache()
+        return _default_app_cache
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+异步iTunes API接口模块
+基于asyncio和aiohttp的iTunes API客户端，与iTunesAPI返回相同的AppInfo模型
+"""
+
+import asyncio
+import os
+import time
+from typing import Optional, List, Dict, Any
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp为可选依赖
+    aiohttp = None
+
+from api.circuit_breaker import CircuitBreaker, get_default_circuit_breaker
+from api.exceptions import iTunesAPIError, ThrottledError, DeadlineExceededError
+from api.hedging import Deadline
+from api.itunes_api import iTunesAPI, BASE_URL_ENV_VAR, build_lookup_params, build_search_params
+from api.json_backend import JsonBackend, get_backend
+from api.metrics import MetricsRegistry, get_default_metrics
+from api.response_cache import ResponseCache
+from api.single_flight import AsyncSingleFlight
+from api.rate_limiter import (
+    AdaptiveRateLimiter, RetryPolicy, get_default_rate_limiter, parse_retry_after,
+    THROTTLE_STATUS_CODES, RETRYABLE_STATUS_CODES
+)
+from models.app_info import AppInfo
+
+
+class AsyncITunesAPI:
+    """异步iTunes API客户端类"""
+    
+    BASE_URL = iTunesAPI.BASE_URL
+    LOOKUP_ENDPOINT = iTunesAPI.LOOKUP_ENDPOINT
+    SEARCH_ENDPOINT = iTunesAPI.SEARCH_ENDPOINT
+    
+    def __init__(self, timeout: float = 10, max_concurrency: int = 50,
+                 connection_limit: int = 100, keepalive_timeout: float = 30,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 json_backend: Optional[JsonBackend] = None,
+                 base_url: Optional[str] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 metrics: Optional[MetricsRegistry] = None):
+        """
+        初始化异步API客户端
+        
+        Args:
+            timeout: 默认的单次请求截止时间（秒）
+            max_concurrency: 同时在途的最大请求数
+            connection_limit: 连接池最大连接数
+            keepalive_timeout: 空闲连接保持时间（秒）
+            rate_limiter: 限流器，默认与iTunesAPI共用进程内共享的限流器
+            retry_policy: 限流和临时错误的重试策略
+            json_backend: JSON解码后端，默认自动选择最快的可用后端
+            base_url: API服务器地址，默认读取环境变量 ITUNES_API_BASE_URL，否则为官方地址
+            circuit_breaker: 按店面区分的熔断器，默认与iTunesAPI共用进程内共享的熔断器
+            metrics: 指标注册表，默认与iTunesAPI共用进程内共享的注册表
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncITunesAPI 需要安装 aiohttp: pip install aiohttp")
+        
+        self.BASE_URL = (base_url or os.environ.get(BASE_URL_ENV_VAR) or self.BASE_URL).rstrip('/')
+        self.timeout = timeout
+        self.max_concurrency = max_concurrency
+        self.connection_limit = connection_limit
+        self.keepalive_timeout = keepalive_timeout
+        self.rate_limiter = rate_limiter or get_default_rate_limiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or get_default_circuit_breaker()
+        self.metrics = metrics or get_default_metrics()
+        self.retry_count = 0
+        self.json_backend = json_backend or get_backend()
+        # 合并相同参数的并发请求（合并键为 (接口, 缓存键)，合并次数计入指标）
+        self.single_flight = AsyncSingleFlight(on_coalesced=lambda key: self.metrics.record_coalesced(key[0]))
+        self.headers = {
+            'User-Agent': 'AppleAppBundleFinder/1.0.0'
+        }
+        # 会话与信号量需在事件循环内创建，首次请求时初始化
+        self._session = None
+        self._semaphore = None
+    
+    async def __aenter__(self) -> 'AsyncITunesAPI':
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def close(self):
+        """关闭底层连接池"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._semaphore = None
+    
+    def _get_session(self) -> 'aiohttp.ClientSession':
+        """获取（必要时创建）复用连接的会话"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.connection_limit,
+                keepalive_timeout=self.keepalive_timeout
+            )
+            self._session = aiohttp.ClientSession(connector=connector, headers=self.headers)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+    
+    async def _get_json(self, endpoint: str, params: Dict[str, str],
+                        timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        发送GET请求并解析JSON响应，相同参数的并发请求合并为一次网络调用
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+            timeout: 本次请求的截止时间（秒），默认使用客户端设置
+        
+        Returns:
+            解析后的响应数据
+        """
+        key = (endpoint, ResponseCache.make_key(endpoint, params))
+        return await self.single_flight.do(key, lambda: self._fetch_guarded(endpoint, params, timeout))
+    
+    async def _fetch_guarded(self, endpoint: str, params: Dict[str, str],
+                             timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        经过熔断器发送请求，规则与iTunesAPI._send_guarded一致
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+            timeout: 本次请求的截止时间（秒），默认使用客户端设置
+        
+        Returns:
+            解析后的响应数据
+        
+        Raises:
+            CircuitOpenError: 该店面接口的熔断器处于打开状态
+        """
+        country = params.get('country', '')
+        breaker = self.circuit_breaker
+        breaker.before_request(endpoint, country)
+        try:
+            data = await self._fetch_json(endpoint, params, timeout)
+        except DeadlineExceededError as e:
+            # 截止时间耗尽于传输失败后的重试等待时计为失败，耗尽于限流等待时不计入
+            if self._is_transport_failure(e.__cause__):
+                breaker.record_failure(endpoint, country)
+            else:
+                breaker.release(endpoint, country)
+            raise
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError):
+            breaker.record_failure(endpoint, country)
+            raise
+        except aiohttp.ClientResponseError as e:
+            if e.status >= 500:
+                breaker.record_failure(endpoint, country)
+            else:
+                breaker.record_success(endpoint, country)
+            raise
+        except BaseException:
+            breaker.release(endpoint, country)
+            raise
+        breaker.record_success(endpoint, country)
+        return data
+    
+    @staticmethod
+    def _is_transport_failure(error: Optional[BaseException]) -> bool:
+        """是否为应计入熔断器的传输失败（连接错误、超时或5xx）"""
+        if isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+            return True
+        return isinstance(error, aiohttp.ClientResponseError) and error.status >= 500
+    
+    async def _fetch_json(self, endpoint: str, params: Dict[str, str],
+                          timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        发送GET请求并解析JSON响应（含限流与重试）
+        
+        截止时间覆盖限流等待、并发槽位等待、每次尝试和重试退避，与iTunesAPI的deadline一致。
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+            timeout: 本次请求的截止时间（秒），默认使用客户端设置
+        
+        Returns:
+            解析后的响应数据
+        
+        Raises:
+            DeadlineExceededError: 截止时间在成功前用完
+        """
+        session = self._get_session()
+        deadline = Deadline(timeout or self.timeout)
+        policy = self.retry_policy
+        attempt = 0
+        
+        while True:
+            wait = self.rate_limiter.reserve()
+            if wait > 0:
+                deadline.check_sleep(wait)
+                await asyncio.sleep(wait)
+            
+            try:
+                # 等待并发槽位同样计入截止时间
+                await asyncio.wait_for(self._semaphore.acquire(), deadline.timeout(self.timeout))
+            except asyncio.TimeoutError:
+                raise DeadlineExceededError(deadline.budget) from None
+            
+            retry_after = None
+            cause = None
+            started = time.perf_counter()
+            try:
+                async with session.get(
+                    f"{self.BASE_URL}{endpoint}",
+                    params=params,
+                    timeout=aiohttp.ClientTimeout(total=deadline.timeout(self.timeout))
+                ) as response:
+                    if response.status in THROTTLE_STATUS_CODES:
+                        self.metrics.record_request(endpoint, response.status, time.perf_counter() - started)
+                        retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                        self.rate_limiter.on_throttle(retry_after)
+                        if attempt >= policy.max_retries:
+                            raise ThrottledError(response.status, retry_after)
+                        reason = 'throttled'
+                    elif response.status in RETRYABLE_STATUS_CODES and attempt < policy.max_retries:
+                        self.metrics.record_request(endpoint, response.status, time.perf_counter() - started)
+                        reason = 'server_error'
+                        cause = aiohttp.ClientResponseError(
+                            response.request_info, response.history, status=response.status, message=response.reason
+                        )
+                    else:
+                        # iTunes接口返回text/javascript，直接读取字节交给解码后端
+                        content = await response.read() if response.status < 400 else b''
+                        self.metrics.record_request(
+                            endpoint, response.status, time.perf_counter() - started, len(content)
+                        )
+                        response.raise_for_status()
+                        self.rate_limiter.on_success()
+                        return self.json_backend.loads(content)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                self.metrics.record_request(endpoint, None, time.perf_counter() - started)
+                if deadline.expired():
+                    raise DeadlineExceededError(deadline.budget) from e
+                if attempt >= policy.max_retries:
+                    raise
+                reason = 'connection'
+                cause = e
+            finally:
+                self._semaphore.release()
+            
+            self.metrics.record_retry(endpoint, reason)
+            delay = policy.delay(attempt, retry_after)
+            try:
+                deadline.check_sleep(delay)
+            except DeadlineExceededError as e:
+                # 传输失败后的退避超出预算时保留原因，供熔断器区分（限流等待时为None）
+                raise e from cause
+            self.retry_count += 1
+            await asyncio.sleep(delay)
+            attempt += 1
+    
+    async def lookup_by_id(self, app_id: str, country: str = "cn",
+                           timeout: Optional[float] = None) -> Optional[AppInfo]:
+        """
+        根据应用ID查询应用信息
+        
+        Args:
+            app_id: 应用ID（可以是trackId或bundleId）
+            country: 国家代码，默认为中国(cn)
+            timeout: 本次请求的截止时间（秒）
+        
+        Returns:
+            AppInfo对象或None（如果查询失败）
+        
+        Raises:
+            ThrottledError: 重试后仍被限流
+            CircuitOpenError: 该店面接口熔断中
+            DeadlineExceededError: 超出截止时间
+        """
+        try:
+            params = build_lookup_params(app_id, country)
+            data = await self._get_json(self.LOOKUP_ENDPOINT, params, timeout)
+            
+            if data.get('resultCount', 0) > 0:
+                return AppInfo.from_api_response(data['results'][0])
+            else:
+                return None
+        
+        except iTunesAPIError:
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"API请求错误: {e!r}")
+            return None
+        except Exception as e:
+            print(f"数据解析错误: {e}")
+            return None
+    
+    async def lookup_json(self, app_id: str, country: str = "cn",
+                          timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        根据应用ID查询，返回原始响应数据
+        
+        与 lookup_by_id 不同，请求和解析错误都会向上抛出，
+        便于调用方区分"该店面未上架"（resultCount为0）和"请求失败"。
+        
+        Args:
+            app_id: 应用ID（可以是trackId或bundleId）
+            country: 国家代码，默认为中国(cn)
+            timeout: 本次请求的截止时间（秒）
+        
+        Returns:
+            原始API响应数据
+        
+        Raises:
+            ThrottledError: 重试后仍被限流
+            CircuitOpenError: 该店面接口熔断中
+            DeadlineExceededError: 超出截止时间
+            aiohttp.ClientError: 请求失败
+        """
+        return await self._get_json(self.LOOKUP_ENDPOINT, build_lookup_params(app_id, country), timeout)
+    
+    async def search_apps(self, term: str, country: str = "cn", limit: int = 10,
+                          timeout: Optional[float] = None) -> List[AppInfo]:
+        """
+        搜索应用
+        
+        Args:
+            term: 搜索关键词
+            country: 国家代码，默认为中国(cn)
+            limit: 返回结果数量限制
+            timeout: 本次请求的截止时间（秒）
+        
+        Returns:
+            AppInfo对象列表
+        
+        Raises:
+            ThrottledError: 重试后仍被限流
+            CircuitOpenError: 该店面接口熔断中
+            DeadlineExceededError: 超出截止时间
+        """
+        try:
+            params = build_search_params(term, country, limit)
+            data = await self._get_json(self.SEARCH_ENDPOINT, params, timeout)
+            
+            return AppInfo.from_api_batch(data.get('results', []))
+        
+        except iTunesAPIError:
+            raise
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"API请求错误: {e!r}")
+            return []
+        except Exception as e:
+            print(f"数据解析错误: {e}")
+            return []
+    
+    async def get_app_details(self, app_id: str, country: str = "cn",
+                              timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        获取应用的原始详细信息（用于调试）
+        
+        Args:
+            app_id: 应用ID
+            country: 国家代码
+            timeout: 本次请求的截止时间（秒）
+        
+        Returns:
+            原始API响应数据
+        
+        Raises:
+            ThrottledError: 重试后仍被限流
+            CircuitOpenError: 该店面接口熔断中
+            DeadlineExceededError: 超出截止时间
+        """
+        try:
+            params = build_lookup_params(app_id, country)
+            return await self._get_json(self.LOOKUP_ENDPOINT, params, timeout)
+        
+        except iTunesAPIError:
+            raise
+        except Exception as e:
+            print(f"获取详细信息错误: {e!r}")
+            return {}
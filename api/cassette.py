@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+请求录制与回放模块
+将请求参数和响应体录制到压缩的带索引录制文件（cassette），并可按原始耗时、缩放耗时或零延迟回放，
+使性能测试不受网络波动影响
+
+录制文件为ZIP格式：index.json 保存每条记录的请求键、状态码、耗时和响应体位置，
+响应体按记录分别压缩保存，回放时按需读取
+"""
+
+import json
+import threading
+import time
+import zipfile
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from api.exceptions import CassetteMissError
+from api.response_cache import ResponseCache
+
+
+CASSETTE_VERSION = 1
+
+
+@dataclass
+class Exchange:
+    """一次录制的请求/响应"""
+    
+    key: str
+    endpoint: str
+    params: Dict[str, str]
+    status_code: int
+    # 录制时的总耗时（秒）
+    elapsed: float
+    body_name: str
+    content: Optional[bytes] = None
+
+
+class Cassette:
+    """录制文件类"""
+    
+    RECORD = 'record'
+    REPLAY = 'replay'
+    
+    def __init__(self, path: str, mode: str = REPLAY, time_scale: float = 1.0):
+        """
+        打开录制文件
+        
+        Args:
+            path: 录制文件路径
+            mode: RECORD（录制，关闭时写入文件）或 REPLAY（回放）
+            time_scale: 回放耗时缩放系数，1.0为原始耗时，0为零延迟
+        """
+        if mode not in (self.RECORD, self.REPLAY):
+            raise ValueError(f"不支持的录制模式: {mode}")
+        
+        self.path = path
+        self.mode = mode
+        self.time_scale = time_scale
+        self.misses = 0
+        
+        self._lock = threading.Lock()
+        self._exchanges: List[Exchange] = []
+        self._index: Dict[str, List[Exchange]] = {}
+        self._cursor: Dict[str, int] = {}
+        self._zip = None
+        
+        if mode == self.REPLAY:
+            self._load()
+    
+    def __enter__(self) -> 'Cassette':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+    
+    def __len__(self) -> int:
+        return len(self._exchanges)
+    
+    @property
+    def recording(self) -> bool:
+        """是否处于录制模式"""
+        return self.mode == self.RECORD
+    
+    @property
+    def replaying(self) -> bool:
+        """是否处于回放模式"""
+        return self.mode == self.REPLAY
+    
+    def record(self, endpoint: str, params: Dict[str, str], status_code: int,
+               content: bytes, elapsed: float):
+        """
+        录制一次请求/响应
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+            status_code: HTTP状态码
+            content: 原始响应体
+            elapsed: 请求耗时（秒）
+        """
+        with self._lock:
+            exchange = Exchange(
+                key=ResponseCache.make_key(endpoint, params),
+                endpoint=endpoint,
+                params=dict(params),
+                status_code=status_code,
+                elapsed=elapsed,
+                body_name=f"bodies/{len(self._exchanges):08d}.json",
+                content=content
+            )
+            self._exchanges.append(exchange)
+    
+    def play(self, endpoint: str, params: Dict[str, str]) -> Exchange:
+        """
+        回放一次请求：按录制顺序轮流返回同一请求的多条记录，并按缩放后的原始耗时等待
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+            
+        Returns:
+            含响应体的Exchange对象
+            
+        Raises:
+            CassetteMissError: 没有匹配的录制记录
+        """
+        key = ResponseCache.make_key(endpoint, params)
+        with self._lock:
+            candidates = self._index.get(key)
+            if not candidates:
+                self.misses += 1
+                raise CassetteMissError(endpoint, params)
+            
+            position = self._cursor.get(key, 0)
+            self._cursor[key] = (position + 1) % len(candidates)
+            exchange = candidates[position]
+            if exchange.content is None:
+                exchange.content = self._zip.read(exchange.body_name)
+        
+        if self.time_scale > 0:
+            time.sleep(exchange.elapsed * self.time_scale)
+        return exchange
+    
+    def save(self):
+        """将录制内容写入文件"""
+        with self._lock:
+            index = {
+                'version': CASSETTE_VERSION,
+                'exchanges': [
+                    {
+                        'key': exchange.key,
+                        'endpoint': exchange.endpoint,
+                        'params': exchange.params,
+                        'status_code': exchange.status_code,
+                        'elapsed': exchange.elapsed,
+                        'body': exchange.body_name,
+                    }
+                    for exchange in self._exchanges
+                ]
+            }
+            with zipfile.ZipFile(self.path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr('index.json', json.dumps(index, ensure_ascii=False))
+                for exchange in self._exchanges:
+                    archive.writestr(exchange.body_name, exchange.content)
+    
+    def close(self):
+        """关闭录制文件（录制模式下先写入文件）"""
+        if self.recording:
+            self.save()
+        elif self._zip is not None:
+            self._zip.close()
+            self._zip = None
+    
+    def _load(self):
+        """读取索引，响应体在回放时按需解压"""
+        self._zip = zipfile.ZipFile(self.path, 'r')
+        index = json.loads(self._zip.read('index.json'))
+        if index.get('version') != CASSETTE_VERSION:
+            raise ValueError(f"不支持的录制文件版本: {index.get('version')}")
+        
+        for item in index['exchanges']:
+            exchange = Exchange(
+                key=item['key'],
+                endpoint=item['endpoint'],
+                params=item['params'],
+                status_code=item['status_code'],
+                elapsed=item['elapsed'],
+                body_name=item['body']
+            )
+            self._exchanges.append(exchange)
+            self._index.setdefault(exchange.key, []).append(exchange)
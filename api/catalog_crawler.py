@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+开发者目录抓取模块
+通过 /lookup?id=<artistId>&entity=software 分页并发抓取开发者的全部应用，
+结果逐个写入本地应用库并记录进度，中断后可续抓而无需重新请求已完成的开发者
+
+用法: python -m api.catalog_crawler --country us --artist 284882218 [--from-apps 414478124,...]
+"""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass
+from typing import Optional, List, Iterable, Callable
+
+from api.client_registry import get_client
+from api.itunes_api import iTunesAPI
+from api.local_store import LocalAppStore
+
+
+@dataclass
+class CrawlStats:
+    """一次抓取的统计"""
+    
+    artists: int = 0
+    skipped: int = 0
+    fetched: int = 0
+    failed: int = 0
+    apps: int = 0
+    elapsed: float = 0.0
+
+
+class CatalogCrawler:
+    """开发者目录抓取类"""
+    
+    def __init__(self, api: Optional[iTunesAPI] = None, store: Optional[LocalAppStore] = None,
+                 workers: int = 8):
+        """
+        初始化抓取器
+        
+        Args:
+            api: iTunes API客户端，默认使用进程内共享的客户端（共用限流器、熔断器和缓存）
+            store: 本地应用库，默认打开默认路径的应用库
+            workers: 并发请求数（不应超过客户端连接池大小）
+        """
+        self.api = api or get_client()
+        self.store = store or LocalAppStore()
+        self.workers = workers
+    
+    def artist_ids_for_apps(self, app_ids: Iterable[str], country: str = "us") -> List[str]:
+        """
+        查询应用并取出其开发者ID（去重，保持输入顺序）
+        
+        Args:
+            app_ids: 应用ID列表（trackId或bundleId）
+            country: 国家代码
+        
+        Returns:
+            开发者ID列表
+        """
+        apps = self.api.lookup_many(list(app_ids), country)
+        artist_ids = (str(app.artist_id) for app in apps.values() if app is not None and app.artist_id)
+        return list(dict.fromkeys(artist_ids))
+    
+    def crawl(self, artist_ids: Iterable[str], country: str = "us", resume: bool = True,
+              progress_callback: Optional[Callable[[str, int, Optional[str]], None]] = None) -> CrawlStats:
+        """
+        并发抓取开发者的全部应用并写入本地应用库
+        
+        每个开发者的应用在请求完成后立即写入并标记进度；失败的开发者会被记录，续抓时重试。
+        
+        Args:
+            artist_ids: 开发者ID列表
+            country: 国家代码
+            resume: 是否跳过此前已完成的开发者
+            progress_callback: 每个开发者完成时的回调 (开发者ID, 应用数量, 错误信息)
+        
+        Returns:
+            CrawlStats统计
+        """
+        started = time.perf_counter()
+        stats = CrawlStats()
+        artist_ids = list(dict.fromkeys(str(artist_id) for artist_id in artist_ids))
+        stats.artists = len(artist_ids)
+        
+        done = self.store.crawled_artists(country) if resume else set()
+        pending = [artist_id for artist_id in artist_ids if artist_id not in done]
+        stats.skipped = stats.artists - len(pending)
+        
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            # 只保持有限个在途请求，数千个开发者时也不会一次性提交全部任务
+            in_flight = {}
+            for artist_id in pending:
+                in_flight[pool.submit(self._fetch_artist, artist_id, country)] = artist_id
+                if len(in_flight) >= self.workers * 2:
+                    self._drain(in_flight, country, stats, progress_callback, wait_all=False)
+            self._drain(in_flight, country, stats, progress_callback, wait_all=True)
+        
+        stats.elapsed = time.perf_counter() - started
+        return stats
+    
+    def _fetch_artist(self, artist_id: str, country: str) -> List[dict]:
+        """分页请求单个开发者的全部应用（错误向上抛出，由调用方记录）"""
+        # 结果写入本地应用库，不再占用共享客户端的响应缓存
+        return self.api.lookup_artist_records(artist_id, country, use_cache=False)
+    
+    def _drain(self, in_flight: dict, country: str, stats: CrawlStats,
+               progress_callback: Optional[Callable[[str, int, Optional[str]], None]], wait_all: bool):
+        """在当前线程中写入已完成的结果（SQLite写入集中在一个线程）"""
+        while in_flight:
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                artist_id = in_flight.pop(future)
+                try:
+                    records = future.result()
+                except Exception as e:
+                    stats.failed += 1
+                    self.store.mark_failed(artist_id, country, repr(e))
+                    if progress_callback:
+                        progress_callback(artist_id, 0, repr(e))
+                    continue
+                
+                count = self.store.put_records(records, country)
+                self.store.mark_crawled(artist_id, country, count)
+                stats.fetched += 1
+                stats.apps += count
+                if progress_callback:
+                    progress_callback(artist_id, count, None)
+            if not wait_all:
+                return
+
+
+def main():
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='抓取开发者的全部应用到本地应用库')
+    parser.add_argument('--country', default='us')
+    parser.add_argument('--artist', action='append', default=[], help='开发者ID，可多次指定或用逗号分隔')
+    parser.add_argument('--from-apps', default='', help='从这些应用（逗号分隔）取出开发者ID')
+    parser.add_argument('--store', help='本地应用库路径，默认为用户目录下的 apps.sqlite3')
+    parser.add_argument('--workers', type=int, default=8)
+    parser.add_argument('--restart', action='store_true', help='忽略已有进度，重新抓取全部开发者')
+    args = parser.parse_args()
+    
+    store = LocalAppStore(args.store) if args.store else LocalAppStore()
+    crawler = CatalogCrawler(store=store, workers=args.workers)
+    
+    artist_ids = [value.strip() for item in args.artist for value in item.split(',') if value.strip()]
+    app_ids = [value.strip() for value in args.from_apps.split(',') if value.strip()]
+    if app_ids:
+        artist_ids.extend(crawler.artist_ids_for_apps(app_ids, args.country))
+    if not artist_ids:
+        parser.error('请通过 --artist 或 --from-apps 指定开发者')
+    
+    def on_progress(artist_id: str, count: int, error: Optional[str]):
+        print(f"{artist_id}: {error}" if error else f"{artist_id}: {count} 个应用")
+    
+    stats = crawler.crawl(artist_ids, args.country, resume=not args.restart, progress_callback=on_progress)
+    print(f"完成: {stats.fetched} 个开发者, {stats.apps} 个应用, 跳过 {stats.skipped}, "
+          f"失败 {stats.failed}, 用时 {stats.elapsed:.1f} 秒")
+    store.close()
+
+
+if __name__ == '__main__':
+    main()
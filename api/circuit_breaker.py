@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+熔断器模块
+按 (接口, 国家代码) 统计近期请求的失败率，在关闭、打开、半开三种状态间切换：
+打开时快速失败，冷却后进入半开状态放行少量探测请求，探测成功则恢复
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from api.exceptions import CircuitOpenError
+
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+@dataclass
+class CircuitSnapshot:
+    """单个熔断器的状态快照"""
+    
+    endpoint: str
+    country: str
+    state: str
+    failure_rate: float
+    requests: int
+    # 打开状态下距离允许探测的剩余秒数
+    retry_in: float = 0.0
+
+
+class _Circuit:
+    """单个 (接口, 国家代码) 的熔断状态"""
+    
+    def __init__(self, window: int):
+        self.state = CLOSED
+        self.outcomes = deque(maxlen=window)
+        self.opened_at = 0.0
+        self.probes_in_flight = 0
+        self.probe_successes = 0
+    
+    def failure_rate(self) -> float:
+        if not self.outcomes:
+            return 0.0
+        return self.outcomes.count(False) / len(self.outcomes)
+
+
+class CircuitBreaker:
+    """按店面区分的熔断器（线程安全，同步和异步客户端均可使用）"""
+    
+    def __init__(self, failure_threshold: float = 0.5, min_requests: int = 10, window: int = 20,
+                 open_duration: float = 30.0, half_open_max_calls: int = 1, recovery_successes: int = 2):
+        """
+        Args:
+            failure_threshold: 触发熔断的失败率
+            min_requests: 计算失败率前窗口内至少需要的请求数
+            window: 统计失败率的最近请求数
+            open_duration: 打开状态持续时间（秒），之后进入半开状态
+            half_open_max_calls: 半开状态下同时放行的探测请求数
+            recovery_successes: 半开状态下恢复为关闭所需的连续成功次数
+        """
+        self.failure_threshold = failure_threshold
+        self.min_requests = min_requests
+        self.window = window
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        self.recovery_successes = recovery_successes
+        
+        self._lock = threading.Lock()
+        self._circuits: Dict[Tuple[str, str], _Circuit] = {}
+    
+    def _circuit(self, endpoint: str, country: str) -> _Circuit:
+        """获取（必要时创建）熔断状态（调用方需持有锁）"""
+        key = (endpoint, country.lower())
+        circuit = self._circuits.get(key)
+        if circuit is None:
+            circuit = self._circuits[key] = _Circuit(self.window)
+        return circuit
+    
+    def before_request(self, endpoint: str, country: str):
+        """
+        请求前检查，打开状态下快速失败
+        
+        Args:
+            endpoint: 接口路径
+            country: 国家代码
+        
+        Raises:
+            CircuitOpenError: 熔断器打开，或半开状态下探测名额已满
+        """
+        with self._lock:
+            circuit = self._circuit(endpoint, country)
+            now = time.monotonic()
+            
+            if circuit.state == OPEN:
+                retry_in = circuit.opened_at + self.open_duration - now
+                if retry_in > 0:
+                    raise CircuitOpenError(endpoint, country, retry_in)
+                circuit.state = HALF_OPEN
+                circuit.probes_in_flight = 0
+                circuit.probe_successes = 0
+            
+            if circuit.state == HALF_OPEN:
+                if circuit.probes_in_flight >= self.half_open_max_calls:
+                    raise CircuitOpenError(endpoint, country, 0)
+                circuit.probes_in_flight += 1
+    
+    def record_success(self, endpoint: str, country: str):
+        """记录一次成功请求"""
+        with self._lock:
+            circuit = self._circuit(endpoint, country)
+            circuit.outcomes.append(True)
+            if circuit.state == HALF_OPEN:
+                circuit.probes_in_flight = max(0, circuit.probes_in_flight - 1)
+                circuit.probe_successes += 1
+                if circuit.probe_successes >= self.recovery_successes:
+                    circuit.state = CLOSED
+                    circuit.outcomes.clear()
+    
+    def record_failure(self, endpoint: str, country: str):
+        """记录一次失败请求（超时、连接错误或5xx）"""
+        with self._lock:
+            circuit = self._circuit(endpoint, country)
+            circuit.outcomes.append(False)
+            if circuit.state == HALF_OPEN:
+                self._open_locked(circuit)
+            elif (circuit.state == CLOSED and len(circuit.outcomes) >= self.min_requests
+                    and circuit.failure_rate() >= self.failure_threshold):
+                self._open_locked(circuit)
+    
+    def release(self, endpoint: str, country: str):
+        """释放半开状态的探测名额（请求结果既非成功也非店面故障，例如被限流）"""
+        with self._lock:
+            circuit = self._circuit(endpoint, country)
+            if circuit.state == HALF_OPEN:
+                circuit.probes_in_flight = max(0, circuit.probes_in_flight - 1)
+    
+    def _open_locked(self, circuit: _Circuit):
+        """切换为打开状态（调用方需持有锁）"""
+        circuit.state = OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.probes_in_flight = 0
+    
+    def state(self, endpoint: str, country: str) -> str:
+        """获取某个店面接口的当前状态"""
+        with self._lock:
+            return self._circuit(endpoint, country).state
+    
+    def snapshot(self) -> List[CircuitSnapshot]:
+        """
+        获取全部熔断器的状态快照
+        
+        Returns:
+            CircuitSnapshot列表
+        """
+        now = time.monotonic()
+        with self._lock:
+            return [
+                CircuitSnapshot(
+                    endpoint=endpoint,
+                    country=country,
+                    state=circuit.state,
+                    failure_rate=circuit.failure_rate(),
+                    requests=len(circuit.outcomes),
+                    retry_in=max(0.0, circuit.opened_at + self.open_duration - now) if circuit.state == OPEN else 0.0
+                )
+                for (endpoint, country), circuit in self._circuits.items()
+            ]
+    
+    def degraded_storefronts(self, endpoint: Optional[str] = None) -> List[str]:
+        """
+        获取当前处于打开或半开状态的国家代码
+        
+        Args:
+            endpoint: 只统计指定接口，默认统计全部接口
+        
+        Returns:
+            国家代码列表
+        """
+        return sorted({
+            item.country for item in self.snapshot()
+            if item.state != CLOSED and (endpoint is None or item.endpoint == endpoint)
+        })
+
+
+_default_circuit_breaker = None
+_default_circuit_breaker_lock = threading.Lock()
+
+
+def get_default_circuit_breaker() -> CircuitBreaker:
+    """
+    获取进程内共享的默认熔断器，所有未指定熔断器的客户端共用
+    
+    Returns:
+        CircuitBreaker实例
+    """
+    global _default_circuit_breaker
+    with _default_circuit_breaker_lock:
+        if _default_circuit_breaker is None:
+            _default_circuit_breaker = CircuitBreaker()
+        return _default_circuit_breaker
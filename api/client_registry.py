@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+客户端注册模块
+提供进程内共享的iTunesAPI客户端，GUI、批处理工具和服务模式共用同一个连接池
+"""
+
+import atexit
+import os
+import threading
+from typing import Optional
+
+from api.app_info_cache import get_default_app_cache
+from api.cassette import Cassette
+from api.hedging import HedgePolicy
+from api.itunes_api import iTunesAPI, BASE_URL_ENV_VAR
+from api.response_cache import ResponseCache, get_default_cache
+
+
+# 录制/回放：设置录制文件路径和模式（record / replay）即可对GUI流量录制或回放
+CASSETTE_ENV_VAR = 'APP_FINDER_CASSETTE'
+CASSETTE_MODE_ENV_VAR = 'APP_FINDER_CASSETTE_MODE'
+CASSETTE_SCALE_ENV_VAR = 'APP_FINDER_CASSETTE_TIME_SCALE'
+
+# 共享客户端的连接池大小（GUI搜索、后台任务与批处理并发线程数之和）
+DEFAULT_POOL_SIZE = 32
+
+_client: Optional[iTunesAPI] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> iTunesAPI:
+    """
+    获取进程内共享的iTunesAPI客户端（线程安全，首次调用时创建）
+    
+    Returns:
+        使用默认响应缓存、内存缓存和共享限流器的iTunesAPI实例
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            # 指向其他服务器（如本地模拟服务器）或录制/回放时使用内存缓存：
+            # 持久化缓存命中的请求不会被录制，回放的数据也不应写入用户的缓存
+            cassette = _cassette_from_env()
+            if os.environ.get(BASE_URL_ENV_VAR) or cassette is not None:
+                cache = ResponseCache(':memory:')
+            else:
+                cache = get_default_cache()
+            _client = iTunesAPI(
+                cache=cache,
+                app_cache=get_default_app_cache(),
+                pool_size=DEFAULT_POOL_SIZE,
+                cassette=cassette,
+                # 交互查询对尾延迟敏感，慢请求在p95延迟后发出对冲请求
+                hedge=HedgePolicy()
+            )
+        return _client
+
+
+def _cassette_from_env() -> Optional[Cassette]:
+    """根据环境变量打开录制文件，录制模式下在进程退出时写入"""
+    path = os.environ.get(CASSETTE_ENV_VAR)
+    if not path:
+        return None
+    
+    cassette = Cassette(
+        path,
+        mode=os.environ.get(CASSETTE_MODE_ENV_VAR, Cassette.REPLAY),
+        time_scale=float(os.environ.get(CASSETTE_SCALE_ENV_VAR, '1.0'))
+    )
+    atexit.register(cassette.close)
+    return cassette
+
+
+def preconnect(background: bool = True):
+    """
+    预先建立共享客户端到API服务器的连接
+    
+    Args:
+        background: 是否在后台线程中执行（启动时不阻塞界面）
+    """
+    if background:
+        threading.Thread(target=lambda: get_client().preconnect(), daemon=True).start()
+    else:
+        get_client().preconnect()
+
+
+def reset_client():
+    """关闭并丢弃共享客户端，下次调用get_client时重新创建"""
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.session.close()
+        _client = None
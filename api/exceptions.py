@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+API异常模块
+定义iTunes API客户端需要显式上报给调用方的错误类型
+"""
+
+import math
+from typing import Optional
+
+
+class iTunesAPIError(Exception):
+    """iTunes API错误基类"""
+
+
+class ThrottledError(iTunesAPIError):
+    """请求被iTunes接口限流（HTTP 403/429），重试后仍未恢复"""
+    
+    def __init__(self, status_code: int, retry_after: Optional[float] = None):
+        self.status_code = status_code
+        self.retry_after = retry_after
+        message = f"请求被限流（HTTP {status_code}）"
+        if retry_after:
+            message += f"，建议 {retry_after:.0f} 秒后重试"
+        super().__init__(message)
+
+
+class CassetteMissError(iTunesAPIError):
+    """回放模式下，录制文件中没有与请求匹配的记录"""
+    
+    def __init__(self, endpoint: str, params: dict):
+        self.endpoint = endpoint
+        self.params = params
+        super().__init__(f"录制文件中没有匹配的请求: {endpoint} {params}")
+
+
+class DeadlineExceededError(iTunesAPIError):
+    """调用的总时间预算（含重试和退避）已用完"""
+    
+    def __init__(self, budget: float):
+        self.budget = budget
+        super().__init__(f"请求超出时间预算（{budget:.1f} 秒）")
+
+
+class CircuitOpenError(iTunesAPIError):
+    """店面接口的熔断器处于打开状态，请求被快速拒绝"""
+    
+    def __init__(self, endpoint: str, country: str, retry_in: float):
+        self.endpoint = endpoint
+        self.country = country
+        self.retry_in = retry_in
+        super().__init__(f"店面 {country} 的 {endpoint} 接口暂时不可用（熔断中），约 {max(1, math.ceil(retry_in))} 秒后重试")
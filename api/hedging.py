@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+截止时间与对冲请求模块
+Deadline 表示一次调用跨重试的总时间预算；HedgePolicy 按接口和请求规模分别根据近期延迟的p95决定何时发出对冲请求
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Optional, Dict, Hashable, Tuple
+
+from api.exceptions import DeadlineExceededError
+
+
+class Deadline:
+    """一次调用的总时间预算"""
+    
+    def __init__(self, budget: float):
+        """
+        Args:
+            budget: 总时间预算（秒）
+        """
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+    
+    def remaining(self) -> float:
+        """剩余时间（秒），不小于0"""
+        return max(0.0, self.expires_at - time.monotonic())
+    
+    def expired(self) -> bool:
+        """预算是否已用完"""
+        return self.remaining() <= 0
+    
+    def timeout(self, default: float) -> float:
+        """
+        计算单次请求可用的超时时间
+        
+        Args:
+            default: 客户端默认超时（秒）
+        
+        Returns:
+            默认超时与剩余预算中的较小值
+        
+        Raises:
+            DeadlineExceededError: 预算已用完
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededError(self.budget)
+        return min(default, remaining)
+    
+    def check_sleep(self, seconds: float):
+        """
+        确认等待指定时长后仍在预算内
+        
+        Raises:
+            DeadlineExceededError: 等待后将超出预算
+        """
+        if seconds >= self.remaining():
+            raise DeadlineExceededError(self.budget)
+
+
+class LatencyTracker:
+    """记录近期请求延迟并计算分位数（线程安全）"""
+    
+    def __init__(self, window: int = 200):
+        """
+        Args:
+            window: 保留的最近样本数
+        """
+        self._lock = threading.Lock()
+        self._samples = deque(maxlen=window)
+    
+    def __len__(self) -> int:
+        return len(self._samples)
+    
+    def record(self, latency: float):
+        """记录一次成功请求的延迟（秒）"""
+        with self._lock:
+            self._samples.append(latency)
+    
+    def percentile(self, pct: float) -> Optional[float]:
+        """
+        计算分位数
+        
+        Args:
+            pct: 百分位（0-100）
+        
+        Returns:
+            分位延迟（秒），无样本时为None
+        """
+        with self._lock:
+            if not self._samples:
+                return None
+            ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, int(pct / 100 * len(ordered)))
+        return ordered[index]
+
+
+@dataclass
+class HedgeStats:
+    """对冲请求统计"""
+    
+    requests: int = 0
+    hedges_sent: int = 0
+    hedges_won: int = 0
+    
+    @property
+    def hedge_win_ratio(self) -> float:
+        """已发出的对冲请求中先于原请求返回的比例"""
+        return self.hedges_won / self.hedges_sent if self.hedges_sent else 0.0
+
+
+# 预期结果数超过该值的请求（批量查询、开发者分页、大页搜索）单独统计延迟
+BULK_RESULT_THRESHOLD = 10
+
+
+def latency_key(endpoint: str, params: Dict[str, str]) -> Tuple[str, str]:
+    """
+    按接口和请求规模划分延迟统计，避免大响应拉高交互查询的对冲延迟
+    
+    Args:
+        endpoint: 接口路径
+        params: 请求参数
+    
+    Returns:
+        (接口路径, 'single' 或 'bulk') 元组
+    """
+    if 'limit' in params:
+        expected = int(params['limit'])
+    else:
+        expected = len((params.get('id') or params.get('bundleId') or '').split(','))
+    return endpoint, 'bulk' if expected > BULK_RESULT_THRESHOLD else 'single'
+
+
+class HedgePolicy:
+    """
+    对冲请求策略：原请求超过近期p95延迟仍未返回时，再发出一个相同请求，取先返回者
+    
+    延迟按 latency_key 分别统计，每类请求使用自己的p95。
+    """
+    
+    def __init__(self, percentile: float = 95, min_delay: float = 0.05, max_delay: float = 2.0,
+                 default_delay: float = 0.5, min_samples: int = 20, window: int = 200):
+        """
+        Args:
+            percentile: 用于计算对冲延迟的分位
+            min_delay: 对冲延迟下限（秒）
+            max_delay: 对冲延迟上限（秒）
+            default_delay: 样本不足时使用的对冲延迟（秒）
+            min_samples: 使用分位数前至少需要的样本数
+            window: 每类请求的延迟样本窗口大小
+        """
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.default_delay = default_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.stats = HedgeStats()
+        self._lock = threading.Lock()
+        self._trackers: Dict[Hashable, LatencyTracker] = {}
+    
+    def tracker(self, key: Hashable) -> LatencyTracker:
+        """
+        获取（必要时创建）某类请求的延迟记录
+        
+        Args:
+            key: 请求分类，通常为 latency_key 的返回值
+        
+        Returns:
+            LatencyTracker实例
+        """
+        with self._lock:
+            tracker = self._trackers.get(key)
+            if tracker is None:
+                tracker = self._trackers[key] = LatencyTracker(self.window)
+            return tracker
+    
+    def record(self, key: Hashable, latency: float):
+        """记录某类请求一次成功请求的延迟（秒）"""
+        self.tracker(key).record(latency)
+    
+    def delay(self, key: Hashable) -> float:
+        """某类请求当前的对冲延迟（秒）"""
+        tracker = self.tracker(key)
+        if len(tracker) < self.min_samples:
+            return self.default_delay
+        return min(self.max_delay, max(self.min_delay, tracker.percentile(self.percentile)))
+    
+    def count(self, field: str):
+        """线程安全地累加统计"""
+        with self._lock:
+            setattr(self.stats, field, getattr(self.stats, field) + 1)
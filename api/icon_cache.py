@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+图标缓存模块
+按URL缓存应用图标的原始字节：内存中保留最近使用的图标，磁盘上长期保存
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+import requests
+
+from api.response_cache import DEFAULT_CACHE_DIR
+
+
+DEFAULT_ICON_DIR = os.path.join(DEFAULT_CACHE_DIR, 'icons')
+
+
+class IconCache:
+    """两级（内存+磁盘）图标缓存类（线程安全）"""
+    
+    def __init__(self, directory: str = DEFAULT_ICON_DIR, max_memory_entries: int = 256,
+                 timeout: float = 10):
+        """
+        初始化图标缓存
+        
+        Args:
+            directory: 磁盘缓存目录
+            max_memory_entries: 内存中保留的图标数量
+            timeout: 下载超时时间（秒）
+        """
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.max_memory_entries = max_memory_entries
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._memory: 'OrderedDict[str, bytes]' = OrderedDict()
+        # 图标位于CDN，与API使用独立的连接池
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'AppleAppBundleFinder/1.0.0'
+        })
+    
+    def _path(self, url: str) -> str:
+        """URL对应的磁盘文件路径"""
+        return os.path.join(self.directory, hashlib.sha1(url.encode('utf-8')).hexdigest())
+    
+    def _remember(self, url: str, content: bytes):
+        """写入内存缓存并按最近使用淘汰"""
+        with self._lock:
+            self._memory[url] = content
+            self._memory.move_to_end(url)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+    
+    def contains(self, url: str) -> bool:
+        """图标是否已缓存（内存或磁盘）"""
+        with self._lock:
+            if url in self._memory:
+                return True
+        return os.path.exists(self._path(url))
+    
+    def get(self, url: str) -> Optional[bytes]:
+        """
+        读取已缓存的图标
+        
+        Args:
+            url: 图标URL
+        
+        Returns:
+            图标字节，未缓存时为None
+        """
+        with self._lock:
+            content = self._memory.get(url)
+            if content is not None:
+                self._memory.move_to_end(url)
+                return content
+        
+        try:
+            with open(self._path(url), 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+        self._remember(url, content)
+        return content
+    
+    def fetch(self, url: str) -> Optional[bytes]:
+        """
+        读取图标，未缓存时下载并写入缓存
+        
+        Args:
+            url: 图标URL
+        
+        Returns:
+            图标字节，下载失败时为None
+        """
+        content = self.get(url)
+        if content is not None:
+            return content
+        
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+            response.raise_for_status()
+        except requests.RequestException as e:
+            print(f"下载图标失败: {e}")
+            return None
+        
+        content = response.content
+        # 先写临时文件再替换，避免并发读取到不完整的图标
+        path = self._path(url)
+        temp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(content)
+            os.replace(temp_path, path)
+        except OSError as e:
+            print(f"写入图标缓存失败: {e}")
+        self._remember(url, content)
+        return content
+
+
+_default_icon_cache = None
+_default_icon_cache_lock = threading.Lock()
+
+
+def get_default_icon_cache() -> IconCache:
+    """
+    获取进程内共享的默认图标缓存
+    
+    Returns:
+        位于用户目录下的IconCache实例
+    """
+    global _default_icon_cache
+    with _default_icon_cache_lock:
+        if _default_icon_cache is None:
+            _default_icon_cache = IconCache()
+        return _default_icon_cache
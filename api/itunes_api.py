@@ -5,9 +5,118 @@ iTunes API接口模块
 提供与Apple iTunes API交互的功能
 """
 
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
 import requests
-from typing import Optional, List, Dict, Any
+from requests.adapters import HTTPAdapter
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Set, Tuple
+from api.api_response import ApiResponse, LookupResult
+from api.app_info_cache import AppInfoCache
+from api.cassette import Cassette
+from api.circuit_breaker import CircuitBreaker, get_default_circuit_breaker
+from api.exceptions import iTunesAPIError, ThrottledError, DeadlineExceededError
+from api.hedging import Deadline, HedgePolicy, latency_key
+from api.json_backend import JsonBackend, get_backend
+from api.metrics import MetricsRegistry, get_default_metrics
+from api.offline_snapshot import OfflineSnapshot
+from api.rate_limiter import (
+    AdaptiveRateLimiter, RetryPolicy, get_default_rate_limiter, parse_retry_after,
+    THROTTLE_STATUS_CODES, RETRYABLE_STATUS_CODES
+)
+from api.response_cache import ResponseCache
+from api.single_flight import SingleFlight
 from models.app_info import AppInfo
+from utils.tracing import get_tracer, traced
+
+
+def chunked(items: List[str], size: int) -> Iterator[List[str]]:
+    """
+    将列表按固定大小切分
+    
+    Args:
+        items: 待切分的列表
+        size: 每块的最大长度
+    
+    Returns:
+        依次产出的子列表
+    """
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def build_lookup_params(app_id: str, country: str) -> Dict[str, str]:
+    """
+    构建 /lookup 请求参数
+    
+    Args:
+        app_id: 应用ID（纯数字为trackId，否则视为bundleId）
+        country: 国家代码
+    
+    Returns:
+        请求参数字典
+    """
+    return {
+        'id' if app_id.isdigit() else 'bundleId': app_id,
+        'country': country,
+        'entity': 'software'
+    }
+
+
+def build_artist_lookup_params(artist_id: str, country: str, limit: int = 200,
+                               offset: int = 0) -> Dict[str, str]:
+    """
+    构建按开发者查询全部应用的 /lookup 请求参数
+    
+    Args:
+        artist_id: 开发者ID（artistId）
+        country: 国家代码
+        limit: 返回应用数量上限
+        offset: 分页偏移量
+    
+    Returns:
+        请求参数字典
+    """
+    params = {
+        'id': str(artist_id),
+        'country': country,
+        'entity': 'software',
+        'limit': str(limit)
+    }
+    if offset:
+        params['offset'] = str(offset)
+    return params
+
+
+def build_search_params(term: str, country: str, limit: int, offset: int = 0) -> Dict[str, str]:
+    """
+    构建 /search 请求参数
+    
+    Args:
+        term: 搜索关键词
+        country: 国家代码
+        limit: 返回结果数量限制
+        offset: 分页偏移量
+    
+    Returns:
+        请求参数字典
+    """
+    params = {
+        'term': term,
+        'country': country,
+        'entity': 'software',
+        'limit': str(limit)
+    }
+    if offset:
+        params['offset'] = str(offset)
+    return params
+
+
+# 覆盖API服务器地址的环境变量（例如指向本地模拟服务器 api.mock_server）
+BASE_URL_ENV_VAR = 'ITUNES_API_BASE_URL'
 
 
 class iTunesAPI:
@@ -16,57 +125,506 @@ class iTunesAPI:
     BASE_URL = "https://itunes.apple.com"
     LOOKUP_ENDPOINT = "/lookup"
     SEARCH_ENDPOINT = "/search"
+    # /lookup 单次请求允许携带的ID数量上限（逗号分隔）
+    MAX_LOOKUP_IDS = 200
+    # /search 单次请求允许的最大结果数
+    MAX_SEARCH_LIMIT = 200
+    # 按开发者 /lookup 单页允许的最大应用数
+    MAX_ARTIST_LIMIT = 200
     
-    def __init__(self, timeout: int = 10):
+    def __init__(self, timeout: int = 10, cache: Optional[ResponseCache] = None,
+                 app_cache: Optional[AppInfoCache] = None,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 pool_size: int = 10,
+                 json_backend: Optional[JsonBackend] = None,
+                 base_url: Optional[str] = None,
+                 cassette: Optional[Cassette] = None,
+                 hedge: Optional[HedgePolicy] = None,
+                 circuit_breaker: Optional[CircuitBreaker] = None,
+                 offline: Optional[OfflineSnapshot] = None,
+                 metrics: Optional[MetricsRegistry] = None):
         """
         初始化API客户端
         
         Args:
             timeout: 请求超时时间（秒）
+            cache: 可选的持久化响应缓存
+            app_cache: 可选的AppInfo内存缓存（位于响应缓存之前）
+            rate_limiter: 限流器，默认使用进程内共享的限流器
+            retry_policy: 限流和临时错误的重试策略
+            pool_size: 连接池保持的最大连接数（应不小于并发线程数）
+            json_backend: JSON解码后端，默认自动选择最快的可用后端
+            base_url: API服务器地址，默认读取环境变量 ITUNES_API_BASE_URL，否则为官方地址
+            cassette: 录制文件，录制模式下记录每次网络请求，回放模式下代替网络请求；
+                      设置后持久化响应缓存会换成同样配置的内存缓存，使录制完整且回放数据不写入持久化缓存
+            hedge: 对冲请求策略，设置后慢请求会在p95延迟后发出一个重复请求
+            circuit_breaker: 按店面区分的熔断器，默认使用进程内共享的熔断器
+            offline: 离线快照，设置后全部查询由快照回答，不发送网络请求（可随时修改 self.offline 切换）
+            metrics: 指标注册表，默认使用进程内共享的注册表
         """
+        self.BASE_URL = (base_url or os.environ.get(BASE_URL_ENV_VAR) or self.BASE_URL).rstrip('/')
         self.timeout = timeout
+        if cassette is not None and cache is not None and cache.path != ':memory:':
+            cache = ResponseCache(':memory:', ttls=cache.ttls, default_ttl=cache.default_ttl,
+                                  stale_ttl=cache.stale_ttl, max_bytes=cache.max_bytes)
+        self.cache = cache
+        self.cassette = cassette
+        self.offline = offline
+        self.hedge = hedge
+        self._hedge_executor = ThreadPoolExecutor(max_workers=pool_size) if hedge is not None else None
+        self.app_cache = app_cache
+        self.rate_limiter = rate_limiter or get_default_rate_limiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.circuit_breaker = circuit_breaker or get_default_circuit_breaker()
+        self.metrics = metrics or get_default_metrics()
+        self.retry_count = 0
+        self.json_backend = json_backend or get_backend()
+        # 合并相同参数的并发请求（合并键为 (接口, 缓存键)，合并次数计入指标）
+        self.single_flight = SingleFlight(on_coalesced=lambda key: self.metrics.record_coalesced(key[0]))
         self.session = requests.Session()
+        # 显式设置连接池大小，连接在多次请求间保持复用
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         # 设置User-Agent
         self.session.headers.update({
             'User-Agent': 'AppleAppBundleFinder/1.0.0'
         })
     
-    def lookup_by_id(self, app_id: str, country: str = "cn") -> Optional[AppInfo]:
+    def preconnect(self) -> bool:
+        """
+        预先建立到API服务器的连接（TCP+TLS），供后续请求复用
+        
+        Returns:
+            是否连接成功
+        """
+        try:
+            self.session.head(self.BASE_URL, timeout=self.timeout)
+            return True
+        except requests.RequestException as e:
+            print(f"预连接失败: {e}")
+            return False
+    
+    def _get_json(self, endpoint: str, params: Dict[str, str],
+                  deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        获取接口的JSON响应数据
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+            deadline: 总时间预算（秒）
+        
+        Returns:
+            解析后的响应数据
+        """
+        return self._get_response(endpoint, params, deadline).data
+    
+    def _get_response(self, endpoint: str, params: Dict[str, str],
+                      deadline: Optional[float] = None, use_cache: bool = True) -> ApiResponse:
+        """
+        获取接口响应，优先读取缓存
+        
+        新鲜缓存直接返回；过期但仍在可用期内的缓存先返回旧数据，并在后台刷新。
+        未命中时，相同参数的并发请求合并为一次网络调用。
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+            deadline: 总时间预算（秒），覆盖限流等待、全部重试和退避，None表示不限制
+            use_cache: 是否读写响应缓存（批量抓取等已有其他存储的大响应应绕过缓存）
+        
+        Returns:
+            ApiResponse对象
+        """
+        if self.offline is not None:
+            return self._offline_response(endpoint, params)
+        
+        if use_cache and self.cache is not None:
+            started = time.perf_counter()
+            with get_tracer().span('cache.get', endpoint=endpoint) as span:
+                state, body = self.cache.get(endpoint, params)
+                span.set(state=state)
+            self.metrics.record_cache(endpoint, state)
+            if state != ResponseCache.MISS:
+                if state == ResponseCache.STALE:
+                    self._revalidate_in_background(endpoint, params)
+                return ApiResponse(
+                    content=body,
+                    status_code=200,
+                    elapsed=time.perf_counter() - started,
+                    attempts=0,
+                    from_cache=True,
+                    backend=self.json_backend
+                )
+        
+        budget = Deadline(deadline) if deadline is not None else None
+        key = (endpoint, ResponseCache.make_key(endpoint, params))
+        return self.single_flight.do(key, lambda: self._fetch(endpoint, params, budget, use_cache), budget)
+    
+    def _offline_response(self, endpoint: str, params: Dict[str, str]) -> ApiResponse:
+        """
+        离线模式：由本地快照构造与接口格式相同的响应
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+        
+        Returns:
+            ApiResponse对象（快照中没有的应用不出现在结果中）
+        """
+        started = time.perf_counter()
+        country = params.get('country', 'cn')
+        if endpoint == self.SEARCH_ENDPOINT:
+            records = self.offline.search_records(
+                params.get('term', ''), country,
+                int(params.get('limit', 50)), int(params.get('offset', 0))
+            )
+        else:
+            ids = (params.get('id') or params.get('bundleId') or '').split(',')
+            records = [record for record in (self.offline.raw_record(app_id.strip(), country) for app_id in ids)
+                       if record is not None]
+        
+        data = {'resultCount': len(records), 'results': records}
+        return ApiResponse(
+            content=json.dumps(data, ensure_ascii=False).encode('utf-8'),
+            status_code=200,
+            elapsed=time.perf_counter() - started,
+            attempts=0,
+            from_cache=True,
+            backend=self.json_backend,
+            _data=data
+        )
+    
+    def _fetch(self, endpoint: str, params: Dict[str, str],
+               deadline: Optional[Deadline] = None, use_cache: bool = True) -> ApiResponse:
+        """
+        发送请求（或从录制文件回放），成功后将原始响应体写入缓存
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+            deadline: 总时间预算
+            use_cache: 是否将响应写入缓存
+        
+        Returns:
+            ApiResponse对象
+        """
+        started = time.perf_counter()
+        if self.cassette is not None and self.cassette.replaying:
+            exchange = self.cassette.play(endpoint, params)
+            content, status_code, attempts = exchange.content, exchange.status_code, 1
+        else:
+            response, attempts = self._send_guarded(endpoint, params, deadline)
+            content, status_code = response.content, response.status_code
+            if self.cassette is not None:
+                self.cassette.record(endpoint, params, status_code, content, time.perf_counter() - started)
+        
+        # 响应体延迟到使用时再解码，这里只做廉价的格式检查，避免缓存非JSON内容
+        if content.lstrip()[:1] != b'{':
+            raise ValueError(f"响应不是JSON对象: {content[:50]!r}")
+        if use_cache and self.cache is not None:
+            self.cache.set(endpoint, params, content)
+        return ApiResponse(
+            content=content,
+            status_code=status_code,
+            elapsed=time.perf_counter() - started,
+            attempts=attempts,
+            backend=self.json_backend
+        )
+    
+    def _send_guarded(self, endpoint: str, params: Dict[str, str],
+                      deadline: Optional[Deadline] = None) -> Tuple[requests.Response, int]:
+        """
+        经过熔断器发送请求：店面接口熔断时快速失败，并将请求结果反馈给熔断器
+        
+        超时、连接错误和5xx计为失败；被限流不代表店面故障，不计入统计。
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+            deadline: 总时间预算
+        
+        Returns:
+            (成功的响应, 尝试次数) 元组
+        
+        Raises:
+            CircuitOpenError: 该店面接口的熔断器处于打开状态
+        """
+        country = params.get('country', '')
+        breaker = self.circuit_breaker
+        breaker.before_request(endpoint, country)
+        try:
+            if self.hedge is not None:
+                result = self._send_hedged(endpoint, params, deadline)
+            else:
+                result = self._send(endpoint, params, deadline)
+        except (requests.ConnectionError, requests.Timeout):
+            breaker.record_failure(endpoint, country)
+            raise
+        except DeadlineExceededError as e:
+            # 只有在传输超时、连接错误或5xx后的退避中耗尽预算才计为失败，
+            # 等待限流器或Retry-After时耗尽预算不代表店面故障
+            if self._is_transport_failure(e.__cause__):
+                breaker.record_failure(endpoint, country)
+            else:
+                breaker.release(endpoint, country)
+            raise
+        except requests.HTTPError as e:
+            if e.response is not None and e.response.status_code >= 500:
+                breaker.record_failure(endpoint, country)
+            else:
+                breaker.record_success(endpoint, country)
+            raise
+        except BaseException:
+            breaker.release(endpoint, country)
+            raise
+        breaker.record_success(endpoint, country)
+        return result
+    
+    @staticmethod
+    def _is_transport_failure(error: Optional[BaseException]) -> bool:
+        """错误是否表示店面接口故障（连接错误、传输超时或5xx）"""
+        if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+            return True
+        if isinstance(error, requests.HTTPError):
+            return error.response is not None and error.response.status_code >= 500
+        return False
+    
+    def _send(self, endpoint: str, params: Dict[str, str],
+              deadline: Optional[Deadline] = None) -> Tuple[requests.Response, int]:
+        """
+        发送网络请求，遵守限流器并按重试策略处理限流、临时错误和连接失败
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+            deadline: 总时间预算，每次尝试的超时不超过剩余预算
+        
+        Returns:
+            (成功的响应, 尝试次数) 元组
+        
+        Raises:
+            DeadlineExceededError: 时间预算在成功前用完
+        """
+        policy = self.retry_policy
+        attempt = 0
+        while True:
+            wait_seconds = self.rate_limiter.reserve()
+            if wait_seconds > 0:
+                if deadline is not None:
+                    deadline.check_sleep(wait_seconds)
+                time.sleep(wait_seconds)
+            timeout = deadline.timeout(self.timeout) if deadline is not None else self.timeout
+            
+            started = time.perf_counter()
+            try:
+                with get_tracer().span('http.request', endpoint=endpoint, attempt=attempt) as span:
+                    response = self.session.get(
+                        f"{self.BASE_URL}{endpoint}",
+                        params=params,
+                        timeout=timeout
+                    )
+                    span.set(status=response.status_code, size=len(response.content))
+            except (requests.ConnectionError, requests.Timeout) as e:
+                self.metrics.record_request(endpoint, None, time.perf_counter() - started)
+                if deadline is not None and deadline.expired():
+                    raise DeadlineExceededError(deadline.budget) from e
+                if attempt >= policy.max_retries:
+                    raise
+                self.metrics.record_retry(endpoint, 'connection')
+                self._sleep_before_retry(attempt, deadline=deadline, cause=e)
+                attempt += 1
+                continue
+            
+            self.metrics.record_request(
+                endpoint, response.status_code, time.perf_counter() - started, len(response.content)
+            )
+            
+            if response.status_code in THROTTLE_STATUS_CODES:
+                retry_after = parse_retry_after(response.headers.get('Retry-After'))
+                self.rate_limiter.on_throttle(retry_after)
+                if attempt >= policy.max_retries:
+                    raise ThrottledError(response.status_code, retry_after)
+                self.metrics.record_retry(endpoint, 'throttled')
+                self._sleep_before_retry(attempt, retry_after, deadline)
+                attempt += 1
+                continue
+            
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < policy.max_retries:
+                self.metrics.record_retry(endpoint, 'server_error')
+                cause = requests.HTTPError(f"{response.status_code} Server Error", response=response)
+                self._sleep_before_retry(attempt, deadline=deadline, cause=cause)
+                attempt += 1
+                continue
+            
+            response.raise_for_status()
+            self.rate_limiter.on_success()
+            if self.hedge is not None:
+                self.hedge.record(latency_key(endpoint, params), time.perf_counter() - started)
+            return response, attempt + 1
+    
+    def _send_hedged(self, endpoint: str, params: Dict[str, str],
+                     deadline: Optional[Deadline] = None) -> Tuple[requests.Response, int]:
+        """
+        发送对冲请求：原请求超过对冲延迟仍未返回时发出一个重复请求，返回先成功的结果
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+            deadline: 总时间预算
+        
+        Returns:
+            (成功的响应, 尝试次数) 元组
+        """
+        self.hedge.count('requests')
+        primary = self._hedge_executor.submit(self._send, endpoint, params, deadline)
+        done, _ = wait([primary], timeout=self.hedge.delay(latency_key(endpoint, params)))
+        if done:
+            return primary.result()
+        
+        if deadline is not None and deadline.expired():
+            raise DeadlineExceededError(deadline.budget)
+        
+        hedged = self._hedge_executor.submit(self._send, endpoint, params, deadline)
+        self.hedge.count('hedges_sent')
+        pending = {primary, hedged}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.exception() is None:
+                    if future is hedged:
+                        self.hedge.count('hedges_won')
+                    return future.result()
+                error = error or future.exception()
+        raise error
+    
+    def _sleep_before_retry(self, attempt: int, retry_after: Optional[float] = None,
+                            deadline: Optional[Deadline] = None, cause: Optional[BaseException] = None):
+        """
+        按退避策略等待后重试，等待会超出时间预算时直接失败
+        
+        Args:
+            attempt: 已失败的次数
+            retry_after: 服务端要求的最短等待时间（秒）
+            deadline: 总时间预算
+            cause: 触发重试的传输错误，预算耗尽时作为DeadlineExceededError的原因（限流重试时为None）
+        """
+        delay = self.retry_policy.delay(attempt, retry_after)
+        if deadline is not None:
+            try:
+                deadline.check_sleep(delay)
+            except DeadlineExceededError as e:
+                if cause is None:
+                    raise
+                raise e from cause
+        self.retry_count += 1
+        time.sleep(delay)
+    
+    def _revalidate_in_background(self, endpoint: str, params: Dict[str, str]):
+        """在后台线程中刷新过期的缓存项（同一键只刷新一次）"""
+        if not self.cache.begin_revalidate(endpoint, params):
+            return
+        
+        def revalidate():
+            try:
+                self._fetch(endpoint, params)
+            except Exception as e:
+                print(f"缓存刷新错误: {e}")
+            finally:
+                self.cache.end_revalidate(endpoint, params)
+        
+        threading.Thread(target=revalidate, daemon=True).start()
+    
+    @traced('api.lookup_by_id')
+    def lookup_by_id(self, app_id: str, country: str = "cn",
+                     deadline: Optional[float] = None) -> Optional[AppInfo]:
         """
         根据应用ID查询应用信息
         
         Args:
             app_id: 应用ID（可以是trackId或bundleId）
             country: 国家代码，默认为中国(cn)
-            
+            deadline: 总时间预算（秒），覆盖全部重试和退避，None表示不限制
+        
         Returns:
             AppInfo对象或None（如果查询失败）
+        
+        Raises:
+            ThrottledError: 重试后仍被限流
+            CircuitOpenError: 该店面接口熔断中
+            DeadlineExceededError: 超出时间预算
         """
+        if self.offline is not None:
+            # 离线快照按ID建有索引，直接返回，不经过响应的序列化
+            return self.offline.lookup(app_id, country)
+        
+        if self.app_cache is not None:
+            cached = self.app_cache.get(app_id, country)
+            if cached is not None:
+                self.metrics.record_cache(self.LOOKUP_ENDPOINT, 'memory')
+                return cached
+        
         try:
             # 构建请求参数
-            params = {
-                'id' if app_id.isdigit() else 'bundleId': app_id,
-                'country': country,
-                'entity': 'software'
-            }
-            
-            # 发送请求
-            response = self.session.get(
-                f"{self.BASE_URL}{self.LOOKUP_ENDPOINT}",
-                params=params,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
+            params = build_lookup_params(app_id, country)
             
-            # 解析响应
-            data = response.json()
+            # 发送请求并解析响应
+            apps = self._get_response(self.LOOKUP_ENDPOINT, params, deadline).app_infos()
             
-            if data.get('resultCount', 0) > 0:
-                app_data = data['results'][0]
-                return AppInfo.from_api_response(app_data)
+            if apps:
+                app_info = apps[0]
+                if self.app_cache is not None:
+                    self.app_cache.put(app_info, country)
+                return app_info
             else:
                 return None
-                
+        
+        except iTunesAPIError:
+            raise
+        except requests.RequestException as e:
+            print(f"API请求错误: {e}")
+            return None
+        except Exception as e:
+            print(f"数据解析错误: {e}")
+            return None
+    
+    def lookup_with_raw(self, app_id: str, country: str = "cn",
+                        deadline: Optional[float] = None) -> Optional[LookupResult]:
+        """
+        根据应用ID查询应用信息，同时返回原始响应（只发送一次请求）
+        
+        Args:
+            app_id: 应用ID（可以是trackId或bundleId）
+            country: 国家代码，默认为中国(cn)
+            deadline: 总时间预算（秒），覆盖全部重试和退避，None表示不限制
+        
+        Returns:
+            LookupResult对象（含AppInfo、原始响应体和状态码/耗时/大小），请求失败时为None
+        
+        Raises:
+            ThrottledError: 重试后仍被限流
+            CircuitOpenError: 该店面接口熔断中
+            DeadlineExceededError: 超出时间预算
+        """
+        try:
+            params = build_lookup_params(app_id, country)
+            response = self._get_response(self.LOOKUP_ENDPOINT, params, deadline)
+            
+            # 调用方需要原始响应：只解码一次为字典，AppInfo从同一份字典构建
+            results = response.data.get('results', [])
+            with get_tracer().span('model.build', count=len(results)):
+                apps = AppInfo.from_api_batch(results)
+            app_info = apps[0] if apps else None
+            if app_info is not None and self.offline is None:
+                if self.app_cache is not None:
+                    self.app_cache.put(app_info, country)
+            return LookupResult(app_info=app_info, response=response)
+        
+        except iTunesAPIError:
+            raise
         except requests.RequestException as e:
             print(f"API请求错误: {e}")
             return None
@@ -74,7 +632,96 @@ class iTunesAPI:
             print(f"数据解析错误: {e}")
             return None
     
-    def search_apps(self, term: str, country: str = "cn", limit: int = 10) -> List[AppInfo]:
+    def lookup_many(self, app_ids: Iterable[str], country: str = "cn",
+                    failed: Optional[Set[str]] = None) -> Dict[str, Optional[AppInfo]]:
+        """
+        批量查询应用信息
+        
+        trackId 与 bundleId 分别合并为逗号分隔的 /lookup 请求，
+        每个请求最多携带 MAX_LOOKUP_IDS 个ID。
+        
+        Args:
+            app_ids: 应用ID列表（trackId与bundleId可混合）
+            country: 国家代码，默认为中国(cn)
+            failed: 传入集合时，请求或解析失败的批次不再抛出异常，其中的ID加入该集合后继续查询其余批次
+                    （结果中这些ID同样为None，需借助该集合与"未找到"区分）
+        
+        Returns:
+            按输入顺序排列的 {应用ID: AppInfo或None} 字典，未找到的ID对应None
+        
+        Raises:
+            ThrottledError: 重试后仍被限流
+            CircuitOpenError: 该店面接口熔断中
+            requests.RequestException: 某批次请求失败（未传入failed时）
+            ValueError: 某批次响应无法解析（未传入failed时）
+        """
+        results: Dict[str, Optional[AppInfo]] = {}
+        track_ids: List[str] = []
+        bundle_ids: List[str] = []
+        # 离线结果不写入内存缓存，避免切回在线后仍返回快照中的旧数据
+        app_cache = self.app_cache if self.offline is None else None
+        
+        # 去重并按ID类型分组，保持输入顺序
+        for app_id in app_ids:
+            app_id = str(app_id).strip()
+            if not app_id or app_id in results:
+                continue
+            results[app_id] = app_cache.get(app_id, country) if app_cache is not None else None
+            if results[app_id] is None:
+                (track_ids if app_id.isdigit() else bundle_ids).append(app_id)
+        
+        for param_name, ids in (('id', track_ids), ('bundleId', bundle_ids)):
+            for chunk in chunked(ids, self.MAX_LOOKUP_IDS):
+                # 将返回结果映射回输入ID（bundleId不区分大小写）
+                wanted = {
+                    (app_id if param_name == 'id' else app_id.lower()): app_id
+                    for app_id in chunk
+                }
+                try:
+                    apps = self._lookup_chunk(param_name, chunk, country)
+                except (requests.RequestException, ValueError):
+                    if failed is None:
+                        raise
+                    failed.update(chunk)
+                    continue
+                for app_info in apps:
+                    if param_name == 'id':
+                        key = str(app_info.track_id)
+                    else:
+                        key = (app_info.bundle_id or '').lower()
+                    if key in wanted:
+                        if app_cache is not None:
+                            app_cache.put(app_info, country)
+                        results[wanted[key]] = app_info
+        
+        return results
+    
+    def _lookup_chunk(self, param_name: str, ids: List[str], country: str) -> List[AppInfo]:
+        """
+        发送一次批量 /lookup 请求
+        
+        Args:
+            param_name: 参数名（'id' 或 'bundleId'）
+            ids: 同类型的应用ID列表
+            country: 国家代码
+        
+        Returns:
+            AppInfo对象列表
+        
+        Raises:
+            requests.RequestException: 请求失败
+            ValueError: 响应无法解析
+        """
+        params = {
+            param_name: ','.join(ids),
+            'country': country,
+            'entity': 'software'
+        }
+        return self._get_response(self.LOOKUP_ENDPOINT, params).app_infos()
+    
+    @traced('api.search_apps')
+    def search_apps(self, term: str, country: str = "cn", limit: int = 10,
+                    deadline: Optional[float] = None) -> List[AppInfo]:
         """
         搜索应用
         
@@ -82,37 +729,25 @@ class iTunesAPI:
             term: 搜索关键词
             country: 国家代码，默认为中国(cn)
             limit: 返回结果数量限制
-            
+            deadline: 总时间预算（秒），覆盖全部重试和退避，None表示不限制
+        
         Returns:
             AppInfo对象列表
+        
+        Raises:
+            ThrottledError: 重试后仍被限流
+            CircuitOpenError: 该店面接口熔断中
+            DeadlineExceededError: 超出时间预算
         """
         try:
             # 构建请求参数
-            params = {
-                'term': term,
-                'country': country,
-                'entity': 'software',
-                'limit': limit
-            }
-            
-            # 发送请求
-            response = self.session.get(
-                f"{self.BASE_URL}{self.SEARCH_ENDPOINT}",
-                params=params,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            # 解析响应
-            data = response.json()
-            
-            apps = []
-            for app_data in data.get('results', []):
-                app_info = AppInfo.from_api_response(app_data)
-                apps.append(app_info)
-            
-            return apps
+            params = build_search_params(term, country, limit)
             
+            # 发送请求并直接从响应体解码为AppInfo
+            return self._get_response(self.SEARCH_ENDPOINT, params, deadline).app_infos()
+        
+        except iTunesAPIError:
+            raise
         except requests.RequestException as e:
             print(f"API请求错误: {e}")
             return []
@@ -120,33 +755,125 @@ class iTunesAPI:
             print(f"数据解析错误: {e}")
             return []
     
-    def get_app_details(self, app_id: str, country: str = "cn") -> Dict[str, Any]:
+    def iter_search(self, term: str, country: str = "cn", page_size: int = MAX_SEARCH_LIMIT,
+                    max_results: Optional[int] = None, deadline: Optional[float] = None) -> Iterator[AppInfo]:
+        """
+        分页遍历关键词的全部搜索结果
+        
+        按 offset/limit 逐页请求，每页到达后立即产出其中的应用；按trackId跨页去重，
+        遇到不足一页或没有新结果的页面时停止。某一页请求或解析失败时抛出异常而不是提前结束，
+        调用方不会把截断的结果误当作完整结果（已产出的应用仍然有效）。
+        
+        Args:
+            term: 搜索关键词
+            country: 国家代码，默认为中国(cn)
+            page_size: 每页结果数（不超过 MAX_SEARCH_LIMIT）
+            max_results: 最多产出的结果数，None表示直到接口不再返回新结果
+            deadline: 每页请求的总时间预算（秒），None表示不限制
+        
+        Returns:
+            逐个产出AppInfo对象的生成器
+        
+        Raises:
+            ThrottledError: 重试后仍被限流
+            CircuitOpenError: 该店面接口熔断中
+            DeadlineExceededError: 某页超出时间预算
+            requests.RequestException: 某页请求失败
+            ValueError: 某页响应无法解析
+        """
+        page_size = max(1, min(page_size, self.MAX_SEARCH_LIMIT))
+        seen = set()
+        offset = 0
+        
+        while True:
+            params = build_search_params(term, country, page_size, offset)
+            apps = self._get_response(self.SEARCH_ENDPOINT, params, deadline).app_infos()
+            
+            new_count = 0
+            for app_info in apps:
+                if app_info.track_id in seen:
+                    continue
+                seen.add(app_info.track_id)
+                new_count += 1
+                yield app_info
+                if max_results is not None and len(seen) >= max_results:
+                    return
+            
+            if len(apps) < page_size or new_count == 0:
+                return
+            offset += len(apps)
+    
+    def lookup_artist_records(self, artist_id: str, country: str = "cn",
+                              page_size: int = MAX_ARTIST_LIMIT,
+                              deadline: Optional[float] = None,
+                              use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        分页查询开发者的全部应用，返回原始记录
+        
+        按 offset/limit 逐页请求 /lookup?id=<artistId>&entity=software，按trackId跨页去重，
+        遇到不足一页或没有新应用的页面时停止。请求和解析错误都会向上抛出，
+        便于调用方区分"开发者没有应用"和"请求失败"。
+        
+        Args:
+            artist_id: 开发者ID（artistId）
+            country: 国家代码，默认为中国(cn)
+            page_size: 每页应用数（不超过 MAX_ARTIST_LIMIT）
+            deadline: 每页请求的总时间预算（秒），None表示不限制
+            use_cache: 是否读写响应缓存（每页可达1MB，结果另有存储时应关闭，避免挤出交互查询的缓存）
+        
+        Returns:
+            应用原始记录列表（不含开发者记录）
+        
+        Raises:
+            ThrottledError: 重试后仍被限流
+            CircuitOpenError: 该店面接口熔断中
+            DeadlineExceededError: 超出时间预算
+            requests.RequestException: 请求失败
+        """
+        page_size = max(1, min(page_size, self.MAX_ARTIST_LIMIT))
+        records: Dict[int, Dict[str, Any]] = {}
+        offset = 0
+        
+        while True:
+            params = build_artist_lookup_params(artist_id, country, page_size, offset)
+            response = self._get_response(self.LOOKUP_ENDPOINT, params, deadline, use_cache)
+            page = [record for record in response.data.get('results', [])
+                    if record.get('wrapperType') == 'software' and record.get('trackId') is not None]
+            new_count = 0
+            for record in page:
+                if record['trackId'] not in records:
+                    records[record['trackId']] = record
+                    new_count += 1
+            
+            if len(page) < page_size or new_count == 0:
+                return list(records.values())
+            offset += len(page)
+    
+    def get_app_details(self, app_id: str, country: str = "cn",
+                        deadline: Optional[float] = None) -> Dict[str, Any]:
         """
         获取应用的原始详细信息（用于调试）
         
         Args:
             app_id: 应用ID
             country: 国家代码
-            
+            deadline: 总时间预算（秒），覆盖全部重试和退避，None表示不限制
+        
         Returns:
             原始API响应数据
+        
+        Raises:
+            ThrottledError: 重试后仍被限流
+            CircuitOpenError: 该店面接口熔断中
+            DeadlineExceededError: 超出时间预算
         """
         try:
-            params = {
-                'id' if app_id.isdigit() else 'bundleId': app_id,
-                'country': country,
-                'entity': 'software'
-            }
-            
-            response = self.session.get(
-                f"{self.BASE_URL}{self.LOOKUP_ENDPOINT}",
-                params=params,
-                timeout=self.timeout
-            )
-            response.raise_for_status()
-            
-            return response.json()
+            params = build_lookup_params(app_id, country)
             
+            return self._get_json(self.LOOKUP_ENDPOINT, params, deadline)
+        
+        except iTunesAPIError:
+            raise
         except Exception as e:
             print(f"获取详细信息错误: {e}")
             return {}
\ No newline at end of file
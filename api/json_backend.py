@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON解码后端模块
+按 msgspec > orjson > 标准库json 的顺序选择可用的解码器，可通过环境变量指定
+
+msgspec后端支持惰性模式：decode_apps 返回 LazyAppInfo，重字段在首次访问时才解码
+"""
+
+import json
+import os
+from typing import Any, List, Optional
+
+try:
+    import orjson
+except ImportError:  # orjson为可选依赖
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # msgspec为可选依赖
+    msgspec = None
+
+from models.app_info import AppInfo, FIELD_MAP, FIELD_NAMES
+from models.lazy_app_info import LAZY_FIELDS, LazyAppInfo
+from utils.tracing import get_tracer
+
+
+# 可通过该环境变量强制使用某个后端（stdlib / orjson / msgspec）
+BACKEND_ENV_VAR = 'APP_FINDER_JSON_BACKEND'
+
+# 设置为 1 时默认使用惰性模型模式
+LAZY_ENV_VAR = 'APP_FINDER_LAZY_MODELS'
+
+
+class JsonBackend:
+    """标准库json解码后端"""
+    
+    name = 'stdlib'
+    # 是否支持惰性模型模式
+    supports_lazy = False
+    lazy = False
+    
+    def loads(self, content: bytes) -> Any:
+        """
+        解码JSON
+        
+        Args:
+            content: 原始响应体
+            
+        Returns:
+            解码后的Python对象
+        """
+        return json.loads(content)
+    
+    def decode_apps(self, content: bytes) -> List[AppInfo]:
+        """
+        将 /lookup 或 /search 响应体解码为AppInfo列表
+        
+        Args:
+            content: 原始响应体
+            
+        Returns:
+            AppInfo对象列表
+        """
+        tracer = get_tracer()
+        with tracer.span('json.parse', backend=self.name):
+            data = self.loads(content)
+        results = data.get('results', [])
+        with tracer.span('model.build', count=len(results)):
+            return AppInfo.from_api_batch(results)
+
+
+class OrjsonBackend(JsonBackend):
+    """orjson解码后端"""
+    
+    name = 'orjson'
+    
+    def loads(self, content: bytes) -> Any:
+        return orjson.loads(content)
+
+
+class MsgspecBackend(JsonBackend):
+    """msgspec解码后端，decode_apps直接从字节解码为类型化记录，不构建中间字典"""
+    
+    name = 'msgspec'
+    supports_lazy = True
+    
+    def __init__(self, lazy: bool = False):
+        """
+        初始化msgspec后端
+        
+        Args:
+            lazy: 是否使用惰性模型模式（重字段解码为指向响应体的 msgspec.Raw 片段）
+        """
+        self.lazy = lazy
+        self._decoder = msgspec.json.Decoder()
+        # 与AppInfo字段一一对应的记录类型，字段名按FIELD_MAP映射到API键名，未知键直接跳过
+        record_type = msgspec.defstruct(
+            'AppRecord',
+            [(name, msgspec.Raw if lazy and name in LAZY_FIELDS else Any, None) for name in FIELD_NAMES],
+            rename=dict(FIELD_MAP)
+        )
+        envelope_type = msgspec.defstruct('Envelope', [('results', List[record_type], [])])
+        self._envelope_decoder = msgspec.json.Decoder(envelope_type)
+    
+    def loads(self, content: bytes) -> Any:
+        return self._decoder.decode(content)
+    
+    def decode_apps(self, content: bytes) -> List[AppInfo]:
+        astuple = msgspec.structs.astuple
+        tracer = get_tracer()
+        # msgspec在解析时直接构建类型化记录，json.parse区间包含记录构建，model.build只含AppInfo构建
+        with tracer.span('json.parse', backend=self.name, lazy=self.lazy):
+            envelope = self._envelope_decoder.decode(content)
+        with tracer.span('model.build', count=len(envelope.results)):
+            if self.lazy:
+                return [LazyAppInfo.from_values(astuple(record)) for record in envelope.results]
+            return [AppInfo(*astuple(record)) for record in envelope.results]
+
+
+_BACKENDS = {
+    'stdlib': (JsonBackend, True),
+    'orjson': (OrjsonBackend, orjson is not None),
+    'msgspec': (MsgspecBackend, msgspec is not None),
+}
+
+_default_backend = None
+
+
+def available_backends() -> List[str]:
+    """
+    获取当前环境可用的后端名称
+    
+    Returns:
+        后端名称列表
+    """
+    return [name for name, (_, available) in _BACKENDS.items() if available]
+
+
+def get_backend(name: Optional[str] = None, lazy: Optional[bool] = None) -> JsonBackend:
+    """
+    获取JSON解码后端
+    
+    Args:
+        name: 后端名称，默认读取环境变量，否则自动选择最快的可用后端
+        lazy: 是否使用惰性模型模式，默认读取环境变量 APP_FINDER_LAZY_MODELS
+        
+    Returns:
+        JsonBackend实例
+        
+    Raises:
+        ValueError: 后端不可用，或后端不支持惰性模式
+    """
+    global _default_backend
+    
+    if lazy is None:
+        lazy = os.environ.get(LAZY_ENV_VAR, '') not in ('', '0')
+    if lazy:
+        name = name or os.environ.get(BACKEND_ENV_VAR) or 'msgspec'
+        backend_cls, available = _BACKENDS.get(name, (None, False))
+        if not available or not backend_cls.supports_lazy:
+            raise ValueError(f"惰性模型模式需要 msgspec 后端（当前: {name}，可用: {', '.join(available_backends())}）")
+        return backend_cls(lazy=True)
+    
+    name = name or os.environ.get(BACKEND_ENV_VAR)
+    if name:
+        backend_cls, available = _BACKENDS.get(name, (None, False))
+        if not available:
+            raise ValueError(f"JSON后端不可用: {name}（可用: {', '.join(available_backends())}）")
+        return backend_cls()
+    
+    if _default_backend is None:
+        for candidate in ('msgspec', 'orjson', 'stdlib'):
+            backend_cls, available = _BACKENDS[candidate]
+            if available:
+                _default_backend = backend_cls()
+                break
+    return _default_backend
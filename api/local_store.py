@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+本地应用库模块
+基于SQLite保存抓取到的应用原始记录（按国家区分），并记录开发者目录抓取进度以便断点续抓
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional, List, Dict, Any, Iterator, Set, Tuple
+
+from api.response_cache import DEFAULT_CACHE_DIR
+from models.app_info import AppInfo
+
+
+DEFAULT_STORE_PATH = os.path.join(DEFAULT_CACHE_DIR, 'apps.sqlite3')
+
+
+class LocalAppStore:
+    """SQLite本地应用库类"""
+    
+    DONE = 'done'
+    FAILED = 'failed'
+    
+    def __init__(self, path: str = DEFAULT_STORE_PATH):
+        """
+        初始化本地应用库
+        
+        Args:
+            path: SQLite数据库文件路径（':memory:' 表示仅内存）
+        """
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS apps (
+                track_id INTEGER NOT NULL,
+                country TEXT NOT NULL,
+                bundle_id TEXT,
+                artist_id INTEGER,
+                record TEXT NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (track_id, country)
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_apps_bundle ON apps(bundle_id, country)')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_apps_artist ON apps(artist_id, country)')
+        if self._conn.execute('PRAGMA user_version').fetchone()[0] < 1:
+            # bundleId按小写保存（查询时不区分大小写），迁移此前按原样保存的记录
+            self._conn.execute('UPDATE apps SET bundle_id = lower(bundle_id) WHERE bundle_id != lower(bundle_id)')
+            self._conn.execute('PRAGMA user_version = 1')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_progress (
+                artist_id TEXT NOT NULL,
+                country TEXT NOT NULL,
+                status TEXT NOT NULL,
+                app_count INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (artist_id, country)
+            )
+        ''')
+        self._conn.commit()
+    
+    def put_records(self, records: List[Dict[str, Any]], country: str,
+                    fetched_at: Optional[float] = None) -> int:
+        """
+        写入（或覆盖）应用原始记录，非应用记录（如开发者记录）会被忽略
+        
+        Args:
+            records: iTunes API返回的原始记录列表
+            country: 国家代码
+            fetched_at: 抓取时间戳，默认为当前时间
+        
+        Returns:
+            写入的应用数量
+        """
+        fetched_at = fetched_at or time.time()
+        country = country.lower()
+        rows = [
+            (
+                record['trackId'],
+                country,
+                record['bundleId'].lower() if record.get('bundleId') else None,
+                record.get('artistId'),
+                json.dumps(record, ensure_ascii=False, separators=(',', ':')),
+                fetched_at
+            )
+            for record in records
+            if record.get('trackId') is not None and record.get('wrapperType', 'software') == 'software'
+        ]
+        with self._lock:
+            self._conn.executemany(
+                'INSERT OR REPLACE INTO apps (track_id, country, bundle_id, artist_id, record, fetched_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                rows
+            )
+            self._conn.commit()
+        return len(rows)
+    
+    def get(self, app_id: str, country: str) -> Optional[AppInfo]:
+        """
+        按trackId或bundleId读取应用（bundleId不区分大小写）
+        
+        Args:
+            app_id: 应用ID（纯数字为trackId，否则视为bundleId）
+            country: 国家代码
+        
+        Returns:
+            AppInfo对象或None（库中不存在）
+        """
+        column = 'track_id' if app_id.isdigit() else 'bundle_id'
+        value = int(app_id) if app_id.isdigit() else app_id.lower()
+        with self._lock:
+            row = self._conn.execute(
+                f'SELECT record FROM apps WHERE {column} = ? AND country = ?', (value, country.lower())
+            ).fetchone()
+        return AppInfo.from_api_response(json.loads(row[0])) if row else None
+    
+    def apps_by_artist(self, artist_id: str, country: str) -> List[AppInfo]:
+        """
+        读取某个开发者的全部应用
+        
+        Args:
+            artist_id: 开发者ID
+            country: 国家代码
+        
+        Returns:
+            AppInfo对象列表
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT record FROM apps WHERE artist_id = ? AND country = ? ORDER BY track_id',
+                (int(artist_id), country.lower())
+            ).fetchall()
+        return AppInfo.from_api_batch(json.loads(row[0]) for row in rows)
+    
+    def iter_records(self, country: Optional[str] = None,
+                     since: Optional[float] = None) -> Iterator[Tuple[Dict[str, Any], str, float]]:
+        """
+        遍历库中的原始记录
+        
+        Args:
+            country: 只遍历指定国家，默认遍历全部
+            since: 只遍历抓取时间不早于该时间戳的记录，默认遍历全部
+        
+        Returns:
+            依次产出的 (原始记录, 国家代码, 抓取时间戳) 元组
+        """
+        conditions = []
+        params: tuple = ()
+        if country:
+            conditions.append('country = ?')
+            params += (country.lower(),)
+        if since is not None:
+            conditions.append('fetched_at >= ?')
+            params += (since,)
+        query = 'SELECT record, country, fetched_at FROM apps'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        for record, row_country, fetched_at in rows:
+            yield json.loads(record), row_country, fetched_at
+    
+    def count(self, country: Optional[str] = None) -> int:
+        """
+        获取库中的应用数量
+        
+        Args:
+            country: 只统计指定国家，默认统计全部
+        
+        Returns:
+            应用数量
+        """
+        with self._lock:
+            if country:
+                return self._conn.execute(
+                    'SELECT COUNT(*) FROM apps WHERE country = ?', (country.lower(),)
+                ).fetchone()[0]
+            return self._conn.execute('SELECT COUNT(*) FROM apps').fetchone()[0]
+    
+    def mark_crawled(self, artist_id: str, country: str, app_count: int):
+        """记录开发者目录抓取完成"""
+        self._set_progress(artist_id, country, self.DONE, app_count, None)
+    
+    def mark_failed(self, artist_id: str, country: str, error: str):
+        """记录开发者目录抓取失败（续抓时会重试）"""
+        self._set_progress(artist_id, country, self.FAILED, 0, error)
+    
+    def _set_progress(self, artist_id: str, country: str, status: str, app_count: int, error: Optional[str]):
+        """写入抓取进度"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO crawl_progress (artist_id, country, status, app_count, error, updated_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (str(artist_id), country.lower(), status, app_count, error, time.time())
+            )
+            self._conn.commit()
+    
+    def crawled_artists(self, country: str) -> Set[str]:
+        """
+        获取已完成抓取的开发者ID
+        
+        Args:
+            country: 国家代码
+        
+        Returns:
+            开发者ID集合
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT artist_id FROM crawl_progress WHERE country = ? AND status = ?',
+                (country.lower(), self.DONE)
+            ).fetchall()
+        return {row[0] for row in rows}
+    
+    def clear_progress(self, country: Optional[str] = None):
+        """清空抓取进度（下次抓取将重新获取全部开发者）"""
+        with self._lock:
+            if country:
+                self._conn.execute('DELETE FROM crawl_progress WHERE country = ?', (country.lower(),))
+            else:
+                self._conn.execute('DELETE FROM crawl_progress')
+            self._conn.commit()
+    
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
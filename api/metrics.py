@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+指标模块
+按接口统计请求数、状态分类、接收字节数、缓存命中、重试次数、合并请求数和延迟直方图，
+可导出为Prometheus文本格式或JSON快照
+"""
+
+import json
+import threading
+import time
+from typing import Optional, Dict, Any, List, Tuple
+
+
+# 每个2的幂区间内的线性子桶数为 2**SUB_BUCKET_BITS，相对误差约 1/32
+SUB_BUCKET_BITS = 5
+_SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+# 导出的分位数
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+def status_class(status_code: Optional[int]) -> str:
+    """
+    将状态码归类为 2xx / 3xx / 4xx / 5xx，没有响应（超时、连接错误）时为 error
+    
+    Args:
+        status_code: HTTP状态码或None
+    
+    Returns:
+        状态分类字符串
+    """
+    if status_code is None:
+        return 'error'
+    return f"{status_code // 100}xx"
+
+
+class LatencyHistogram:
+    """HDR风格的对数-线性延迟直方图（微秒精度，固定相对误差，内存与样本数无关）"""
+    
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self._buckets: Dict[int, int] = {}
+    
+    @staticmethod
+    def _index(micros: int) -> int:
+        """值所在的桶编号：小于 2*子桶数 的值一一对应，更大的值每个2的幂区间分为等宽子桶"""
+        if micros < 2 * _SUB_BUCKETS:
+            return micros
+        shift = micros.bit_length() - SUB_BUCKET_BITS - 1
+        return 2 * _SUB_BUCKETS + (shift - 1) * _SUB_BUCKETS + (micros >> shift) - _SUB_BUCKETS
+    
+    @staticmethod
+    def _value(index: int) -> int:
+        """桶编号对应区间的上界（微秒）"""
+        if index < 2 * _SUB_BUCKETS:
+            return index
+        shift, offset = divmod(index - 2 * _SUB_BUCKETS, _SUB_BUCKETS)
+        shift += 1
+        return ((offset + _SUB_BUCKETS + 1) << shift) - 1
+    
+    def record(self, seconds: float):
+        """记录一个延迟样本（秒）"""
+        micros = max(0, int(seconds * 1e6))
+        index = self._index(micros)
+        self._buckets[index] = self._buckets.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.min = seconds if self.min is None else min(self.min, seconds)
+        self.max = seconds if self.max is None else max(self.max, seconds)
+    
+    def percentile(self, quantile: float) -> float:
+        """
+        计算分位数
+        
+        Args:
+            quantile: 0到1之间的分位点
+        
+        Returns:
+            延迟（秒），没有样本时为0
+        """
+        if not self.count:
+            return 0.0
+        rank = max(1, int(round(quantile * self.count)))
+        seen = 0
+        for index in sorted(self._buckets):
+            seen += self._buckets[index]
+            if seen >= rank:
+                return min(self._value(index) / 1e6, self.max)
+        return self.max
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """导出统计摘要"""
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'min': self.min or 0.0,
+            'max': self.max or 0.0,
+            **{f"p{int(q * 100)}": self.percentile(q) for q in QUANTILES},
+        }
+
+
+class MetricsRegistry:
+    """请求指标注册表（线程安全）"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+        # (接口, 状态分类) -> 请求数
+        self._requests: Dict[Tuple[str, str], int] = {}
+        self._bytes: Dict[str, int] = {}
+        self._latency: Dict[str, LatencyHistogram] = {}
+        # (接口, 缓存状态) -> 次数
+        self._cache: Dict[Tuple[str, str], int] = {}
+        # (接口, 原因) -> 次数
+        self._retries: Dict[Tuple[str, str], int] = {}
+        # 接口 -> 被合并到进行中请求的次数
+        self._coalesced: Dict[str, int] = {}
+    
+    def record_request(self, endpoint: str, status_code: Optional[int], elapsed: float, size: int = 0):
+        """
+        记录一次HTTP请求（每次重试单独记录）
+        
+        Args:
+            endpoint: 接口路径
+            status_code: HTTP状态码，没有响应时为None
+            elapsed: 请求耗时（秒）
+            size: 接收的响应体字节数
+        """
+        key = (endpoint, status_class(status_code))
+        with self._lock:
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._bytes[endpoint] = self._bytes.get(endpoint, 0) + size
+            histogram = self._latency.get(endpoint)
+            if histogram is None:
+                histogram = self._latency[endpoint] = LatencyHistogram()
+            histogram.record(elapsed)
+    
+    def record_cache(self, endpoint: str, state: str):
+        """
+        记录一次缓存查询结果
+        
+        Args:
+            endpoint: 接口路径
+            state: 缓存状态（fresh / stale / miss / memory）
+        """
+        key = (endpoint, state)
+        with self._lock:
+            self._cache[key] = self._cache.get(key, 0) + 1
+    
+    def record_retry(self, endpoint: str, reason: str):
+        """
+        记录一次重试
+        
+        Args:
+            endpoint: 接口路径
+            reason: 重试原因（throttled / server_error / connection）
+        """
+        key = (endpoint, reason)
+        with self._lock:
+            self._retries[key] = self._retries.get(key, 0) + 1
+    
+    def record_coalesced(self, endpoint: str):
+        """
+        记录一次请求合并（相同请求正在进行，本次调用等待其结果而未发送请求）
+        
+        Args:
+            endpoint: 接口路径
+        """
+        with self._lock:
+            self._coalesced[endpoint] = self._coalesced.get(endpoint, 0) + 1
+    
+    def reset(self):
+        """清空全部指标"""
+        with self._lock:
+            self.started_at = time.time()
+            self._requests.clear()
+            self._bytes.clear()
+            self._latency.clear()
+            self._cache.clear()
+            self._retries.clear()
+            self._coalesced.clear()
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        获取按接口分组的指标快照
+        
+        Returns:
+            {'started_at', 'uptime', 'endpoints': {接口: {...}}} 字典
+        """
+        with self._lock:
+            endpoints: Dict[str, Dict[str, Any]] = {}
+            
+            def entry(endpoint: str) -> Dict[str, Any]:
+                return endpoints.setdefault(endpoint, {
+                    'requests': {}, 'bytes': 0, 'cache': {}, 'retries': {}, 'coalesced': 0,
+                    'latency': LatencyHistogram().to_dict()
+                })
+            
+            for (endpoint, klass), count in self._requests.items():
+                entry(endpoint)['requests'][klass] = count
+            for endpoint, size in self._bytes.items():
+                entry(endpoint)['bytes'] = size
+            for endpoint, histogram in self._latency.items():
+                entry(endpoint)['latency'] = histogram.to_dict()
+            for (endpoint, state), count in self._cache.items():
+                entry(endpoint)['cache'][state] = count
+            for (endpoint, reason), count in self._retries.items():
+                entry(endpoint)['retries'][reason] = count
+            for endpoint, count in self._coalesced.items():
+                entry(endpoint)['coalesced'] = count
+            
+            return {
+                'started_at': self.started_at,
+                'uptime': time.time() - self.started_at,
+                'endpoints': endpoints,
+            }
+    
+    def to_json(self) -> str:
+        """导出JSON快照"""
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+    
+    def to_prometheus(self) -> str:
+        """
+        导出Prometheus文本格式
+        
+        Returns:
+            text/plain; version=0.0.4 格式的文本
+        """
+        snapshot = self.snapshot()
+        lines: List[str] = []
+        
+        def family(name: str, kind: str, help_text: str):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} {kind}")
+        
+        family('itunes_api_requests_total', 'counter', 'HTTP requests sent to the iTunes API, including retries')
+        for endpoint, data in snapshot['endpoints'].items():
+            for klass, count in sorted(data['requests'].items()):
+                lines.append(f'itunes_api_requests_total{{endpoint="{endpoint}",status_class="{klass}"}} {count}')
+        
+        family('itunes_api_response_bytes_total', 'counter', 'Response body bytes received')
+        for endpoint, data in snapshot['endpoints'].items():
+            lines.append(f'itunes_api_response_bytes_total{{endpoint="{endpoint}"}} {data["bytes"]}')
+        
+        family('itunes_api_cache_lookups_total', 'counter', 'Cache lookups by result state')
+        for endpoint, data in snapshot['endpoints'].items():
+            for state, count in sorted(data['cache'].items()):
+                lines.append(f'itunes_api_cache_lookups_total{{endpoint="{endpoint}",state="{state}"}} {count}')
+        
+        family('itunes_api_retries_total', 'counter', 'Retried requests by reason')
+        for endpoint, data in snapshot['endpoints'].items():
+            for reason, count in sorted(data['retries'].items()):
+                lines.append(f'itunes_api_retries_total{{endpoint="{endpoint}",reason="{reason}"}} {count}')
+        
+        family('itunes_api_coalesced_requests_total', 'counter', 'Calls served by an identical in-flight request')
+        for endpoint, data in snapshot['endpoints'].items():
+            lines.append(f'itunes_api_coalesced_requests_total{{endpoint="{endpoint}"}} {data["coalesced"]}')
+        
+        family('itunes_api_request_duration_seconds', 'summary', 'Per-attempt request latency')
+        for endpoint, data in snapshot['endpoints'].items():
+            latency = data['latency']
+            for quantile in QUANTILES:
+                value = latency[f"p{int(quantile * 100)}"]
+                lines.append(
+                    f'itunes_api_request_duration_seconds{{endpoint="{endpoint}",quantile="{quantile}"}} {value:.6f}'
+                )
+            lines.append(f'itunes_api_request_duration_seconds_sum{{endpoint="{endpoint}"}} {latency["sum"]:.6f}')
+            lines.append(f'itunes_api_request_duration_seconds_count{{endpoint="{endpoint}"}} {latency["count"]}')
+        
+        return '\n'.join(lines) + '\n'
+
+
+_default_metrics = None
+_default_metrics_lock = threading.Lock()
+
+
+def get_default_metrics() -> MetricsRegistry:
+    """
+    获取进程内共享的默认指标注册表，所有未指定注册表的客户端共用
+    
+    Returns:
+        MetricsRegistry实例
+    """
+    global _default_metrics
+    with _default_metrics_lock:
+        if _default_metrics is None:
+            _default_metrics = MetricsRegistry()
+        return _default_metrics
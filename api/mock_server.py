@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+本地模拟iTunes服务器模块
+从示例语料提供 /lookup 和 /search 接口，可注入延迟、错误、429限流突发和慢速响应体，
+用于在无网络环境下进行吞吐量和尾延迟测试
+
+用法: python -m api.mock_server --port 8765 --latency lognormal:40,0.6 --error-rate 0.01
+然后设置环境变量 ITUNES_API_BASE_URL=http://127.0.0.1:8765 启动客户端或GUI
+"""
+
+import argparse
+import json
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import urlparse, parse_qs
+
+from utils.sample_data import make_corpus
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    解析延迟分布描述
+    
+    支持的格式（单位毫秒）:
+        fixed:50 / uniform:20,80 / normal:50,10 / lognormal:<中位数>,<sigma> / exp:<均值>
+    
+    Args:
+        spec: 延迟分布描述
+        
+    Returns:
+        接收随机数生成器、返回延迟秒数的函数
+    """
+    kind, _, args = spec.partition(':')
+    values = [float(v) for v in args.split(',') if v]
+    
+    if kind == 'fixed':
+        return lambda rng: values[0] / 1000
+    if kind == 'uniform':
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if kind == 'normal':
+        return lambda rng: max(0.0, rng.gauss(values[0], values[1])) / 1000
+    if kind == 'lognormal':
+        mu = math.log(values[0])
+        return lambda rng: rng.lognormvariate(mu, values[1]) / 1000
+    if kind == 'exp':
+        return lambda rng: rng.expovariate(1 / values[0]) / 1000
+    raise ValueError(f"不支持的延迟分布: {spec}")
+
+
+@dataclass
+class MockServerConfig:
+    """模拟服务器配置"""
+    
+    host: str = '127.0.0.1'
+    port: int = 0
+    # 延迟分布描述，见 parse_latency
+    latency: str = 'fixed:0'
+    # 返回5xx错误的概率
+    error_rate: float = 0.0
+    # 429突发：每隔burst_interval秒进入一次持续burst_duration秒的限流期（0表示关闭）
+    burst_interval: float = 0.0
+    burst_duration: float = 0.0
+    retry_after: int = 1
+    # 慢速响应体：每秒写出的字节数（0表示一次写完）
+    drip_rate: int = 0
+    drip_chunk: int = 1024
+    # 示例语料条数（未提供fixtures时使用）
+    corpus_size: int = 1000
+    # 语料文件路径（JSON记录列表或iTunes响应格式）
+    fixtures: Optional[str] = None
+    seed: int = 0
+
+
+class MockITunesServer:
+    """本地模拟iTunes服务器"""
+    
+    def __init__(self, config: Optional[MockServerConfig] = None):
+        """
+        初始化模拟服务器
+        
+        Args:
+            config: 服务器配置
+        """
+        self.config = config or MockServerConfig()
+        self.records = self._load_records()
+        self.latency = parse_latency(self.config.latency)
+        self.stats = {'requests': 0, 'errors': 0, 'throttled': 0}
+        
+        self._rng = random.Random(self.config.seed)
+        self._rng_lock = threading.Lock()
+        self._started_at = time.monotonic()
+        self._by_track_id: Dict[str, Dict[str, Any]] = {}
+        self._by_bundle_id: Dict[str, Dict[str, Any]] = {}
+        self._by_artist_id: Dict[str, List[Dict[str, Any]]] = {}
+        for record in self.records:
+            self._by_track_id[str(record.get('trackId'))] = record
+            self._by_bundle_id[str(record.get('bundleId', '')).lower()] = record
+            self._by_artist_id.setdefault(str(record.get('artistId')), []).append(record)
+        
+        handler = type('Handler', (_MockHandler,), {'server_state': self})
+        self.httpd = _MockHTTPServer((self.config.host, self.config.port), handler)
+        self._thread = None
+    
+    @property
+    def url(self) -> str:
+        """服务器基础URL，可直接作为客户端的base_url"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+    
+    def start(self) -> 'MockITunesServer':
+        """在后台线程中启动服务器"""
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+    
+    def stop(self):
+        """停止服务器"""
+        self.httpd.shutdown()
+        self.httpd.server_close()
+    
+    def __enter__(self) -> 'MockITunesServer':
+        return self.start()
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+    
+    def _load_records(self) -> List[Dict[str, Any]]:
+        """加载语料：优先读取fixtures文件，否则生成示例语料"""
+        if not self.config.fixtures:
+            return make_corpus(self.config.corpus_size, self.config.seed)
+        
+        with open(self.config.fixtures, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        return data.get('results', []) if isinstance(data, dict) else data
+    
+    def count(self, key: str):
+        """线程安全地累加统计计数"""
+        with self._rng_lock:
+            self.stats[key] += 1
+    
+    def random(self) -> float:
+        """线程安全的随机数"""
+        with self._rng_lock:
+            return self._rng.random()
+    
+    def sample_latency(self) -> float:
+        """按配置的分布采样一次延迟（秒）"""
+        with self._rng_lock:
+            return self.latency(self._rng)
+    
+    def in_throttle_burst(self) -> bool:
+        """当前是否处于429限流突发期"""
+        interval = self.config.burst_interval
+        if interval <= 0:
+            return False
+        return (time.monotonic() - self._started_at) % interval < self.config.burst_duration
+    
+    def lookup(self, query: Dict[str, str]) -> List[Dict[str, Any]]:
+        """处理 /lookup 查询"""
+        results = []
+        for value in query.get('id', '').split(','):
+            value = value.strip()
+            if not value:
+                continue
+            if value in self._by_track_id:
+                results.append(self._by_track_id[value])
+            elif value in self._by_artist_id:
+                # artistId查询：先返回开发者记录，再返回其全部应用
+                apps = self._by_artist_id[value]
+                results.append({
+                    'wrapperType': 'artist',
+                    'artistType': 'Software Artist',
+                    'artistName': apps[0].get('artistName'),
+                    'artistId': apps[0].get('artistId'),
+                })
+                offset = int(query.get('offset', 0))
+                results.extend(apps[offset:offset + min(int(query.get('limit', 200)), 200)])
+        for value in query.get('bundleId', '').split(','):
+            record = self._by_bundle_id.get(value.strip().lower())
+            if record is not None:
+                results.append(record)
+        return results
+    
+    def search(self, query: Dict[str, str]) -> List[Dict[str, Any]]:
+        """处理 /search 查询：关键词全部出现在名称、开发者或分类中即视为匹配"""
+        terms = query.get('term', '').lower().split()
+        limit = min(int(query.get('limit', 50)), 200)
+        offset = int(query.get('offset', 0))
+        
+        matched = []
+        for record in self.records:
+            text = ' '.join(str(record.get(key, '')) for key in ('trackName', 'artistName', 'primaryGenreName')).lower()
+            if all(term in text for term in terms):
+                matched.append(record)
+                if len(matched) >= offset + limit:
+                    break
+        return matched[offset:offset + limit]
+
+
+class _MockHTTPServer(ThreadingHTTPServer):
+    """加大监听队列的多线程HTTP服务器，避免高并发压测时连接被拒"""
+    
+    request_queue_size = 1024
+    daemon_threads = True
+
+
+class _MockHandler(BaseHTTPRequestHandler):
+    """模拟服务器请求处理器"""
+    
+    protocol_version = 'HTTP/1.1'
+    server_state: MockITunesServer = None
+    
+    def log_message(self, format, *args):
+        pass
+    
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+    
+    def do_GET(self):
+        state = self.server_state
+        state.count('requests')
+        parsed = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+        
+        time.sleep(state.sample_latency())
+        
+        if state.in_throttle_burst():
+            state.count('throttled')
+            self._send_empty(429, {'Retry-After': str(state.config.retry_after)})
+            return
+        
+        if state.config.error_rate and state.random() < state.config.error_rate:
+            state.count('errors')
+            self._send_empty(503)
+            return
+        
+        if parsed.path == '/lookup':
+            results = state.lookup(query)
+        elif parsed.path == '/search':
+            results = state.search(query)
+        elif parsed.path == '/__stats':
+            self._send_body(json.dumps(state.stats).encode('utf-8'))
+            return
+        else:
+            self._send_empty(404)
+            return
+        
+        body = json.dumps({'resultCount': len(results), 'results': results}, ensure_ascii=False).encode('utf-8')
+        self._send_body(body)
+    
+    def _send_empty(self, status: int, headers: Optional[Dict[str, str]] = None):
+        """发送无响应体的状态码"""
+        self.send_response(status)
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+    
+    def _send_body(self, body: bytes):
+        """发送JSON响应体，按配置慢速分块写出"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/javascript; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        
+        drip_rate = self.server_state.config.drip_rate
+        if not drip_rate:
+            self.wfile.write(body)
+            return
+        
+        chunk = self.server_state.config.drip_chunk
+        for start in range(0, len(body), chunk):
+            self.wfile.write(body[start:start + chunk])
+            self.wfile.flush()
+            time.sleep(chunk / drip_rate)
+
+
+def main():
+    """命令行入口"""
+    parser = argparse.ArgumentParser(description='本地模拟iTunes API服务器')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', default='fixed:0', help='延迟分布，如 lognormal:40,0.6（毫秒）')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='返回503的概率')
+    parser.add_argument('--burst-interval', type=float, default=0.0, help='429突发周期（秒）')
+    parser.add_argument('--burst-duration', type=float, default=0.0, help='每次429突发持续时间（秒）')
+    parser.add_argument('--retry-after', type=int, default=1, help='429响应的Retry-After（秒）')
+    parser.add_argument('--drip-rate', type=int, default=0, help='慢速响应体速率（字节/秒）')
+    parser.add_argument('--corpus-size', type=int, default=1000, help='示例语料条数')
+    parser.add_argument('--fixtures', help='语料JSON文件路径')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    
+    config = MockServerConfig(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        error_rate=args.error_rate,
+        burst_interval=args.burst_interval,
+        burst_duration=args.burst_duration,
+        retry_after=args.retry_after,
+        drip_rate=args.drip_rate,
+        corpus_size=args.corpus_size,
+        fixtures=args.fixtures,
+        seed=args.seed
+    )
+    server = MockITunesServer(config)
+    print(f"模拟iTunes服务器已启动: {server.url}（{len(server.records)} 条应用记录）")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == '__main__':
+    main()
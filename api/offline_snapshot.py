@@ -0,0 +1,393 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+离线快照模块
+将本地应用库、响应缓存或导入文件中的应用记录加载到内存索引中，
+离线模式下由快照直接回答按ID查询和关键词搜索
+
+用法: python -m api.offline_snapshot import apps.json --country cn
+"""
+
+import argparse
+import bisect
+import json
+import re
+import threading
+import time
+from typing import Optional, List, Dict, Any, Iterable, Set, Tuple
+
+from api.json_backend import get_backend
+from api.local_store import LocalAppStore
+from api.response_cache import ResponseCache, get_default_cache
+from models.app_info import AppInfo
+
+
+# ASCII单词按前缀匹配；中日韩等非ASCII文字按单字索引
+_TOKEN_RE = re.compile(r'[a-z0-9]+|[^\x00-\x7f\W]')
+
+# 参与关键词搜索的原始字段
+SEARCH_FIELDS = ('trackName', 'artistName', 'bundleId')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    将文本切分为搜索词
+    
+    Args:
+        text: 任意文本
+    
+    Returns:
+        小写的搜索词列表
+    """
+    return _TOKEN_RE.findall(text.lower())
+
+
+def format_age(seconds: float) -> str:
+    """
+    将数据年龄格式化为易读文本
+    
+    Args:
+        seconds: 距抓取时间的秒数
+    
+    Returns:
+        如 "5 分钟前"、"3 天前"
+    """
+    if seconds < 60:
+        return "刚刚"
+    if seconds < 3600:
+        return f"{int(seconds // 60)} 分钟前"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)} 小时前"
+    return f"{int(seconds // 86400)} 天前"
+
+
+class OfflineSnapshot:
+    """内存中的离线应用快照（线程安全）"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (国家代码, trackId) -> (原始记录, 抓取时间戳)
+        self._records: Dict[Tuple[str, int], Tuple[Dict[str, Any], float]] = {}
+        # (国家代码, 小写bundleId) -> trackId
+        self._bundle_index: Dict[Tuple[str, str], int] = {}
+        # 搜索词 -> {(国家代码, trackId)}
+        self._token_index: Dict[str, Set[Tuple[str, int]]] = {}
+        # 排序后的搜索词，用于前缀匹配（写入后延迟重建）
+        self._sorted_tokens: Optional[List[str]] = None
+        # 已构建的AppInfo（首次查询时从原始记录构建）
+        self._app_infos: Dict[Tuple[str, int], AppInfo] = {}
+        # 已加载的数据源及其下次增量加载的起始时间戳，供 refresh() 使用
+        self._sources: List[List[Any]] = []
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def add_records(self, records: Iterable[Dict[str, Any]], country: str,
+                    fetched_at: Optional[float] = None) -> int:
+        """
+        加入原始记录，同一应用保留抓取时间较新的记录
+        
+        Args:
+            records: iTunes API返回的原始记录
+            country: 国家代码
+            fetched_at: 抓取时间戳，默认为当前时间
+        
+        Returns:
+            加入或更新的应用数量
+        """
+        fetched_at = fetched_at or time.time()
+        country = country.lower()
+        added = 0
+        with self._lock:
+            for record in records:
+                track_id = record.get('trackId')
+                if track_id is None or record.get('wrapperType', 'software') != 'software':
+                    continue
+                key = (country, int(track_id))
+                existing = self._records.get(key)
+                if existing is not None and existing[1] >= fetched_at:
+                    continue
+                
+                self._records[key] = (record, fetched_at)
+                self._app_infos.pop(key, None)
+                if record.get('bundleId'):
+                    self._bundle_index[(country, record['bundleId'].lower())] = key[1]
+                for field in SEARCH_FIELDS:
+                    for token in tokenize(str(record.get(field) or '')):
+                        self._token_index.setdefault(token, set()).add(key)
+                added += 1
+            if added:
+                self._sorted_tokens = None
+        return added
+    
+    def load_store(self, store: LocalAppStore, country: Optional[str] = None,
+                   since: Optional[float] = None) -> int:
+        """
+        从本地应用库加载记录，之后可通过 refresh() 增量加载新写入的记录
+        
+        Args:
+            store: 本地应用库
+            country: 只加载指定国家，默认加载全部
+            since: 只加载抓取时间不早于该时间戳的记录，默认加载全部
+        
+        Returns:
+            加入或更新的应用数量
+        """
+        started_at = time.time()
+        added = 0
+        for record, record_country, fetched_at in store.iter_records(country, since):
+            added += self.add_records([record], record_country, fetched_at)
+        self._track_source(store, country, started_at)
+        return added
+    
+    def load_cache(self, cache: ResponseCache, since: Optional[float] = None) -> int:
+        """
+        从响应缓存加载此前在线查询过的结果（含已过期的缓存），
+        之后可通过 refresh() 增量加载新缓存的结果
+        
+        Args:
+            cache: 响应缓存
+            since: 只加载抓取时间不早于该时间戳的响应，默认加载全部
+        
+        Returns:
+            加入或更新的应用数量
+        """
+        started_at = time.time()
+        backend = get_backend()
+        added = 0
+        for endpoint, params, body, fetched_at in cache.iter_entries(since=since):
+            if endpoint not in ('/lookup', '/search') or 'country' not in params:
+                continue
+            try:
+                records = backend.loads(body).get('results', [])
+            except ValueError:
+                continue
+            added += self.add_records(records, params['country'], fetched_at)
+        self._track_source(cache, None, started_at)
+        return added
+    
+    def _track_source(self, source, country: Optional[str], loaded_at: float):
+        """记录数据源及其本次加载的开始时间（增量加载从该时间起，避免漏掉加载期间写入的数据）"""
+        with self._lock:
+            for entry in self._sources:
+                if entry[0] is source and entry[1] == country:
+                    entry[2] = max(entry[2], loaded_at)
+                    return
+            self._sources.append([source, country, loaded_at])
+    
+    def refresh(self) -> int:
+        """
+        从已加载过的本地应用库和响应缓存增量加载上次加载后新写入的数据
+        （例如离线快照构建后在线查询并缓存的应用）
+        
+        Returns:
+            加入或更新的应用数量
+        """
+        with self._lock:
+            sources = [tuple(entry) for entry in self._sources]
+        added = 0
+        for source, country, loaded_at in sources:
+            if isinstance(source, LocalAppStore):
+                added += self.load_store(source, country, since=loaded_at)
+            else:
+                added += self.load_cache(source, since=loaded_at)
+        return added
+    
+    def _key_for(self, app_id: str, country: str) -> Optional[Tuple[str, int]]:
+        """将trackId或bundleId解析为索引键（调用方需持有锁）"""
+        country = country.lower()
+        if app_id.isdigit():
+            key = (country, int(app_id))
+            return key if key in self._records else None
+        track_id = self._bundle_index.get((country, app_id.lower()))
+        return (country, track_id) if track_id is not None else None
+    
+    def _app_info_locked(self, key: Tuple[str, int]) -> AppInfo:
+        """获取（必要时构建）AppInfo（调用方需持有锁）"""
+        app_info = self._app_infos.get(key)
+        if app_info is None:
+            app_info = self._app_infos[key] = AppInfo.from_api_response(self._records[key][0])
+        return app_info
+    
+    def lookup(self, app_id: str, country: str = "cn") -> Optional[AppInfo]:
+        """
+        按trackId或bundleId查询
+        
+        Args:
+            app_id: 应用ID（trackId或bundleId）
+            country: 国家代码
+        
+        Returns:
+            AppInfo对象或None（快照中不存在）
+        """
+        with self._lock:
+            key = self._key_for(app_id, country)
+            return self._app_info_locked(key) if key is not None else None
+    
+    def raw_record(self, app_id: str, country: str = "cn") -> Optional[Dict[str, Any]]:
+        """
+        获取应用的原始记录
+        
+        Args:
+            app_id: 应用ID（trackId或bundleId）
+            country: 国家代码
+        
+        Returns:
+            原始记录字典或None
+        """
+        with self._lock:
+            key = self._key_for(app_id, country)
+            return self._records[key][0] if key is not None else None
+    
+    def age(self, app_id: str, country: str = "cn") -> Optional[float]:
+        """
+        获取应用数据的年龄
+        
+        Args:
+            app_id: 应用ID（trackId或bundleId）
+            country: 国家代码
+        
+        Returns:
+            距抓取时间的秒数，快照中不存在时为None
+        """
+        with self._lock:
+            key = self._key_for(app_id, country)
+            return time.time() - self._records[key][1] if key is not None else None
+    
+    def search(self, term: str, country: str = "cn", limit: int = 10) -> List[AppInfo]:
+        """
+        关键词搜索：应用名、开发者名和bundleId需包含全部搜索词（英文按单词前缀匹配），
+        结果按评分人数降序排列
+        
+        Args:
+            term: 搜索关键词
+            country: 国家代码
+            limit: 返回结果数量限制
+        
+        Returns:
+            AppInfo对象列表
+        """
+        with self._lock:
+            return [self._app_info_locked(key) for key in self._search_keys(term, country)[:limit]]
+    
+    def search_records(self, term: str, country: str = "cn", limit: int = 10,
+                       offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        关键词搜索，返回原始记录（排序规则同search）
+        
+        Args:
+            term: 搜索关键词
+            country: 国家代码
+            limit: 返回结果数量限制
+            offset: 分页偏移量
+        
+        Returns:
+            原始记录列表
+        """
+        with self._lock:
+            return [self._records[key][0] for key in self._search_keys(term, country)[offset:offset + limit]]
+    
+    def _search_keys(self, term: str, country: str) -> List[Tuple[str, int]]:
+        """获取匹配全部搜索词的应用索引键（调用方需持有锁）"""
+        country = country.lower()
+        tokens = tokenize(term)
+        if not tokens:
+            return []
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._token_index)
+        
+        matched: Optional[Set[Tuple[str, int]]] = None
+        for token in tokens:
+            postings = self._prefix_postings(token)
+            matched = postings if matched is None else matched & postings
+            if not matched:
+                return []
+        
+        keys = [key for key in matched if key[0] == country]
+        keys.sort(key=lambda key: (-(self._records[key][0].get('userRatingCount') or 0), key[1]))
+        return keys
+    
+    def _prefix_postings(self, token: str) -> Set[Tuple[str, int]]:
+        """获取以token为前缀的全部搜索词对应的应用（调用方需持有锁）"""
+        if not token.isascii():
+            return set(self._token_index.get(token, ()))
+        postings = set()
+        index = bisect.bisect_left(self._sorted_tokens, token)
+        while index < len(self._sorted_tokens) and self._sorted_tokens[index].startswith(token):
+            postings |= self._token_index[self._sorted_tokens[index]]
+            index += 1
+        return postings
+    
+    def oldest(self) -> Optional[float]:
+        """快照中最早的抓取时间戳"""
+        with self._lock:
+            return min((fetched_at for _, fetched_at in self._records.values()), default=None)
+    
+    def newest(self) -> Optional[float]:
+        """快照中最新的抓取时间戳"""
+        with self._lock:
+            return max((fetched_at for _, fetched_at in self._records.values()), default=None)
+
+
+def load_records_file(path: str) -> List[Dict[str, Any]]:
+    """
+    读取导入文件：iTunes API响应（含results字段）或原始记录列表
+    
+    Args:
+        path: JSON文件路径
+    
+    Returns:
+        原始记录列表
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get('results', []) if isinstance(data, dict) else data
+
+
+_default_snapshot = None
+_default_snapshot_lock = threading.Lock()
+
+
+def get_default_snapshot(refresh: bool = False) -> OfflineSnapshot:
+    """
+    获取进程内共享的离线快照，首次调用时从默认本地应用库和响应缓存加载
+    （加载整个应用库和缓存较慢，图形界面应在工作线程中调用）
+    
+    Args:
+        refresh: 快照已存在时是否增量加载其构建后新写入应用库和缓存的数据
+    
+    Returns:
+        OfflineSnapshot实例
+    """
+    global _default_snapshot
+    with _default_snapshot_lock:
+        if _default_snapshot is None:
+            snapshot = OfflineSnapshot()
+            snapshot.load_store(LocalAppStore())
+            snapshot.load_cache(get_default_cache())
+            _default_snapshot = snapshot
+            return snapshot
+        snapshot = _default_snapshot
+    if refresh:
+        snapshot.refresh()
+    return snapshot
+
+
+def main():
+    """命令行入口：将JSON文件导入本地应用库，供离线模式使用"""
+    parser = argparse.ArgumentParser(description='导入离线应用数据')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    import_parser = subparsers.add_parser('import', help='导入iTunes API响应或记录列表JSON文件')
+    import_parser.add_argument('path')
+    import_parser.add_argument('--country', default='cn')
+    import_parser.add_argument('--store', help='本地应用库路径，默认为用户目录下的 apps.sqlite3')
+    args = parser.parse_args()
+    
+    store = LocalAppStore(args.store) if args.store else LocalAppStore()
+    count = store.put_records(load_records_file(args.path), args.country)
+    print(f"已导入 {count} 个应用（{args.country}），本地应用库共 {store.count()} 个应用")
+    store.close()
+
+
+if __name__ == '__main__':
+    main()
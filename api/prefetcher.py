@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+后台预取模块
+窗口显示后在低优先级后台线程中按查询历史和种子列表预先查询应用并下载图标，
+使会话的首批查询直接命中缓存；交互查询进行中或限流器余量不足时暂停让路
+"""
+
+import json
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, List, Iterable, Tuple
+
+from api.client_registry import get_client
+from api.exceptions import iTunesAPIError
+from api.icon_cache import IconCache, get_default_icon_cache
+from api.itunes_api import iTunesAPI
+
+
+DEFAULT_SEEDS_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'prefetch_seeds.json')
+
+
+def load_prefetch_seeds(path: str = DEFAULT_SEEDS_PATH) -> List[Tuple[str, str]]:
+    """
+    从配置文件加载预取种子列表（格式为 {国家代码: [应用ID, ...]}）
+    
+    Args:
+        path: 种子配置文件路径
+    
+    Returns:
+        (应用ID, 国家代码) 列表
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            seeds = json.load(f)
+    except FileNotFoundError:
+        return []
+    except Exception as e:
+        print(f"加载预取种子错误: {e}")
+        return []
+    return [(str(app_id), country) for country, app_ids in seeds.items() for app_id in app_ids]
+
+
+def build_prefetch_queue(*sources: Iterable[Tuple[str, str]], limit: int = 50) -> List[Tuple[str, str]]:
+    """
+    按来源优先级合并预取列表并去重
+    
+    Args:
+        sources: 多个 (应用ID, 国家代码) 序列，靠前的来源优先
+        limit: 最多预取的条数
+    
+    Returns:
+        (应用ID, 国家代码) 列表
+    """
+    queue = {}
+    for source in sources:
+        for app_id, country in source:
+            queue.setdefault((app_id, country.lower()), None)
+    return list(queue)[:limit]
+
+
+@dataclass
+class PrefetchStats:
+    """预取统计"""
+    
+    queued: int = 0
+    warmed: int = 0
+    icons: int = 0
+    failed: int = 0
+
+
+class Prefetcher:
+    """低优先级后台预取类"""
+    
+    def __init__(self, api: Optional[iTunesAPI] = None, icon_cache: Optional[IconCache] = None,
+                 min_headroom: float = 0.5, quiet_period: float = 1.0, poll_interval: float = 0.2):
+        """
+        初始化预取器
+        
+        Args:
+            api: iTunes API客户端，默认使用进程内共享的客户端（共用响应缓存和限流器）
+            icon_cache: 图标缓存，默认使用进程内共享的图标缓存
+            min_headroom: 限流器可用令牌比例低于此值时暂停，把余量留给交互查询
+            quiet_period: 交互查询结束后需保持空闲的时长（秒）
+            poll_interval: 暂停时的检查间隔（秒）
+        """
+        self.api = api or get_client()
+        self.icon_cache = icon_cache or get_default_icon_cache()
+        self.min_headroom = min_headroom
+        self.quiet_period = quiet_period
+        self.poll_interval = poll_interval
+        self.stats = PrefetchStats()
+        
+        self._lock = threading.Lock()
+        self._interactive = 0
+        self._last_interactive = 0.0
+        self._stopped = threading.Event()
+        self._thread = None
+    
+    def interactive_started(self):
+        """交互查询开始，预取暂停"""
+        with self._lock:
+            self._interactive += 1
+            self._last_interactive = time.monotonic()
+    
+    def interactive_finished(self):
+        """交互查询结束，空闲一段时间后预取继续"""
+        with self._lock:
+            self._interactive = max(0, self._interactive - 1)
+            self._last_interactive = time.monotonic()
+    
+    def start(self, items: Iterable[Tuple[str, str]]):
+        """
+        在后台守护线程中开始预取
+        
+        Args:
+            items: (应用ID, 国家代码) 列表，按顺序预取
+        """
+        items = list(items)
+        self.stats.queued += len(items)
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run, args=(items,), name='prefetcher', daemon=True)
+        self._thread.start()
+    
+    def stop(self):
+        """停止预取（当前请求完成后退出）"""
+        self._stopped.set()
+    
+    def _should_yield(self) -> bool:
+        """是否需要为交互查询让路"""
+        with self._lock:
+            if self._interactive or time.monotonic() - self._last_interactive < self.quiet_period:
+                return True
+        return self.api.rate_limiter.headroom() < self.min_headroom
+    
+    def _wait_for_turn(self) -> bool:
+        """等待轮到预取，预取被停止或客户端进入离线模式时返回False"""
+        while self._should_yield():
+            if self._stopped.wait(self.poll_interval):
+                return False
+        return not self._stopped.is_set() and self.api.offline is None
+    
+    def _run(self, items: List[Tuple[str, str]]):
+        """预取循环"""
+        for app_id, country in items:
+            if not self._wait_for_turn():
+                return
+            try:
+                app_info = self.api.lookup_by_id(app_id, country)
+            except iTunesAPIError as e:
+                # 被限流或店面熔断时不再继续消耗配额
+                print(f"预取中止: {e}")
+                self.stats.failed += 1
+                return
+            if app_info is None:
+                self.stats.failed += 1
+                continue
+            self.stats.warmed += 1
+            
+            icon_url = app_info.artwork_url_100
+            if icon_url and not self.icon_cache.contains(icon_url):
+                if not self._wait_for_turn():
+                    return
+                if self.icon_cache.fetch(icon_url) is not None:
+                    self.stats.icons += 1
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+限流与退避模块
+提供按AIMD自适应调整速率的令牌桶，以及带抖动的指数退避重试策略
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+# 表示被限流的HTTP状态码
+THROTTLE_STATUS_CODES = (403, 429)
+# 可重试的服务端错误状态码
+RETRYABLE_STATUS_CODES = (500, 502, 503, 504)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    解析Retry-After响应头
+    
+    Args:
+        value: 响应头的值（秒数或HTTP日期）
+    
+    Returns:
+        需要等待的秒数，无法解析时为None
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RetryPolicy:
+    """带抖动的指数退避重试策略"""
+    
+    max_retries: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    
+    def delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        计算第attempt次重试前的等待时间（full jitter）
+        
+        Args:
+            attempt: 已失败的次数（从0开始）
+            retry_after: 服务端要求的最短等待时间（秒）
+        
+        Returns:
+            等待秒数
+        """
+        backoff = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** attempt)))
+        if retry_after is not None:
+            return max(backoff, min(retry_after, self.max_delay))
+        return backoff
+
+
+class AdaptiveRateLimiter:
+    """AIMD自适应令牌桶限流器（线程安全）"""
+    
+    def __init__(self, rate: float = 20.0, min_rate: float = 0.5, max_rate: float = 50.0,
+                 burst: Optional[float] = None, increase: float = 0.1, decrease: float = 0.5):
+        """
+        初始化限流器
+        
+        Args:
+            rate: 初始速率（请求/秒）
+            min_rate: 速率下限
+            max_rate: 速率上限
+            burst: 令牌桶容量，默认等于初始速率
+            increase: 每次成功请求后速率的加性增量
+            decrease: 被限流时速率的乘性衰减系数
+        """
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst if burst is not None else rate
+        self.increase = increase
+        self.decrease = decrease
+        self.throttled_count = 0
+        
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+    
+    def _refill_locked(self, now: float):
+        """按当前速率补充令牌（调用方需持有锁）"""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+    
+    def reserve(self) -> float:
+        """
+        预留一个令牌
+        
+        Returns:
+            调用方在发送请求前需要等待的秒数
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill_locked(now)
+            self._tokens -= 1
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+            return max(wait, self._blocked_until - now)
+    
+    def ensure_burst(self, burst: float):
+        """
+        将令牌桶容量扩大到不小于指定值（只增不减），新增的容量立即可用；
+        速率、限流计数和Retry-After等待期保持不变
+        
+        Args:
+            burst: 所需的最小桶容量
+        """
+        with self._lock:
+            if burst <= self.burst:
+                return
+            self._refill_locked(time.monotonic())
+            self._tokens += burst - self.burst
+            self.burst = burst
+    
+    def headroom(self) -> float:
+        """
+        当前可用令牌占桶容量的比例（不消耗令牌），供低优先级任务判断是否让路
+        
+        Returns:
+            0到1之间的比例，处于Retry-After等待期时为0
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now < self._blocked_until:
+                return 0.0
+            self._refill_locked(now)
+            return max(0.0, self._tokens) / self.burst if self.burst else 0.0
+    
+    def acquire(self):
+        """阻塞直到可以发送下一个请求"""
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+    
+    def on_success(self):
+        """请求成功：速率加性增加"""
+        with self._lock:
+            self._refill_locked(time.monotonic())
+            self.rate = min(self.max_rate, self.rate + self.increase)
+    
+    def on_throttle(self, retry_after: Optional[float] = None):
+        """
+        请求被限流：速率乘性衰减，并遵守Retry-After
+        
+        Args:
+            retry_after: 服务端要求的等待时间（秒）
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill_locked(now)
+            self.rate = max(self.min_rate, self.rate * self.decrease)
+            self.throttled_count += 1
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+
+_default_rate_limiter = None
+_default_rate_limiter_lock = threading.Lock()
+
+
+def get_default_rate_limiter() -> AdaptiveRateLimiter:
+    """
+    获取进程内共享的默认限流器，所有未指定限流器的客户端共用
+    
+    Returns:
+        AdaptiveRateLimiter实例
+    """
+    global _default_rate_limiter
+    with _default_rate_limiter_lock:
+        if _default_rate_limiter is None:
+            _default_rate_limiter = AdaptiveRateLimiter()
+        return _default_rate_limiter
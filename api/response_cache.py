@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+响应缓存模块
+基于SQLite的持久化iTunes API响应缓存，支持按接口设置TTL、过期后后台刷新和按容量淘汰
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Dict, Any, Iterator, Tuple
+
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser('~'), '.apple_app_bundle_finder')
+DEFAULT_CACHE_PATH = os.path.join(DEFAULT_CACHE_DIR, 'response_cache.sqlite3')
+
+
+@dataclass
+class CacheStats:
+    """缓存命中统计"""
+    
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    writes: int = 0
+    evictions: int = 0
+    
+    @property
+    def hit_ratio(self) -> float:
+        """命中率（过期但仍可用的命中也计入）"""
+        total = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / total if total else 0.0
+
+
+class ResponseCache:
+    """SQLite响应缓存类"""
+    
+    FRESH = 'fresh'
+    STALE = 'stale'
+    MISS = 'miss'
+    
+    # 各接口默认的新鲜期（秒）
+    DEFAULT_TTLS = {
+        '/lookup': 6 * 3600,
+        '/search': 3600,
+    }
+    
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, ttls: Optional[Dict[str, float]] = None,
+                 default_ttl: float = 3600, stale_ttl: float = 24 * 3600,
+                 max_bytes: int = 64 * 1024 * 1024):
+        """
+        初始化响应缓存
+        
+        Args:
+            path: SQLite数据库文件路径（':memory:' 表示仅内存）
+            ttls: 按接口路径设置的新鲜期（秒），未设置的接口使用default_ttl
+            default_ttl: 默认新鲜期（秒）
+            stale_ttl: 过期后仍可先返回旧数据并后台刷新的时长（秒）
+            max_bytes: 缓存响应体的总容量上限（字节）
+        """
+        if path != ':memory:':
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        
+        self.path = path
+        self.ttls = dict(self.DEFAULT_TTLS)
+        if ttls:
+            self.ttls.update(ttls)
+        self.default_ttl = default_ttl
+        self.stale_ttl = stale_ttl
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        
+        self._lock = threading.Lock()
+        self._revalidating = set()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('''
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        ''')
+        self._conn.execute('CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses(accessed_at)')
+        self._conn.commit()
+        self._total_bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM responses').fetchone()[0]
+    
+    @staticmethod
+    def make_key(endpoint: str, params: Dict[str, Any]) -> str:
+        """
+        生成缓存键：接口路径 + 规范化后的请求参数（含国家代码）
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+            
+        Returns:
+            缓存键字符串
+        """
+        normalized = sorted((str(k), str(v).strip().lower()) for k, v in params.items())
+        return json.dumps([endpoint, normalized], ensure_ascii=False, separators=(',', ':'))
+    
+    def ttl_for(self, endpoint: str) -> float:
+        """获取接口的新鲜期（秒）"""
+        return self.ttls.get(endpoint, self.default_ttl)
+    
+    def get(self, endpoint: str, params: Dict[str, Any]) -> Tuple[str, Optional[bytes]]:
+        """
+        读取缓存
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+            
+        Returns:
+            (状态, 原始响应体) 元组，状态为 FRESH / STALE / MISS，MISS时响应体为None
+        """
+        key = self.make_key(endpoint, params)
+        now = time.time()
+        
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT body, fetched_at FROM responses WHERE key = ?', (key,)
+            ).fetchone()
+            
+            if row is None:
+                self.stats.misses += 1
+                return self.MISS, None
+            
+            body, fetched_at = row
+            age = now - fetched_at
+            ttl = self.ttl_for(endpoint)
+            if age > ttl + self.stale_ttl:
+                self.stats.misses += 1
+                return self.MISS, None
+            
+            self._conn.execute('UPDATE responses SET accessed_at = ? WHERE key = ?', (now, key))
+            self._conn.commit()
+            
+            if age <= ttl:
+                self.stats.hits += 1
+                state = self.FRESH
+            else:
+                self.stats.stale_hits += 1
+                state = self.STALE
+        
+        return state, bytes(body)
+    
+    def set(self, endpoint: str, params: Dict[str, Any], body: bytes):
+        """
+        写入缓存
+        
+        Args:
+            endpoint: 接口路径
+            params: 请求参数
+            body: 原始响应体（JSON字节串）
+        """
+        key = self.make_key(endpoint, params)
+        now = time.time()
+        size = len(body)
+        
+        with self._lock:
+            old = self._conn.execute('SELECT size FROM responses WHERE key = ?', (key,)).fetchone()
+            if old is not None:
+                self._total_bytes -= old[0]
+            
+            self._conn.execute(
+                'INSERT OR REPLACE INTO responses (key, endpoint, body, size, fetched_at, accessed_at) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (key, endpoint, sqlite3.Binary(body), size, now, now)
+            )
+            self._total_bytes += size
+            self.stats.writes += 1
+            self._evict_locked()
+            self._conn.commit()
+    
+    def begin_revalidate(self, endpoint: str, params: Dict[str, Any]) -> bool:
+        """
+        标记某个键开始后台刷新
+        
+        Returns:
+            True表示调用方应发起刷新，False表示已有刷新在进行
+        """
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            if key in self._revalidating:
+                return False
+            self._revalidating.add(key)
+            return True
+    
+    def end_revalidate(self, endpoint: str, params: Dict[str, Any]):
+        """标记某个键的后台刷新结束"""
+        key = self.make_key(endpoint, params)
+        with self._lock:
+            self._revalidating.discard(key)
+    
+    def _evict_locked(self):
+        """超出容量时按最近访问时间淘汰，直到降至上限的90%（调用方需持有锁）"""
+        if self._total_bytes <= self.max_bytes:
+            return
+        
+        target = self.max_bytes * 0.9
+        rows = self._conn.execute('SELECT key, size FROM responses ORDER BY accessed_at ASC').fetchall()
+        for key, size in rows:
+            if self._total_bytes <= target:
+                break
+            self._conn.execute('DELETE FROM responses WHERE key = ?', (key,))
+            self._total_bytes -= size
+            self.stats.evictions += 1
+    
+    def iter_entries(self, endpoint: Optional[str] = None,
+                     since: Optional[float] = None) -> Iterator[Tuple[str, Dict[str, str], bytes, float]]:
+        """
+        遍历缓存中的全部响应（不更新访问时间，也不计入命中统计）
+        
+        Args:
+            endpoint: 只遍历指定接口，默认遍历全部
+            since: 只遍历抓取时间不早于该时间戳的响应，默认遍历全部
+            
+        Returns:
+            依次产出的 (接口路径, 规范化后的请求参数, 原始响应体, 抓取时间戳) 元组
+        """
+        conditions = []
+        params: tuple = ()
+        if endpoint:
+            conditions.append('endpoint = ?')
+            params += (endpoint,)
+        if since is not None:
+            conditions.append('fetched_at >= ?')
+            params += (since,)
+        query = 'SELECT key, body, fetched_at FROM responses'
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        for key, body, fetched_at in rows:
+            row_endpoint, normalized = json.loads(key)
+            yield row_endpoint, dict(normalized), bytes(body), fetched_at
+    
+    @property
+    def total_bytes(self) -> int:
+        """当前缓存的响应体总大小（字节）"""
+        return self._total_bytes
+    
+    def clear(self):
+        """清空缓存"""
+        with self._lock:
+            self._conn.execute('DELETE FROM responses')
+            self._conn.commit()
+            self._total_bytes = 0
+    
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+
+def get_default_cache() -> ResponseCache:
+    """
+    获取进程内共享的默认响应缓存
+    
+    Returns:
+        位于用户目录下的ResponseCache实例
+    """
+    global _default_cache
+    with _default_cache_lock:
+        if _default_cache is None:
+            _default_cache = ResponseCache()
+        return _default_cache
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+请求合并模块
+将同一时刻针对相同键的重复请求合并为一次调用（single-flight），结果分发给所有等待者
+"""
+
+import asyncio
+import threading
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from api.exceptions import DeadlineExceededError
+from api.hedging import Deadline
+
+
+@dataclass
+class SingleFlightStats:
+    """请求合并统计"""
+    
+    calls: int = 0
+    coalesced: int = 0
+
+
+class _Call:
+    """一次进行中的调用"""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """线程版请求合并器"""
+    
+    def __init__(self, on_coalesced: Optional[Callable[[Hashable], None]] = None):
+        """
+        初始化请求合并器
+        
+        Args:
+            on_coalesced: 请求被合并时的回调（参数为合并键），用于上报指标
+        """
+        self.stats = SingleFlightStats()
+        self.on_coalesced = on_coalesced
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+    
+    def do(self, key: Hashable, fn: Callable[[], Any], deadline: Optional[Deadline] = None) -> Any:
+        """
+        执行调用；若相同键的调用正在进行，则等待其结果而不重复执行
+        
+        等待者只按自己的时间预算等待。发起者因自身预算耗尽而失败时，该错误不会传给
+        没有预算或预算尚未用完的等待者，它们会重新发起调用。
+        
+        Args:
+            key: 合并键
+            fn: 实际执行的无参函数（应使用本次调用者自己的时间预算）
+            deadline: 本次调用者的总时间预算
+        
+        Returns:
+            fn的返回值（等待者与发起者得到同一结果，其他异常同样会传递）
+        
+        Raises:
+            DeadlineExceededError: 等待进行中的调用时超出本次调用者的预算
+        """
+        while True:
+            with self._lock:
+                call = self._calls.get(key)
+                if call is not None:
+                    self.stats.coalesced += 1
+                    leader = False
+                else:
+                    call = _Call()
+                    self._calls[key] = call
+                    self.stats.calls += 1
+                    leader = True
+            
+            if leader:
+                break
+            if self.on_coalesced is not None:
+                self.on_coalesced(key)
+            
+            if deadline is None:
+                call.done.wait()
+            elif not call.done.wait(deadline.remaining()):
+                raise DeadlineExceededError(deadline.budget)
+            
+            if call.error is None:
+                return call.result
+            if isinstance(call.error, DeadlineExceededError) and (deadline is None or not deadline.expired()):
+                # 发起者的预算错误不属于本次调用者，重新发起
+                continue
+            raise call.error
+        
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+
+class AsyncSingleFlight:
+    """asyncio版请求合并器（单个事件循环内使用）"""
+    
+    def __init__(self, on_coalesced: Optional[Callable[[Hashable], None]] = None):
+        """
+        初始化请求合并器
+        
+        Args:
+            on_coalesced: 请求被合并时的回调（参数为合并键），用于上报指标
+        """
+        self.stats = SingleFlightStats()
+        self.on_coalesced = on_coalesced
+        self._tasks: Dict[Hashable, asyncio.Future] = {}
+    
+    async def do(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        执行协程；若相同键的协程正在进行，则等待其结果而不重复执行
+        
+        Args:
+            key: 合并键
+            factory: 返回待执行协程的无参函数
+        
+        Returns:
+            协程的返回值
+        """
+        task = self._tasks.get(key)
+        if task is not None:
+            self.stats.coalesced += 1
+            if self.on_coalesced is not None:
+                self.on_coalesced(key)
+        else:
+            self.stats.calls += 1
+            task = asyncio.ensure_future(factory())
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        
+        # shield: 单个等待者被取消时不影响其他等待者
+        return await asyncio.shield(task)
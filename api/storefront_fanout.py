@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+多店面并发查询模块
+在 config/countries.json 中的全部（或指定）店面并发查询同一应用
+"""
+
+import asyncio
+from typing import Optional, Dict, Iterable
+
+from api.async_itunes_api import AsyncITunesAPI
+from api.exceptions import CircuitOpenError
+from api.rate_limiter import AdaptiveRateLimiter, get_default_rate_limiter
+from models.app_info import AppInfo
+from models.storefront_result import StorefrontResult
+from utils.countries import load_country_mapping
+
+
+class StorefrontFanout:
+    """多店面并发查询引擎"""
+    
+    def __init__(self, max_concurrency: int = 160, timeout: float = 10,
+                 rate_limiter: Optional[AdaptiveRateLimiter] = None):
+        """
+        初始化查询引擎
+        
+        Args:
+            max_concurrency: 同时在途的最大请求数（默认可覆盖全部店面）
+            timeout: 单个店面请求的截止时间（秒）
+            rate_limiter: 临时客户端使用的限流器，默认为进程内共享的限流器。
+                         一次全店面查询的请求同时发出，桶容量会扩大到不小于店面数；
+                         降速和Retry-After等待期在多次查询及其他请求之间保持
+        """
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter or get_default_rate_limiter()
+        self.rate_limiter.ensure_burst(max(len(load_country_mapping()), 1))
+    
+    async def lookup_async(self, app_id: str, countries: Optional[Iterable[str]] = None,
+                           api: Optional[AsyncITunesAPI] = None) -> Dict[str, StorefrontResult]:
+        """
+        在多个店面并发查询同一应用
+        
+        Args:
+            app_id: 应用ID（trackId或bundleId）
+            countries: 国家代码列表，默认为配置文件中的全部店面
+            api: 复用的异步客户端（使用其自身的限流器），默认临时创建
+            
+        Returns:
+            按国家代码排列的 {国家代码: StorefrontResult} 字典
+        """
+        if countries is None:
+            countries = load_country_mapping().keys()
+        countries = list(dict.fromkeys(code.lower() for code in countries))
+        
+        if api is None:
+            async with AsyncITunesAPI(timeout=self.timeout, max_concurrency=self.max_concurrency,
+                                      rate_limiter=self.rate_limiter) as own_api:
+                return await self._gather(own_api, app_id, countries)
+        return await self._gather(api, app_id, countries)
+    
+    def lookup(self, app_id: str, countries: Optional[Iterable[str]] = None) -> Dict[str, StorefrontResult]:
+        """
+        同步接口：在多个店面并发查询同一应用
+        
+        Args:
+            app_id: 应用ID（trackId或bundleId）
+            countries: 国家代码列表，默认为配置文件中的全部店面
+            
+        Returns:
+            {国家代码: StorefrontResult} 字典
+        """
+        return asyncio.run(self.lookup_async(app_id, countries))
+    
+    async def _gather(self, api: AsyncITunesAPI, app_id: str, countries: list) -> Dict[str, StorefrontResult]:
+        """并发发出全部店面请求，总耗时约等于最慢的单个请求"""
+        results = await asyncio.gather(
+            *(self._lookup_one(api, app_id, country) for country in countries)
+        )
+        return dict(zip(countries, results))
+    
+    async def _lookup_one(self, api: AsyncITunesAPI, app_id: str, country: str) -> StorefrontResult:
+        """查询单个店面，区分"未上架"和"请求失败\""""
+        try:
+            data = await api.lookup_json(app_id, country, self.timeout)
+        except CircuitOpenError as e:
+            # 熔断中的店面快速失败，不再占用整个超时时间
+            return StorefrontResult.from_error(country, str(e))
+        except Exception as e:
+            return StorefrontResult.from_error(country, repr(e))
+        
+        if data.get('resultCount', 0) > 0:
+            return StorefrontResult.from_app_info(country, AppInfo.from_api_response(data['results'][0]))
+        return StorefrontResult.from_app_info(country, None)
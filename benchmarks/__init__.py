@@ -0,0 +1 @@
+# 性能测试脚本包初始化文件
\ No newline at end of file
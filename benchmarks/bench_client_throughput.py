@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+客户端吞吐量与尾延迟测试
+启动本地模拟iTunes服务器，分别用线程池驱动iTunesAPI和用AsyncITunesAPI发起查询，
+输出吞吐量和p50/p95/p99延迟
+
+用法: python -m benchmarks.bench_client_throughput [--requests 2000] [--latency lognormal:40,0.6]
+"""
+
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from api.itunes_api import iTunesAPI
+from api.mock_server import MockITunesServer, MockServerConfig
+from api.rate_limiter import AdaptiveRateLimiter
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """计算百分位数"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def report(label: str, latencies: List[float], elapsed: float):
+    """打印一组测试结果"""
+    print(f"{label:<24} {len(latencies) / elapsed:8.1f} req/s  "
+          f"p50={percentile(latencies, 50) * 1000:7.1f}ms  "
+          f"p95={percentile(latencies, 95) * 1000:7.1f}ms  "
+          f"p99={percentile(latencies, 99) * 1000:7.1f}ms")
+
+
+def unlimited() -> AdaptiveRateLimiter:
+    """不限速的限流器（压测本地服务器时使用）"""
+    return AdaptiveRateLimiter(rate=1e6, max_rate=1e6, burst=1e6)
+
+
+def run_sync(base_url: str, ids: List[str], workers: int):
+    """线程池驱动同步客户端"""
+    api = iTunesAPI(base_url=base_url, rate_limiter=unlimited(), pool_size=workers)
+    
+    def timed(app_id: str) -> float:
+        started = time.perf_counter()
+        api.lookup_by_id(app_id, 'us')
+        return time.perf_counter() - started
+    
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        latencies = list(pool.map(timed, ids))
+    report(f"sync x{workers} threads", latencies, time.perf_counter() - started)
+
+
+def run_async(base_url: str, ids: List[str], concurrency: int):
+    """异步客户端"""
+    from api.async_itunes_api import AsyncITunesAPI
+    
+    async def bench():
+        async with AsyncITunesAPI(base_url=base_url, max_concurrency=concurrency,
+                                  rate_limiter=unlimited()) as api:
+            # 在外部限制并发，使延迟只统计请求本身而不含排队时间
+            gate = asyncio.Semaphore(concurrency)
+            
+            async def timed(app_id: str) -> float:
+                async with gate:
+                    started = time.perf_counter()
+                    await api.lookup_by_id(app_id, 'us')
+                    return time.perf_counter() - started
+            
+            started = time.perf_counter()
+            latencies = await asyncio.gather(*(timed(app_id) for app_id in ids))
+            report(f"async x{concurrency}", list(latencies), time.perf_counter() - started)
+    
+    asyncio.run(bench())
+
+
+def main():
+    """运行性能测试"""
+    parser = argparse.ArgumentParser(description='客户端吞吐量与尾延迟测试')
+    parser.add_argument('--requests', type=int, default=2000, help='请求总数')
+    parser.add_argument('--latency', default='lognormal:40,0.6', help='模拟服务器延迟分布')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='模拟服务器错误率')
+    parser.add_argument('--concurrency', type=int, default=32, help='并发数')
+    args = parser.parse_args()
+    
+    config = MockServerConfig(latency=args.latency, error_rate=args.error_rate, corpus_size=args.requests)
+    with MockITunesServer(config) as server:
+        ids = [str(record['trackId']) for record in server.records]
+        print(f"模拟服务器: {server.url}，延迟分布: {args.latency}，请求数: {len(ids)}")
+        run_sync(server.url, ids, args.concurrency)
+        try:
+            run_async(server.url, ids, args.concurrency)
+        except ImportError as e:
+            print(f"跳过异步客户端测试: {e}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+列式存储统计性能测试
+比较逐对象循环与AppInfoTable向量化分组聚合计算“各分类平均评分和文件大小中位数”的耗时
+
+用法: python -m benchmarks.bench_columnar [--count 300000] [--repeat 5]
+"""
+
+import argparse
+import statistics
+import timeit
+
+from models.app_info import AppInfo
+from models.columnar_app_info import AppInfoTable
+from utils.sample_data import make_corpus
+
+
+def loop_group_by(apps):
+    """逐对象循环的分组统计"""
+    groups = {}
+    for app in apps:
+        ratings, sizes = groups.setdefault(app.primary_genre_name, ([], []))
+        if app.average_user_rating is not None:
+            ratings.append(app.average_user_rating)
+        if app.file_size_bytes is not None:
+            sizes.append(int(app.file_size_bytes))
+    return {
+        genre: {'avg_rating': statistics.fmean(ratings) if ratings else None,
+                'median_size': statistics.median(sizes) if sizes else None}
+        for genre, (ratings, sizes) in groups.items()
+    }
+
+
+def main():
+    """运行性能测试"""
+    parser = argparse.ArgumentParser(description='列式存储统计性能测试')
+    parser.add_argument('--count', type=int, default=300000, help='应用数量')
+    parser.add_argument('--repeat', type=int, default=5, help='重复次数')
+    args = parser.parse_args()
+    
+    records = make_corpus(args.count)
+    apps = [AppInfo.from_api_response(record) for record in records]
+    
+    start = timeit.default_timer()
+    table = AppInfoTable.from_records(records)
+    print(f"应用数量: {args.count}，建表耗时: {timeit.default_timer() - start:.2f} s")
+    
+    aggregations = {'avg_rating': ('average_user_rating', 'mean'), 'median_size': ('file_size_bytes', 'median')}
+    loop = min(timeit.repeat(lambda: loop_group_by(apps), number=1, repeat=args.repeat))
+    columnar = min(timeit.repeat(lambda: table.group_by('primary_genre_name', aggregations),
+                                 number=1, repeat=args.repeat))
+    print(f"{'逐对象循环':>10} {loop * 1000:8.1f} ms")
+    print(f"{'AppInfoTable':>10} {columnar * 1000:8.1f} ms  x{loop / columnar:.1f}")
+
+
+if __name__ == '__main__':
+    main()
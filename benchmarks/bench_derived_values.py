@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+派生值缓存性能测试
+比较首次计算与命中缓存时，按版本号和文件大小排序、以及格式化展示字段的耗时
+
+用法: python -m benchmarks.bench_derived_values [--count 10000]
+"""
+
+import argparse
+import time
+
+from models.app_info import AppInfo
+from utils.sample_data import make_corpus
+
+
+def sort_apps(apps):
+    """按版本号、文件大小排序"""
+    return sorted(apps, key=lambda app: (app.get_version_tuple(), app.get_file_size() or 0))
+
+
+def render_apps(apps):
+    """模拟界面展示：信息面板、详细信息、复制文本各格式化一次"""
+    for app in apps:
+        for _ in range(3):
+            app.get_formatted_release_date()
+            app.get_formatted_file_size()
+            app.get_rating_stars()
+
+
+def timed(fn, apps) -> float:
+    """执行一次并返回耗时（秒）"""
+    started = time.perf_counter()
+    fn(apps)
+    return time.perf_counter() - started
+
+
+def main():
+    """运行性能测试"""
+    parser = argparse.ArgumentParser(description='派生值缓存性能测试')
+    parser.add_argument('--count', type=int, default=10000, help='应用数量')
+    args = parser.parse_args()
+    
+    records = make_corpus(args.count)
+    print(f"应用数量: {args.count}")
+    for label, fn in (('排序', sort_apps), ('格式化展示', render_apps)):
+        apps = AppInfo.from_api_batch(records)
+        first = timed(fn, apps)
+        cached = timed(fn, apps)
+        print(f"{label:>8}  首次 {first * 1000:8.2f} ms  缓存命中 {cached * 1000:8.2f} ms  x{first / cached:.1f}")
+
+
+if __name__ == '__main__':
+    main()
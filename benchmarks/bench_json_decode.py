@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+JSON解码后端性能测试
+比较各解码后端将200条结果的 /search 响应体解码为AppInfo列表的耗时
+
+用法: python -m benchmarks.bench_json_decode [--results 200] [--repeat 200]
+"""
+
+import argparse
+import timeit
+
+from api.json_backend import available_backends, get_backend
+from utils.sample_data import make_corpus, make_response_body
+
+
+def main():
+    """运行性能测试"""
+    parser = argparse.ArgumentParser(description='JSON解码后端性能测试')
+    parser.add_argument('--results', type=int, default=200, help='每页结果数')
+    parser.add_argument('--repeat', type=int, default=200, help='重复次数')
+    args = parser.parse_args()
+    
+    body = make_response_body(make_corpus(args.results))
+    print(f"响应体大小: {len(body) / 1024:.1f} KB，结果数: {args.results}")
+    
+    baseline = None
+    for name in available_backends():
+        backend = get_backend(name)
+        for label, fn in (
+            ('loads', lambda: backend.loads(body)),
+            ('decode_apps', lambda: backend.decode_apps(body)),
+        ):
+            best = min(timeit.repeat(fn, number=args.repeat, repeat=3)) / args.repeat
+            if name == 'stdlib' and label == 'decode_apps':
+                baseline = best
+            speedup = f"  x{baseline / best:.2f}" if baseline and label == 'decode_apps' else ''
+            print(f"{name:>8} {label:<12} {best * 1000:8.3f} ms/页{speedup}")
+
+
+if __name__ == '__main__':
+    main()
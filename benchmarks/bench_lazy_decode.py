@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+惰性模型模式性能测试
+比较msgspec后端普通模式与惰性模式解码响应体并读取常用字段（不读取重字段）的耗时、
+分配峰值和模型保留的内存（均不含响应体本身）
+
+用法: python -m benchmarks.bench_lazy_decode [--results 200] [--batch 10000] [--repeat 20]
+"""
+
+import argparse
+import gc
+import sys
+import timeit
+import tracemalloc
+
+from api.json_backend import get_backend
+from utils.sample_data import make_corpus, make_response_body
+
+
+def read_common_fields(apps):
+    """模拟批量调用方：只读取常用字段"""
+    return [(app.track_id, app.bundle_id, app.track_name, app.price, app.average_user_rating) for app in apps]
+
+
+def measure_memory(backend, body: bytes):
+    """
+    测量一次解码的分配峰值和保留内存
+    
+    Returns:
+        (峰值字节数, 保留字节数) 元组
+    """
+    gc.collect()
+    tracemalloc.start()
+    apps = backend.decode_apps(body)
+    read_common_fields(apps)
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del apps
+    return peak, retained
+
+
+def main():
+    """运行性能测试"""
+    parser = argparse.ArgumentParser(description='惰性模型模式性能测试')
+    parser.add_argument('--results', type=int, default=200, help='搜索页结果数')
+    parser.add_argument('--batch', type=int, default=10000, help='批量查询结果数')
+    parser.add_argument('--repeat', type=int, default=20, help='重复次数')
+    args = parser.parse_args()
+    
+    try:
+        backends = (('普通', get_backend('msgspec')), ('惰性', get_backend('msgspec', lazy=True)))
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    
+    for label, count in (('搜索页', args.results), ('批量查询', args.batch)):
+        body = make_response_body(make_corpus(count))
+        repeat = max(1, args.repeat * args.results // count)
+        print(f"{label}: {count} 条结果，响应体 {len(body) / 1024:.1f} KB")
+        baseline = None
+        for mode, backend in backends:
+            best = min(timeit.repeat(lambda: read_common_fields(backend.decode_apps(body)),
+                                     number=repeat, repeat=3)) / repeat
+            peak, retained = measure_memory(backend, body)
+            baseline = baseline or best
+            print(f"  {mode}  {best * 1000:8.3f} ms  x{baseline / best:.2f}  "
+                  f"分配峰值 {peak / 1024:9.1f} KB  保留 {retained / 1024:9.1f} KB")
+
+
+if __name__ == '__main__':
+    main()
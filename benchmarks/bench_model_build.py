@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+模型批量构建与序列化性能测试
+比较逐条 from_api_response、批量 from_api_batch（全部字段 / 投影部分字段）
+以及 to_api_dict 序列化的耗时
+
+用法: python -m benchmarks.bench_model_build [--count 10000] [--repeat 5]
+"""
+
+import argparse
+import timeit
+
+from models.app_info import AppInfo
+from models.compact_app_info import CompactAppInfo
+from utils.sample_data import make_corpus
+
+
+# 投影测试使用的字段（列表页展示所需）
+PROJECTED_FIELDS = ('track_id', 'track_name', 'bundle_id', 'artist_name', 'price', 'average_user_rating')
+
+
+def main():
+    """运行性能测试"""
+    parser = argparse.ArgumentParser(description='模型批量构建与序列化性能测试')
+    parser.add_argument('--count', type=int, default=10000, help='记录数量')
+    parser.add_argument('--repeat', type=int, default=5, help='重复次数')
+    args = parser.parse_args()
+    
+    records = make_corpus(args.count)
+    apps = AppInfo.from_api_batch(records)
+    print(f"记录数量: {args.count}")
+    
+    cases = (
+        ('逐条 from_api_response', lambda: [AppInfo.from_api_response(record) for record in records]),
+        ('from_api_batch', lambda: AppInfo.from_api_batch(records)),
+        (f'from_api_batch({len(PROJECTED_FIELDS)}个字段)', lambda: AppInfo.from_api_batch(records, PROJECTED_FIELDS)),
+        ('CompactAppInfo 逐条', lambda: [CompactAppInfo.from_api_response(record) for record in records]),
+        ('CompactAppInfo 批量', lambda: CompactAppInfo.from_api_batch(records)),
+        ('to_api_dict', lambda: [app.to_api_dict() for app in apps]),
+        (f'to_api_dict({len(PROJECTED_FIELDS)}个字段)', lambda: [app.to_api_dict(PROJECTED_FIELDS) for app in apps]),
+    )
+    baseline = None
+    for label, fn in cases:
+        best = min(timeit.repeat(fn, number=1, repeat=args.repeat))
+        baseline = baseline or best
+        print(f"{label:>28} {best * 1e6 / args.count:7.2f} µs/条  x{baseline / best:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+应用模型内存测试
+从JSON响应体解码出一批应用记录，分别构建AppInfo和CompactAppInfo，
+比较模型对象保留的内存（tracemalloc统计，含模型引用的字符串和列表）和构建耗时
+
+用法: python -m benchmarks.bench_model_memory [--count 100000]
+"""
+
+import argparse
+import gc
+import json
+import sys
+import time
+import tracemalloc
+
+from models.app_info import AppInfo
+from models.compact_app_info import CompactAppInfo
+from utils.sample_data import make_corpus, make_response_body
+
+
+def shallow_size(obj) -> int:
+    """对象本身（含实例 __dict__，不含字段取值）占用的字节数"""
+    size = sys.getsizeof(obj)
+    if hasattr(obj, '__dict__'):
+        size += sys.getsizeof(obj.__dict__)
+    return size
+
+
+def measure(model, body: bytes):
+    """
+    测量一种模型保留的内存和构建耗时
+    
+    Args:
+        model: 模型类（需提供 from_api_response）
+        body: JSON响应体
+    
+    Returns:
+        (保留字节数, 单个对象本身字节数, 构建秒数) 元组
+    """
+    gc.collect()
+    tracemalloc.start()
+    records = json.loads(body)['results']
+    started = time.perf_counter()
+    apps = [model.from_api_response(record) for record in records]
+    elapsed = time.perf_counter() - started
+    # 释放原始记录后剩余的内存即为模型保留的内存
+    del records
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    shallow = shallow_size(apps[0])
+    del apps
+    return retained, shallow, elapsed
+
+
+def main():
+    """运行内存测试"""
+    parser = argparse.ArgumentParser(description='应用模型内存测试')
+    parser.add_argument('--count', type=int, default=100000, help='应用数量')
+    args = parser.parse_args()
+    
+    body = make_response_body(make_corpus(args.count))
+    print(f"应用数量: {args.count}，响应体大小: {len(body) / 1024 / 1024:.1f} MB")
+    
+    baseline = None
+    for model in (AppInfo, CompactAppInfo):
+        retained, shallow, elapsed = measure(model, body)
+        baseline = baseline or retained
+        print(f"{model.__name__:>15} {retained / args.count:8.0f} B/个  对象本身 {shallow:5d} B  "
+              f"合计 {retained / 1024 / 1024:7.1f} MB  x{baseline / retained:.2f}  "
+              f"构建 {elapsed * 1e6 / args.count:6.2f} µs/个")
+
+
+if __name__ == '__main__':
+    main()
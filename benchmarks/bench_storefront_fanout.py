@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+多店面并发查询耗时检查
+启动本地模拟iTunes服务器，用默认配置的StorefrontFanout查询全部店面，
+检查总耗时约等于单个请求的耗时（超出部分大于 --max-overhead 毫秒时以非零状态退出；
+超出部分主要是同时建立全部连接的开销）
+
+用法: python -m benchmarks.bench_storefront_fanout [--latency fixed:100] [--max-overhead 500]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from api.itunes_api import BASE_URL_ENV_VAR
+from api.mock_server import MockITunesServer, MockServerConfig
+from api.storefront_fanout import StorefrontFanout
+from utils.countries import load_country_mapping
+
+
+def main():
+    """运行耗时检查"""
+    parser = argparse.ArgumentParser(description='多店面并发查询耗时检查')
+    parser.add_argument('--latency', default='fixed:100', help='模拟服务器延迟分布（毫秒）')
+    parser.add_argument('--max-overhead', type=float, default=500, help='总耗时比单个请求多出的上限（毫秒）')
+    args = parser.parse_args()
+    
+    countries = list(load_country_mapping())
+    with MockITunesServer(MockServerConfig(latency=args.latency, corpus_size=10)) as server:
+        # 通过环境变量指向模拟服务器，使StorefrontFanout按默认方式创建客户端和限流器
+        os.environ[BASE_URL_ENV_VAR] = server.url
+        fanout = StorefrontFanout()
+        
+        started = time.perf_counter()
+        fanout.lookup('300000001', countries[:1])
+        single = time.perf_counter() - started
+        
+        started = time.perf_counter()
+        results = fanout.lookup('300000001', countries)
+        elapsed = time.perf_counter() - started
+    
+    failed = sum(1 for result in results.values() if result.error)
+    overhead = (elapsed - single) * 1000
+    print(f"店面数: {len(countries)}，失败: {failed}")
+    print(f"单个店面: {single * 1000:8.1f} ms")
+    print(f"全部店面: {elapsed * 1000:8.1f} ms  多出 {overhead:.1f} ms")
+    if failed or overhead > args.max_overhead:
+        print(f"未通过：总耗时比单个请求多出超过 {args.max_overhead:.0f} ms，或存在失败的店面")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -5,13 +5,142 @@
 定义应用信息的数据结构和处理方法
 """
 
-from dataclasses import dataclass
-from typing import Optional, List, Dict, Any
+import re
+from dataclasses import dataclass, fields as dataclass_fields
+from typing import Optional, List, Dict, Any, Callable, Iterable, Tuple
 from datetime import datetime
 
 
+def _parse_release_date(value: Optional[str]) -> Optional[datetime]:
+    """解析ISO格式的日期时间，无法解析时返回None"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _parse_file_size(value: Any) -> Optional[int]:
+    """将文件大小（API中为字符串）转换为整数字节数，无法转换时返回None"""
+    if not value:
+        return None
+    try:
+        return int(float(value))
+    except (ValueError, TypeError):
+        return None
+
+
+def _parse_version(value: Optional[str]) -> Tuple[int, ...]:
+    """将版本号转换为可排序的整数元组（如 '1.10.2' -> (1, 10, 2)），每段只取开头的数字"""
+    if not value:
+        return ()
+    parts = []
+    for part in str(value).split('.'):
+        digits = re.match(r'\d*', part.strip()).group()
+        parts.append(int(digits) if digits else 0)
+    return tuple(parts)
+
+
+def _format_rating_stars(rating: Optional[float]) -> str:
+    """将平均评分格式化为星级"""
+    if not rating:
+        return "暂无评分"
+    
+    stars = "★" * int(rating)
+    stars += "☆" * (5 - int(rating))
+    return f"{stars} ({rating:.1f})"
+
+
+class AppInfoFormattingMixin:
+    """
+    AppInfo各种表示形式共用的派生值和格式化方法（只依赖属性访问，不定义字段）
+    
+    派生值按实例缓存在 _derived 中，并记录计算时的源字段取值；源字段被重新赋值后自动重新计算。
+    """
+    
+    __slots__ = ()
+    
+    def _derived_value(self, name: str, source: Any, compute: Callable[[Any], Any]) -> Any:
+        """
+        获取缓存的派生值
+        
+        Args:
+            name: 派生值名称
+            source: 源字段的当前取值
+            compute: 由源字段取值计算派生值的函数
+        
+        Returns:
+            派生值
+        """
+        try:
+            cache = self._derived
+        except AttributeError:
+            cache = self._derived = {}
+        entry = cache.get(name)
+        if entry is not None and entry[0] is source:
+            return entry[1]
+        value = compute(source)
+        cache[name] = (source, value)
+        return value
+    
+    def get_release_datetime(self) -> Optional[datetime]:
+        """获取当前版本发布时间（无法解析时为None）"""
+        return self._derived_value('release_datetime', self.current_version_release_date, _parse_release_date)
+    
+    def get_file_size(self) -> Optional[int]:
+        """获取文件大小的字节数（无法解析时为None）"""
+        return self._derived_value('file_size', self.file_size_bytes, _parse_file_size)
+    
+    def get_version_tuple(self) -> Tuple[int, ...]:
+        """获取可用于排序的版本号元组（没有版本号时为空元组）"""
+        return self._derived_value('version_tuple', self.version, _parse_version)
+    
+    def get_formatted_file_size(self) -> str:
+        """获取格式化的文件大小"""
+        return self._derived_value('formatted_file_size', self.file_size_bytes, self._format_file_size)
+    
+    def _format_file_size(self, source: Any) -> str:
+        if not source:
+            return "未知"
+        
+        # 确保size是数字类型
+        size = self.get_file_size()
+        if size is None:
+            return "未知"
+        
+        size = float(size)
+        units = ['B', 'KB', 'MB', 'GB']
+        unit_index = 0
+        
+        while size >= 1024 and unit_index < len(units) - 1:
+            size /= 1024
+            unit_index += 1
+        
+        return f"{size:.1f} {units[unit_index]}"
+    
+    def get_formatted_release_date(self) -> str:
+        """获取格式化的发布日期"""
+        return self._derived_value(
+            'formatted_release_date', self.current_version_release_date, self._format_release_date
+        )
+    
+    def _format_release_date(self, source: Optional[str]) -> str:
+        if not source:
+            return "未知"
+        
+        dt = self.get_release_datetime()
+        if dt is None:
+            return source
+        return dt.strftime('%Y年%m月%d日')
+    
+    def get_rating_stars(self) -> str:
+        """获取星级评分显示"""
+        return self._derived_value('rating_stars', self.average_user_rating, _format_rating_stars)
+
+
 @dataclass
-class AppInfo:
+class AppInfo(AppInfoFormattingMixin):
     """应用信息数据类"""
     
     # 基本信息
@@ -71,80 +200,131 @@ class AppInfo:
     @classmethod
     def from_api_response(cls, data: Dict[str, Any]) -> 'AppInfo':
         """从API响应数据创建AppInfo实例"""
-        return cls(
-            track_id=data.get('trackId'),
-            track_name=data.get('trackName'),
-            bundle_id=data.get('bundleId'),
-            artist_name=data.get('artistName'),
-            artist_id=data.get('artistId'),
-            description=data.get('description'),
-            short_description=data.get('shortDescription'),
-            release_notes=data.get('releaseNotes'),
-            version=data.get('version'),
-            current_version_release_date=data.get('currentVersionReleaseDate'),
-            minimum_os_version=data.get('minimumOsVersion'),
-            price=data.get('price'),
-            currency=data.get('currency'),
-            formatted_price=data.get('formattedPrice'),
-            primary_genre_name=data.get('primaryGenreName'),
-            primary_genre_id=data.get('primaryGenreId'),
-            genres=data.get('genres'),
-            genre_ids=data.get('genreIds'),
-            average_user_rating=data.get('averageUserRating'),
-            user_rating_count=data.get('userRatingCount'),
-            average_user_rating_for_current_version=data.get('averageUserRatingForCurrentVersion'),
-            user_rating_count_for_current_version=data.get('userRatingCountForCurrentVersion'),
-            artwork_url_60=data.get('artworkUrl60'),
-            artwork_url_100=data.get('artworkUrl100'),
-            artwork_url_512=data.get('artworkUrl512'),
-            screenshot_urls=data.get('screenshotUrls'),
-            ipad_screenshot_urls=data.get('ipadScreenshotUrls'),
-            file_size_bytes=data.get('fileSizeBytes'),
-            content_advisory_rating=data.get('contentAdvisoryRating'),
-            supported_devices=data.get('supportedDevices'),
-            is_game_center_enabled=data.get('isGameCenterEnabled'),
-            track_view_url=data.get('trackViewUrl'),
-            seller_url=data.get('sellerUrl'),
-            support_url=data.get('supportUrl')
-        )
+        return cls(*map(data.get, API_KEYS))
     
-    def get_formatted_file_size(self) -> str:
-        """获取格式化的文件大小"""
-        if not self.file_size_bytes:
-            return "未知"
+    @classmethod
+    def from_api_batch(cls, records: Iterable[Dict[str, Any]],
+                       fields: Optional[Iterable[str]] = None) -> List['AppInfo']:
+        """
+        批量从API响应数据创建AppInfo实例
         
-        # 确保size是数字类型
-        try:
-            size = float(self.file_size_bytes)
-        except (ValueError, TypeError):
-            return "未知"
+        直接填充实例字典，不经过 __init__ 的逐参数处理；只投影部分字段时，
+        其余字段不写入实例，读取时为类上的默认值None。
         
-        units = ['B', 'KB', 'MB', 'GB']
-        unit_index = 0
+        Args:
+            records: API响应中的 results 记录
+            fields: 要读取的字段名，默认读取全部字段
         
-        while size >= 1024 and unit_index < len(units) - 1:
-            size /= 1024
-            unit_index += 1
+        Returns:
+            AppInfo对象列表
         
-        return f"{size:.1f} {units[unit_index]}"
+        Raises:
+            ValueError: 字段名不存在
+        """
+        names, keys = project_fields(fields)
+        new = object.__new__
+        apps = []
+        for record in records:
+            app = new(cls)
+            app.__dict__.update(zip(names, map(record.get, keys)))
+            apps.append(app)
+        return apps
     
-    def get_formatted_release_date(self) -> str:
-        """获取格式化的发布日期"""
-        if not self.current_version_release_date:
-            return "未知"
+    def to_dict(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        序列化为以字段名为键的字典
         
-        try:
-            # 解析ISO格式的日期时间
-            dt = datetime.fromisoformat(self.current_version_release_date.replace('Z', '+00:00'))
-            return dt.strftime('%Y年%m月%d日')
-        except:
-            return self.current_version_release_date
+        Args:
+            fields: 要输出的字段名，默认输出全部字段
+        
+        Returns:
+            字段名 -> 取值 的字典
+        """
+        names, _ = project_fields(fields)
+        return {name: getattr(self, name) for name in names}
     
-    def get_rating_stars(self) -> str:
-        """获取星级评分显示"""
-        if not self.average_user_rating:
-            return "暂无评分"
+    def to_api_dict(self, fields: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        序列化为API记录格式（camelCase键名，省略空值），可再由 from_api_response 读回
+        
+        Args:
+            fields: 要输出的字段名，默认输出全部字段
         
-        stars = "★" * int(self.average_user_rating)
-        stars += "☆" * (5 - int(self.average_user_rating))
-        return f"{stars} ({self.average_user_rating:.1f})"
\ No newline at end of file
+        Returns:
+            API键名 -> 取值 的字典
+        """
+        names, keys = project_fields(fields)
+        record = {}
+        for name, key in zip(names, keys):
+            value = getattr(self, name)
+            if value is not None:
+                record[key] = value
+        return record
+
+
+# 字段名与API键名的对照，顺序与AppInfo字段一致；模型构建、序列化和各解码后端共用
+FIELD_MAP = (
+    ('track_id', 'trackId'),
+    ('track_name', 'trackName'),
+    ('bundle_id', 'bundleId'),
+    ('artist_name', 'artistName'),
+    ('artist_id', 'artistId'),
+    ('description', 'description'),
+    ('short_description', 'shortDescription'),
+    ('release_notes', 'releaseNotes'),
+    ('version', 'version'),
+    ('current_version_release_date', 'currentVersionReleaseDate'),
+    ('minimum_os_version', 'minimumOsVersion'),
+    ('price', 'price'),
+    ('currency', 'currency'),
+    ('formatted_price', 'formattedPrice'),
+    ('primary_genre_name', 'primaryGenreName'),
+    ('primary_genre_id', 'primaryGenreId'),
+    ('genres', 'genres'),
+    ('genre_ids', 'genreIds'),
+    ('average_user_rating', 'averageUserRating'),
+    ('user_rating_count', 'userRatingCount'),
+    ('average_user_rating_for_current_version', 'averageUserRatingForCurrentVersion'),
+    ('user_rating_count_for_current_version', 'userRatingCountForCurrentVersion'),
+    ('artwork_url_60', 'artworkUrl60'),
+    ('artwork_url_100', 'artworkUrl100'),
+    ('artwork_url_512', 'artworkUrl512'),
+    ('screenshot_urls', 'screenshotUrls'),
+    ('ipad_screenshot_urls', 'ipadScreenshotUrls'),
+    ('file_size_bytes', 'fileSizeBytes'),
+    ('content_advisory_rating', 'contentAdvisoryRating'),
+    ('supported_devices', 'supportedDevices'),
+    ('is_game_center_enabled', 'isGameCenterEnabled'),
+    ('track_view_url', 'trackViewUrl'),
+    ('seller_url', 'sellerUrl'),
+    ('support_url', 'supportUrl'),
+)
+
+FIELD_NAMES = tuple(name for name, _ in FIELD_MAP)
+API_KEYS = tuple(key for _, key in FIELD_MAP)
+_API_KEY_BY_FIELD = dict(FIELD_MAP)
+
+if FIELD_NAMES != tuple(field.name for field in dataclass_fields(AppInfo)):
+    raise RuntimeError("FIELD_MAP 与 AppInfo 字段不一致")
+
+
+def project_fields(fields: Optional[Iterable[str]] = None) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    获取字段子集对应的 (字段名, API键名)
+    
+    Args:
+        fields: 字段名，None表示全部字段
+    
+    Returns:
+        (字段名元组, API键名元组)
+    
+    Raises:
+        ValueError: 字段名不存在
+    """
+    if fields is None:
+        return FIELD_NAMES, API_KEYS
+    names = tuple(fields)
+    unknown = [name for name in names if name not in _API_KEY_BY_FIELD]
+    if unknown:
+        raise ValueError(f"AppInfo没有字段: {', '.join(unknown)}")
+    return names, tuple(_API_KEY_BY_FIELD[name] for name in names)
@@ -0,0 +1,568 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+列式应用信息存储
+将大量AppInfo或API原始记录按列存入NumPy数组，用于批量统计分析
+（如按分类统计平均评分、按店面统计文件大小分布）
+
+数值列为类型化数组加有效值掩码，字符串列为字典编码（整数编码 + 取值表），
+列表字段保存为对象数组。需要安装可选依赖 numpy：pip install .[analytics]
+"""
+
+from typing import Optional, List, Dict, Any, Iterable, Sequence, Tuple, Union
+
+try:
+    import numpy as np
+except ImportError:  # numpy为可选依赖
+    np = None
+
+from models.app_info import AppInfo, FIELD_MAP, FIELD_NAMES
+
+
+# 数值列及其NumPy类型（fileSizeBytes在API中为字符串，入库时转换为整数）
+NUMERIC_COLUMNS = {
+    'track_id': 'int64',
+    'artist_id': 'int64',
+    'price': 'float64',
+    'primary_genre_id': 'int64',
+    'average_user_rating': 'float64',
+    'user_rating_count': 'int64',
+    'average_user_rating_for_current_version': 'float64',
+    'user_rating_count_for_current_version': 'int64',
+    'file_size_bytes': 'int64',
+    'is_game_center_enabled': 'bool',
+}
+
+# 列表字段，保存为对象数组
+OBJECT_COLUMNS = ('genres', 'genre_ids', 'screenshot_urls', 'ipad_screenshot_urls', 'supported_devices')
+
+# 不属于AppInfo的附加列（记录来源店面）
+EXTRA_STRING_COLUMNS = ('country',)
+
+# 其余字段均为字典编码的字符串列
+STRING_COLUMNS = tuple(
+    name for name in FIELD_NAMES if name not in NUMERIC_COLUMNS and name not in OBJECT_COLUMNS
+) + EXTRA_STRING_COLUMNS
+
+AGGREGATIONS = ('count', 'sum', 'mean', 'min', 'max', 'median')
+
+
+def _require_numpy():
+    """检查numpy是否可用"""
+    if np is None:
+        raise ImportError("AppInfoTable 需要安装 numpy: pip install numpy")
+
+
+def _numeric_column(values: List[Any], dtype: str) -> Tuple[Any, Any]:
+    """
+    将取值列表转换为 (数组, 有效值掩码)，无法转换的取值视为空值
+    
+    Args:
+        values: 取值列表（可含None）
+        dtype: NumPy类型名
+    
+    Returns:
+        (values数组, valid布尔数组) 元组；空值位置浮点列为NaN，其他列为0
+    """
+    valid = np.fromiter((value is not None for value in values), dtype=bool, count=len(values))
+    data = np.full(len(values), np.nan if dtype == 'float64' else 0, dtype=dtype)
+    present = [value for value in values if value is not None]
+    if not present:
+        return data, valid
+    
+    try:
+        data[valid] = np.array(present, dtype=dtype)
+    except (ValueError, TypeError):
+        # 存在非法取值时逐个转换
+        kind = {'int64': int, 'float64': float, 'bool': bool}[dtype]
+        for index in np.flatnonzero(valid):
+            try:
+                data[index] = kind(values[index])
+            except (ValueError, TypeError):
+                valid[index] = False
+    return data, valid
+
+
+def _encode_strings(values: List[Optional[str]]) -> Tuple[Any, List[str]]:
+    """
+    字典编码字符串列
+    
+    Args:
+        values: 字符串列表（可含None）
+    
+    Returns:
+        (int32编码数组, 取值表) 元组；空值编码为-1
+    """
+    index: Dict[str, int] = {}
+    codes = np.fromiter(
+        (-1 if value is None else index.setdefault(value, len(index)) for value in values),
+        dtype=np.int32, count=len(values)
+    )
+    return codes, list(index)
+
+
+def _object_column(values: List[Any]) -> Any:
+    """将取值列表转换为对象数组（逐个赋值，避免NumPy展开嵌套列表）"""
+    data = np.empty(len(values), dtype=object)
+    for index, value in enumerate(values):
+        data[index] = value
+    return data
+
+
+class AppInfoTable:
+    """
+    列式应用信息表
+    
+    通过 from_app_infos / from_records / from_store 创建。filter 返回共享取值表的新表；
+    group_by / aggregate 在有效值上做向量化统计，空值不参与计算。
+    """
+    
+    def __init__(self, length: int, numeric: Dict[str, Tuple[Any, Any]],
+                 strings: Dict[str, Tuple[Any, List[str]]], objects: Dict[str, Any]):
+        """
+        初始化列式表（一般不直接调用）
+        
+        Args:
+            length: 行数
+            numeric: 数值列名 -> (values数组, valid数组)
+            strings: 字符串列名 -> (编码数组, 取值表)
+            objects: 列表字段列名 -> 对象数组
+        """
+        _require_numpy()
+        self._length = length
+        self._numeric = numeric
+        self._strings = strings
+        self._objects = objects
+    
+    @classmethod
+    def _from_columns(cls, columns: Dict[str, List[Any]], length: int) -> 'AppInfoTable':
+        """从按列组织的Python取值列表创建"""
+        _require_numpy()
+        return cls(
+            length,
+            {name: _numeric_column(columns[name], dtype) for name, dtype in NUMERIC_COLUMNS.items()},
+            {name: _encode_strings(columns[name]) for name in STRING_COLUMNS},
+            {name: _object_column(columns[name]) for name in OBJECT_COLUMNS},
+        )
+    
+    @staticmethod
+    def _country_column(country: Union[str, Sequence[Optional[str]], None], length: int) -> List[Optional[str]]:
+        """将店面参数展开为每行一个取值"""
+        if country is None or isinstance(country, str):
+            return [country.lower() if country else None] * length
+        if len(country) != length:
+            raise ValueError(f"country 长度 {len(country)} 与记录数 {length} 不一致")
+        return [value.lower() if value else None for value in country]
+    
+    @classmethod
+    def from_app_infos(cls, apps: Iterable[AppInfo],
+                       country: Union[str, Sequence[Optional[str]], None] = None) -> 'AppInfoTable':
+        """
+        从AppInfo（或具有相同属性的对象，如CompactAppInfo）创建
+        
+        Args:
+            apps: 应用信息对象
+            country: 来源店面，可为单个国家代码或与记录一一对应的列表
+        
+        Returns:
+            AppInfoTable实例
+        """
+        apps = list(apps)
+        columns = {name: [getattr(app, name) for app in apps] for name in FIELD_NAMES}
+        columns['country'] = cls._country_column(country, len(apps))
+        return cls._from_columns(columns, len(apps))
+    
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]],
+                     country: Union[str, Sequence[Optional[str]], None] = None) -> 'AppInfoTable':
+        """
+        从API原始记录创建（不经过AppInfo）
+        
+        Args:
+            records: /lookup 或 /search 响应中的 results 记录
+            country: 来源店面，可为单个国家代码或与记录一一对应的列表
+        
+        Returns:
+            AppInfoTable实例
+        """
+        records = list(records)
+        columns = {name: [record.get(key) for record in records] for name, key in FIELD_MAP}
+        columns['country'] = cls._country_column(country, len(records))
+        return cls._from_columns(columns, len(records))
+    
+    @classmethod
+    def from_store(cls, store, country: Optional[str] = None) -> 'AppInfoTable':
+        """
+        从本地应用库（LocalAppStore）创建，country列为记录所属店面
+        
+        Args:
+            store: LocalAppStore实例
+            country: 只读取指定国家，默认读取全部
+        
+        Returns:
+            AppInfoTable实例
+        """
+        records = []
+        countries = []
+        for record, row_country, _ in store.iter_records(country):
+            records.append(record)
+            countries.append(row_country)
+        return cls.from_records(records, countries)
+    
+    @classmethod
+    def concat(cls, tables: Sequence['AppInfoTable']) -> 'AppInfoTable':
+        """
+        按行拼接多个表（如多个店面各自的表），字符串列的取值表会合并重编码
+        
+        Args:
+            tables: 要拼接的表
+        
+        Returns:
+            新的AppInfoTable实例
+        """
+        _require_numpy()
+        numeric = {
+            name: (
+                np.concatenate([table._numeric[name][0] for table in tables]).astype(dtype),
+                np.concatenate([table._numeric[name][1] for table in tables]).astype(bool),
+            )
+            for name, dtype in NUMERIC_COLUMNS.items()
+        }
+        strings = {}
+        for name in STRING_COLUMNS:
+            index: Dict[str, int] = {}
+            parts = []
+            for table in tables:
+                codes, categories = table._strings[name]
+                # 末尾追加-1，使空值编码-1经过映射后仍为-1
+                mapping = np.array([index.setdefault(value, len(index)) for value in categories] + [-1], dtype=np.int32)
+                parts.append(mapping[codes])
+            strings[name] = (np.concatenate(parts).astype(np.int32), list(index))
+        objects = {
+            name: np.concatenate([table._objects[name] for table in tables]).astype(object)
+            for name in OBJECT_COLUMNS
+        }
+        return cls(sum(len(table) for table in tables), numeric, strings, objects)
+    
+    def __len__(self) -> int:
+        return self._length
+    
+    def __repr__(self) -> str:
+        return f"AppInfoTable(rows={self._length})"
+    
+    @property
+    def column_names(self) -> Tuple[str, ...]:
+        """全部列名"""
+        return tuple(NUMERIC_COLUMNS) + STRING_COLUMNS + OBJECT_COLUMNS
+    
+    def _check_column(self, name: str):
+        """检查列名是否存在"""
+        if name not in self._numeric and name not in self._strings and name not in self._objects:
+            raise KeyError(f"没有列 {name!r}")
+    
+    # ---- 列访问 ----
+    
+    def values(self, name: str):
+        """
+        获取数值列的数组（空值位置浮点列为NaN，其他列为0，需配合 valid 使用）
+        
+        Args:
+            name: 数值列名
+        
+        Returns:
+            NumPy数组
+        """
+        if name not in self._numeric:
+            raise KeyError(f"{name!r} 不是数值列")
+        return self._numeric[name][0]
+    
+    def valid(self, name: str):
+        """
+        获取列的有效值掩码（True表示非空）
+        
+        Args:
+            name: 列名
+        
+        Returns:
+            布尔数组
+        """
+        self._check_column(name)
+        if name in self._numeric:
+            return self._numeric[name][1]
+        if name in self._strings:
+            return self._strings[name][0] >= 0
+        return np.fromiter((value is not None for value in self._objects[name]), dtype=bool, count=self._length)
+    
+    def masked(self, name: str):
+        """
+        获取数值列的掩码数组（numpy.ma），空值被屏蔽
+        
+        Args:
+            name: 数值列名
+        
+        Returns:
+            numpy.ma.MaskedArray
+        """
+        return np.ma.MaskedArray(self.values(name), mask=~self._numeric[name][1])
+    
+    def codes(self, name: str):
+        """
+        获取字符串列的编码数组（空值为-1）及取值表
+        
+        Args:
+            name: 字符串列名
+        
+        Returns:
+            (int32编码数组, 取值表) 元组
+        """
+        if name not in self._strings:
+            raise KeyError(f"{name!r} 不是字符串列")
+        return self._strings[name]
+    
+    def column(self, name: str):
+        """
+        获取解码后的列（数值列为空值替换为None的对象数组，字符串列为解码后的对象数组）
+        
+        Args:
+            name: 列名
+        
+        Returns:
+            NumPy数组
+        """
+        self._check_column(name)
+        if name in self._objects:
+            return self._objects[name]
+        if name in self._strings:
+            codes, categories = self._strings[name]
+            # 编码-1取到取值表末尾追加的None
+            return np.array(categories + [None], dtype=object)[codes]
+        values, valid = self._numeric[name]
+        decoded = values.astype(object)
+        decoded[~valid] = None
+        return decoded
+    
+    # ---- 过滤 ----
+    
+    def equals(self, name: str, value: Any):
+        """
+        生成“列等于某值”的行掩码（空值不匹配）
+        
+        Args:
+            name: 列名（数值列或字符串列）
+            value: 比较值
+        
+        Returns:
+            布尔数组
+        """
+        return self.isin(name, [value])
+    
+    def isin(self, name: str, values: Iterable[Any]):
+        """
+        生成“列取值属于给定集合”的行掩码（空值不匹配）
+        
+        Args:
+            name: 列名（数值列或字符串列）
+            values: 取值集合
+        
+        Returns:
+            布尔数组
+        """
+        values = list(values)
+        if name in self._strings:
+            codes, categories = self._strings[name]
+            wanted = set(values)
+            matched = [code for code, category in enumerate(categories) if category in wanted]
+            return np.isin(codes, np.array(matched, dtype=np.int32))
+        data = self.values(name)
+        return self._numeric[name][1] & np.isin(data, np.array(values, dtype=data.dtype))
+    
+    def between(self, name: str, low: Optional[float] = None, high: Optional[float] = None):
+        """
+        生成“数值列在 [low, high] 区间内”的行掩码（空值不匹配）
+        
+        Args:
+            name: 数值列名
+            low: 下界（含），None表示不限
+            high: 上界（含），None表示不限
+        
+        Returns:
+            布尔数组
+        """
+        data = self.values(name)
+        mask = self._numeric[name][1].copy()
+        if low is not None:
+            mask &= data >= low
+        if high is not None:
+            mask &= data <= high
+        return mask
+    
+    def filter(self, selector) -> 'AppInfoTable':
+        """
+        按行掩码或行号数组选取行，返回新表（字符串列的取值表与原表共享）
+        
+        Args:
+            selector: 长度与表相同的布尔数组，或行号数组
+        
+        Returns:
+            新的AppInfoTable实例
+        """
+        selector = np.asarray(selector)
+        if selector.dtype == bool and len(selector) != self._length:
+            raise ValueError(f"掩码长度 {len(selector)} 与行数 {self._length} 不一致")
+        numeric = {name: (values[selector], valid[selector]) for name, (values, valid) in self._numeric.items()}
+        strings = {name: (codes[selector], categories) for name, (codes, categories) in self._strings.items()}
+        objects = {name: values[selector] for name, values in self._objects.items()}
+        length = int(selector.sum()) if selector.dtype == bool else len(selector)
+        return AppInfoTable(length, numeric, strings, objects)
+    
+    # ---- 分组与聚合 ----
+    
+    def _group_ids(self, key: str) -> Tuple[Any, List[Any]]:
+        """
+        计算每行的分组编号，编号0为空值分组
+        
+        Returns:
+            (分组编号数组, 分组键列表) 元组
+        """
+        if key in self._strings:
+            codes, categories = self._strings[key]
+            return codes.astype(np.int64) + 1, [None] + categories
+        if key not in self._numeric:
+            self._check_column(key)
+            raise KeyError(f"不能按列表字段 {key!r} 分组")
+        values, valid = self._numeric[key]
+        keys, inverse = np.unique(values[valid], return_inverse=True)
+        group_ids = np.zeros(self._length, dtype=np.int64)
+        group_ids[valid] = inverse.reshape(-1) + 1
+        return group_ids, [None] + keys.tolist()
+    
+    def _group_aggregate(self, group_ids, group_count: int, column: str, func: str):
+        """
+        按分组计算一个聚合值
+        
+        Returns:
+            长度为 group_count 的数组，没有有效值的分组为NaN（count为0）
+        """
+        if func not in AGGREGATIONS:
+            raise ValueError(f"不支持的聚合函数 {func!r}，可选: {', '.join(AGGREGATIONS)}")
+        valid = self.valid(column)
+        ids = group_ids[valid]
+        counts = np.bincount(ids, minlength=group_count)
+        if func == 'count':
+            return counts
+        
+        values = self.values(column)[valid].astype(np.float64)
+        result = np.full(group_count, np.nan)
+        present = counts > 0
+        if func in ('sum', 'mean'):
+            sums = np.bincount(ids, weights=values, minlength=group_count)
+            if func == 'sum':
+                return sums
+            result[present] = sums[present] / counts[present]
+            return result
+        
+        # min / max / median：按 (分组, 取值) 排序后按分组偏移取值
+        order = np.lexsort((values, ids))
+        ordered = values[order]
+        ends = np.cumsum(counts)
+        starts = ends - counts
+        if func == 'min':
+            result[present] = ordered[starts[present]]
+        elif func == 'max':
+            result[present] = ordered[ends[present] - 1]
+        else:
+            lower = ordered[starts[present] + (counts[present] - 1) // 2]
+            upper = ordered[starts[present] + counts[present] // 2]
+            result[present] = (lower + upper) / 2
+        return result
+    
+    @staticmethod
+    def _to_python(value: Any, func: str) -> Any:
+        """将聚合结果转换为Python值（NaN转换为None）"""
+        if func == 'count':
+            return int(value)
+        value = float(value)
+        return None if value != value else value
+    
+    def group_by(self, key: str, aggregations: Dict[str, Tuple[str, str]]) -> Dict[Any, Dict[str, Any]]:
+        """
+        按列分组聚合
+        
+        Args:
+            key: 分组列（数值列或字符串列），空值归入键为None的分组
+            aggregations: 输出名 -> (列名, 聚合函数)，聚合函数为 count/sum/mean/min/max/median，
+                          count 统计该列非空值个数，其余只用于数值列
+        
+        Returns:
+            分组键 -> {'rows': 行数, 输出名: 聚合值}，按行数从多到少排列；没有有效值的聚合为None
+        
+        Raises:
+            KeyError: 列不存在或不能用于分组
+            ValueError: 聚合函数不支持
+        """
+        group_ids, keys = self._group_ids(key)
+        rows = np.bincount(group_ids, minlength=len(keys))
+        results = {
+            name: self._group_aggregate(group_ids, len(keys), column, func)
+            for name, (column, func) in aggregations.items()
+        }
+        
+        grouped = {}
+        for group in sorted(np.flatnonzero(rows), key=lambda g: -rows[g]):
+            entry = {'rows': int(rows[group])}
+            for name, (_, func) in aggregations.items():
+                entry[name] = self._to_python(results[name][group], func)
+            grouped[keys[group]] = entry
+        return grouped
+    
+    def aggregate(self, column: str, func: str) -> Any:
+        """
+        对整列聚合（空值不参与计算）
+        
+        Args:
+            column: 列名
+            func: 聚合函数（count/sum/mean/min/max/median）
+        
+        Returns:
+            聚合值，没有有效值时为None（count为0）
+        """
+        group_ids = np.zeros(self._length, dtype=np.int64)
+        return self._to_python(self._group_aggregate(group_ids, 1, column, func)[0], func)
+    
+    # ---- 转换回AppInfo ----
+    
+    def _python_columns(self) -> List[List[Any]]:
+        """按AppInfo字段顺序返回各列的Python取值列表"""
+        columns = []
+        for name in FIELD_NAMES:
+            if name in self._numeric:
+                values, valid = self._numeric[name]
+                columns.append([
+                    value if ok else None for value, ok in zip(values.tolist(), valid.tolist())
+                ])
+            else:
+                columns.append(self.column(name).tolist())
+        return columns
+    
+    def to_app_infos(self) -> List[AppInfo]:
+        """
+        转换为AppInfo列表（fileSizeBytes还原为整数）
+        
+        Returns:
+            AppInfo对象列表
+        """
+        return [AppInfo(*row) for row in zip(*self._python_columns())]
+    
+    def row(self, index: int) -> AppInfo:
+        """
+        将一行转换为AppInfo
+        
+        Args:
+            index: 行号
+        
+        Returns:
+            AppInfo对象
+        """
+        if not -self._length <= index < self._length:
+            raise IndexError(f"行号 {index} 超出范围")
+        return self.filter(np.array([index])).to_app_infos()[0]
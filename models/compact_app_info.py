@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+紧凑应用信息模型
+基于 __slots__ 的AppInfo变体，属性名、构造参数和格式化方法与AppInfo一致，
+适合在内存中保留整个店面目录的批处理任务
+"""
+
+import sys
+from typing import Optional, List, Dict, Any, Iterable, Tuple
+
+from models.app_info import AppInfo, AppInfoFormattingMixin, FIELD_MAP, FIELD_NAMES, project_fields
+
+
+# 取值重复度高的字符串字段，驻留后所有实例共享同一个字符串对象
+INTERNED_FIELDS = frozenset((
+    'artist_name', 'currency', 'formatted_price', 'minimum_os_version',
+    'primary_genre_name', 'content_advisory_rating',
+))
+
+# 取值组合重复度高的列表字段，转换为共享的元组
+SHARED_TUPLE_FIELDS = frozenset(('genres', 'genre_ids', 'supported_devices'))
+
+# 共享元组表的容量上限，超出后不再共享新的组合
+_MAX_SHARED_TUPLES = 65536
+_shared_tuples: Dict[Tuple, Tuple] = {}
+
+
+def _compact_value(name: str, value: Any) -> Any:
+    """按字段类型压缩取值：驻留字符串、共享列表元组"""
+    if value is None:
+        return None
+    if name in INTERNED_FIELDS and type(value) is str:
+        return sys.intern(value)
+    if name in SHARED_TUPLE_FIELDS and isinstance(value, (list, tuple)):
+        value = tuple(sys.intern(item) if type(item) is str else item for item in value)
+        shared = _shared_tuples.get(value)
+        if shared is not None:
+            return shared
+        if len(_shared_tuples) < _MAX_SHARED_TUPLES:
+            _shared_tuples[value] = value
+    return value
+
+
+class CompactAppInfo(AppInfoFormattingMixin):
+    """
+    紧凑的应用信息类
+    
+    与AppInfo的区别：没有实例 __dict__；重复度高的字符串被驻留；
+    genres、genre_ids、supported_devices 为在实例间共享的只读元组。
+    """
+    
+    # _derived 保存格式化方法缓存的派生值
+    __slots__ = FIELD_NAMES + ('_derived',)
+    
+    def __init__(self, *args, **kwargs):
+        """参数顺序和名称与AppInfo相同，未提供的字段为None"""
+        if len(args) > len(FIELD_NAMES):
+            raise TypeError(f"CompactAppInfo最多接受 {len(FIELD_NAMES)} 个位置参数")
+        values = dict(zip(FIELD_NAMES, args))
+        for name, value in kwargs.items():
+            if name not in FIELD_NAMES:
+                raise TypeError(f"CompactAppInfo没有字段 {name!r}")
+            values[name] = value
+        for name in FIELD_NAMES:
+            setattr(self, name, _compact_value(name, values.get(name)))
+    
+    @classmethod
+    def from_api_response(cls, data: Dict[str, Any]) -> 'CompactAppInfo':
+        """从API响应数据创建CompactAppInfo实例（不经过AppInfo）"""
+        self = cls.__new__(cls)
+        for name, key in FIELD_MAP:
+            setattr(self, name, _compact_value(name, data.get(key)))
+        return self
+    
+    @classmethod
+    def from_api_batch(cls, records: Iterable[Dict[str, Any]],
+                       fields: Optional[Iterable[str]] = None) -> List['CompactAppInfo']:
+        """
+        批量从API响应数据创建CompactAppInfo实例，未投影的字段为None
+        
+        Args:
+            records: API响应中的 results 记录
+            fields: 要读取的字段名，默认读取全部字段
+        
+        Returns:
+            CompactAppInfo对象列表
+        """
+        names, keys = project_fields(fields)
+        selected = set(names)
+        skipped = tuple(name for name in FIELD_NAMES if name not in selected)
+        pairs = tuple(zip(names, keys))
+        apps = []
+        for record in records:
+            app = cls.__new__(cls)
+            for name, key in pairs:
+                setattr(app, name, _compact_value(name, record.get(key)))
+            for name in skipped:
+                setattr(app, name, None)
+            apps.append(app)
+        return apps
+    
+    @classmethod
+    def from_app_info(cls, app_info: AppInfo) -> 'CompactAppInfo':
+        """从AppInfo转换"""
+        return cls(**{name: getattr(app_info, name) for name in FIELD_NAMES})
+    
+    def to_app_info(self) -> AppInfo:
+        """转换为AppInfo（共享元组字段还原为列表）"""
+        values = {name: getattr(self, name) for name in FIELD_NAMES}
+        for name in SHARED_TUPLE_FIELDS:
+            if values[name] is not None:
+                values[name] = list(values[name])
+        return AppInfo(**values)
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CompactAppInfo):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in FIELD_NAMES)
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"CompactAppInfo(track_id={self.track_id!r}, bundle_id={self.bundle_id!r}, track_name={self.track_name!r})"
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+惰性应用信息模型
+重字段（描述、更新说明、截图和设备列表）在首次访问前保存为指向原始响应体的JSON片段，
+批量查询时大部分调用方从不读取这些字段，可省去对应的字符串和列表分配
+
+需要安装 msgspec（JSON片段为零拷贝的 msgspec.Raw），由JSON解码后端的惰性模式创建
+"""
+
+from typing import Any, Tuple
+
+try:
+    import msgspec
+except ImportError:  # msgspec为可选依赖
+    msgspec = None
+
+from models.app_info import AppInfo, FIELD_NAMES
+
+
+# 惰性解码的字段
+LAZY_FIELDS = ('description', 'release_notes', 'screenshot_urls', 'ipad_screenshot_urls', 'supported_devices')
+
+_RAW_TYPE = msgspec.Raw if msgspec is not None else None
+
+
+class _LazyField:
+    """惰性字段描述符：实例字典中的取值为JSON片段时，首次读取解码并替换为解码结果"""
+    
+    __slots__ = ('name',)
+    
+    def __init__(self, name: str):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return getattr(AppInfo, self.name)
+        value = instance.__dict__.get(self.name)
+        if type(value) is _RAW_TYPE:
+            value = instance.__dict__[self.name] = msgspec.json.decode(value)
+        return value
+    
+    def __set__(self, instance, value):
+        instance.__dict__[self.name] = value
+
+
+class LazyAppInfo(AppInfo):
+    """
+    惰性解码重字段的AppInfo
+    
+    属性名和取值与AppInfo一致，可与AppInfo直接比较。未解码的字段会让原始响应体保持存活，
+    需要长期保存时可调用 to_app_info() 转换为普通AppInfo。
+    """
+    
+    description = _LazyField('description')
+    release_notes = _LazyField('release_notes')
+    screenshot_urls = _LazyField('screenshot_urls')
+    ipad_screenshot_urls = _LazyField('ipad_screenshot_urls')
+    supported_devices = _LazyField('supported_devices')
+    
+    @classmethod
+    def from_values(cls, values: Tuple[Any, ...]) -> 'LazyAppInfo':
+        """
+        按AppInfo字段顺序的取值创建实例（不经过 __init__）
+        
+        Args:
+            values: 取值元组，惰性字段可为 msgspec.Raw
+        
+        Returns:
+            LazyAppInfo实例
+        """
+        self = cls.__new__(cls)
+        self.__dict__.update(zip(FIELD_NAMES, values))
+        return self
+    
+    def is_decoded(self, name: str) -> bool:
+        """
+        字段是否已解码
+        
+        Args:
+            name: 字段名
+        
+        Returns:
+            非惰性字段或已解码时为True
+        """
+        return type(self.__dict__.get(name)) is not _RAW_TYPE
+    
+    def to_app_info(self) -> AppInfo:
+        """解码全部字段并转换为普通AppInfo（不再引用原始响应体）"""
+        return AppInfo(*(getattr(self, name) for name in FIELD_NAMES))
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, AppInfo):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in FIELD_NAMES)
+    
+    __hash__ = None
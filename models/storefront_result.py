@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+店面查询结果数据模型
+描述同一应用在单个国家/地区App Store中的可用性、价格、版本和评分
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from models.app_info import AppInfo
+
+
+@dataclass
+class StorefrontResult:
+    """单个店面的查询结果"""
+    
+    country: str
+    available: bool = False
+    price: Optional[float] = None
+    formatted_price: Optional[str] = None
+    currency: Optional[str] = None
+    version: Optional[str] = None
+    average_user_rating: Optional[float] = None
+    user_rating_count: Optional[int] = None
+    # 请求失败时的错误信息（与"未上架"区分）
+    error: Optional[str] = None
+    app_info: Optional[AppInfo] = None
+    
+    @classmethod
+    def from_app_info(cls, country: str, app_info: Optional[AppInfo]) -> 'StorefrontResult':
+        """从AppInfo创建店面结果，app_info为None表示该店面未上架"""
+        if app_info is None:
+            return cls(country=country)
+        
+        return cls(
+            country=country,
+            available=True,
+            price=app_info.price,
+            formatted_price=app_info.formatted_price,
+            currency=app_info.currency,
+            version=app_info.version,
+            average_user_rating=app_info.average_user_rating,
+            user_rating_count=app_info.user_rating_count,
+            app_info=app_info
+        )
+    
+    @classmethod
+    def from_error(cls, country: str, error: str) -> 'StorefrontResult':
+        """创建请求失败的店面结果"""
+        return cls(country=country, error=error)
@@ -10,6 +10,7 @@ from PySide6.QtWidgets import (
 from models.app_info import AppInfo
 from ui.font_config import FontConfig
 from utils.helpers import format_number
+from utils.tracing import traced
 
 
 class DetailsPanelWidget(QWidget):
@@ -161,6 +162,7 @@ class DetailsPanelWidget(QWidget):
         self.release_notes_text.setPlainText("")
         self.details_text.setPlainText("")
     
+    @traced('ui.DetailsPanelWidget.display_app_info')
     def display_app_info(self, app_info: AppInfo):
         """显示应用详细信息"""
         # 描述信息
@@ -170,6 +172,7 @@ class DetailsPanelWidget(QWidget):
         # 详细信息
         self.display_detailed_info(app_info)
     
+    @traced('ui.DetailsPanelWidget.display_detailed_info')
     def display_detailed_info(self, app_info: AppInfo):
         """显示详细信息"""
         details = []
@@ -11,6 +11,7 @@ from PySide6.QtWidgets import (
 
 from models.app_info import AppInfo
 from utils.helpers import format_number, load_image_from_url
+from utils.tracing import traced
 
 
 class InfoPanelWidget(QWidget):
@@ -360,6 +361,7 @@ class InfoPanelWidget(QWidget):
         self.view_in_store_button.setEnabled(False)
         self.copy_info_button.setEnabled(False)
     
+    @traced('ui.InfoPanelWidget.display_app_info')
     def display_app_info(self, app_info: AppInfo):
         """显示应用信息"""
         self.current_app_info = app_info
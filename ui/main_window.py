@@ -5,28 +5,37 @@
 实现应用的主要用户界面
 """
 
+import time
 import webbrowser
 import platform
 
-from PySide6.QtCore import Qt, QThread, Signal
+from PySide6.QtCore import Qt, QThread, QTimer, Signal
 from PySide6.QtGui import QIcon
 from PySide6.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QSplitter, QMessageBox
+    QMainWindow, QWidget, QVBoxLayout, QSplitter, QMessageBox, QPushButton
 )
 
 from ui.font_config import FontConfig
 
-from api.itunes_api import iTunesAPI
+from api.client_registry import get_client, preconnect
+from api.offline_snapshot import get_default_snapshot, format_age
+from api.prefetcher import Prefetcher, build_prefetch_queue, load_prefetch_seeds
 from models.app_info import AppInfo
 from ui.details_panel_widget import DetailsPanelWidget
 from ui.info_panel_widget import InfoPanelWidget
+from ui.metrics_dialog import MetricsDialog
 from ui.search_widget import SearchWidget
 from utils.helpers import is_valid_app_id
+from utils.history import SearchHistory
+from utils.tracing import get_tracer
 
 
 class SearchWorker(QThread):
     """搜索工作线程"""
     
+    # 单次查询的总时间预算（秒），包含全部重试
+    SEARCH_DEADLINE = 8
+    
     # 信号定义
     search_finished = Signal(object)  # AppInfo对象或None
     search_error = Signal(str)  # 错误信息
@@ -35,15 +44,37 @@ class SearchWorker(QThread):
         super().__init__()
         self.app_id = app_id
         self.country = country
-        self.api = iTunesAPI()
+        # 所有搜索共用进程内的客户端，复用已建立的连接
+        self.api = get_client()
+        self.created_at = time.perf_counter()
     
     def run(self):
         """执行搜索"""
-        try:
-            app_info = self.api.lookup_by_id(self.app_id, self.country)
-            self.search_finished.emit(app_info)
-        except Exception as e:
-            self.search_error.emit(str(e))
+        tracer = get_tracer()
+        # 从创建工作线程到线程开始运行的等待时间
+        tracer.record('worker.thread_start', self.created_at, time.perf_counter())
+        with tracer.span('worker.run', app_id=self.app_id, country=self.country):
+            try:
+                app_info = self.api.lookup_by_id(self.app_id, self.country, deadline=self.SEARCH_DEADLINE)
+                self.search_finished.emit(app_info)
+            except Exception as e:
+                self.search_error.emit(str(e))
+
+
+class SnapshotLoader(QThread):
+    """离线快照加载线程：首次加载整个本地应用库和响应缓存，之后增量加载新写入的数据"""
+    
+    # 信号定义
+    snapshot_loaded = Signal(object)  # OfflineSnapshot对象
+    load_error = Signal(str)  # 错误信息
+    
+    def run(self):
+        """加载快照"""
+        with get_tracer().span('snapshot.load'):
+            try:
+                self.snapshot_loaded.emit(get_default_snapshot(refresh=True))
+            except Exception as e:
+                self.load_error.emit(str(e))
 
 
 class MainWindow(QMainWindow):
@@ -52,13 +83,32 @@ class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.current_app_info = None
+        self.current_app_id = None
+        self.current_country = None
         self.search_worker = None
+        self.snapshot_loader = None
+        self.history = SearchHistory()
+        self.prefetcher = None
+        
+        # 界面进程始终记录追踪（环形缓冲区只保留最近的事件），可在指标对话框中导出
+        get_tracer().enable()
         
         # 设置统一的字体配置
         FontConfig.setup_application_fonts()
         
         self.init_ui()
         self.setup_connections()
+        
+        # 后台预先建立到API服务器的连接，减少首次查询的握手耗时
+        preconnect()
+        
+        # 窗口显示后（事件循环开始）再启动后台预取
+        QTimer.singleShot(0, self.start_prefetch)
+    
+    def start_prefetch(self):
+        """按查询历史和种子列表在后台预热响应缓存和图标缓存"""
+        self.prefetcher = Prefetcher()
+        self.prefetcher.start(build_prefetch_queue(self.history.recent(), load_prefetch_seeds()))
     
     def init_ui(self):
         """初始化用户界面"""
@@ -128,16 +178,23 @@ class MainWindow(QMainWindow):
         
         # 创建状态栏
         self.statusBar().showMessage("就绪")
+        
+        # 状态栏右侧的指标入口
+        self.metrics_button = QPushButton("📊 指标")
+        self.metrics_button.setFlat(True)
+        self.statusBar().addPermanentWidget(self.metrics_button)
     
     def setup_connections(self):
         """设置信号连接"""
         # 搜索相关信号
         self.search_widget.search_button.clicked.connect(self.search_app)
         self.search_widget.app_id_input.returnPressed.connect(self.search_app)
+        self.search_widget.offline_checkbox.toggled.connect(self.set_offline_mode)
         
         # 操作按钮信号
         self.info_widget.get_view_button().clicked.connect(self.view_in_app_store)
         self.info_widget.get_copy_button().clicked.connect(self.copy_app_info)
+        self.metrics_button.clicked.connect(self.show_metrics)
     
     def search_app(self):
         """搜索应用"""
@@ -158,8 +215,47 @@ class MainWindow(QMainWindow):
         # 开始搜索
         self.start_search(app_id, country)
     
+    def set_offline_mode(self, enabled: bool):
+        """切换离线模式：在后台线程加载（或增量更新）本地快照，完成后共享客户端改由快照回答查询"""
+        if not enabled:
+            get_client().offline = None
+            self.statusBar().showMessage("已切换到在线模式", 3000)
+            return
+        
+        if self.snapshot_loader is not None and self.snapshot_loader.isRunning():
+            return
+        self.statusBar().showMessage("正在加载离线快照...")
+        self.snapshot_loader = SnapshotLoader()
+        self.snapshot_loader.snapshot_loaded.connect(self.on_snapshot_loaded)
+        self.snapshot_loader.load_error.connect(self.on_snapshot_error)
+        self.snapshot_loader.start()
+    
+    def on_snapshot_loaded(self, snapshot):
+        """离线快照加载完成处理"""
+        if not self.search_widget.is_offline_mode():
+            # 加载期间已切回在线模式
+            return
+        get_client().offline = snapshot
+        newest = snapshot.newest()
+        if newest is None:
+            self.statusBar().showMessage("离线模式：本地快照为空，请先在线查询或导入数据")
+        else:
+            self.statusBar().showMessage(
+                f"离线模式：本地快照共 {len(snapshot)} 个应用，最近更新于 {format_age(time.time() - newest)}"
+            )
+    
+    def on_snapshot_error(self, error_message: str):
+        """离线快照加载失败处理：保持在线模式"""
+        self.search_widget.offline_checkbox.setChecked(False)
+        QMessageBox.critical(self, "错误", f"加载离线快照失败：{error_message}")
+    
     def start_search(self, app_id: str, country: str):
         """开始搜索"""
+        self.current_app_id = app_id
+        self.current_country = country
+        if self.prefetcher is not None:
+            self.prefetcher.interactive_started()
+        
         # 禁用搜索按钮，显示进度条
         self.search_widget.set_search_enabled(False)
         self.search_widget.show_progress(True)
@@ -173,31 +269,55 @@ class MainWindow(QMainWindow):
     
     def on_search_finished(self, app_info: AppInfo):
         """搜索完成处理"""
+        if self.prefetcher is not None:
+            self.prefetcher.interactive_finished()
         self.search_widget.set_search_enabled(True)
         self.search_widget.show_progress(False)
         
         if app_info:
             self.current_app_info = app_info
-            self.info_widget.display_app_info(app_info)
-            self.details_widget.display_app_info(app_info)
-            self.details_widget.display_detailed_info(app_info)
-            self.statusBar().showMessage("查询完成")
+            self.history.add(self.current_app_id, self.current_country)
+            with get_tracer().span('ui.render', track_id=app_info.track_id):
+                self.info_widget.display_app_info(app_info)
+                # display_app_info 内部已调用 display_detailed_info
+                self.details_widget.display_app_info(app_info)
+            snapshot = get_client().offline
+            if snapshot is not None:
+                # 显示离线数据的年龄，提醒数据可能已过时
+                age = snapshot.age(str(app_info.track_id), self.current_country)
+                age_text = format_age(age) if age is not None else "未知时间"
+                self.statusBar().showMessage(f"查询完成（离线数据，抓取于 {age_text}）")
+            else:
+                self.statusBar().showMessage("查询完成")
         else:
-            QMessageBox.information(self, "提示", "未找到相关应用信息")
+            if get_client().offline is not None:
+                QMessageBox.information(self, "提示", "本地快照中未找到该应用，请关闭离线模式后重试")
+            else:
+                QMessageBox.information(self, "提示", "未找到相关应用信息")
             self.statusBar().showMessage("未找到应用")
     
     def on_search_error(self, error_message: str):
         """搜索错误处理"""
+        if self.prefetcher is not None:
+            self.prefetcher.interactive_finished()
         self.search_widget.set_search_enabled(True)
         self.search_widget.show_progress(False)
         QMessageBox.critical(self, "错误", f"查询失败：{error_message}")
-        self.statusBar().showMessage("查询失败")
-
+        degraded = get_client().circuit_breaker.degraded_storefronts()
+        if degraded:
+            self.statusBar().showMessage(f"查询失败（暂不可用的店面：{', '.join(degraded)}）")
+        else:
+            self.statusBar().showMessage("查询失败")
+    
     def view_in_app_store(self):
         """在App Store中查看"""
         if self.current_app_info and self.current_app_info.track_view_url:
             webbrowser.open(self.current_app_info.track_view_url)
     
+    def show_metrics(self):
+        """显示请求指标"""
+        MetricsDialog(self).exec()
+    
     def copy_app_info(self):
         """复制应用信息到剪贴板"""
         if self.info_widget.copy_app_info():
@@ -0,0 +1,116 @@
+"""
+指标对话框
+显示各接口的请求数、状态分类、缓存命中、重试、延迟分位数和店面熔断状态，并支持导出
+"""
+
+import json
+
+from PySide6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QPushButton, QFileDialog, QMessageBox
+)
+
+from api.circuit_breaker import get_default_circuit_breaker
+from api.metrics import MetricsRegistry, get_default_metrics
+from ui.font_config import FontConfig
+from utils.tracing import get_tracer
+
+
+def format_metrics_report(metrics: MetricsRegistry) -> str:
+    """
+    将指标快照格式化为便于阅读的文本
+    
+    Args:
+        metrics: 指标注册表
+    
+    Returns:
+        多行文本
+    """
+    snapshot = metrics.snapshot()
+    lines = [f"统计时长: {snapshot['uptime']:.0f} 秒", ""]
+    
+    if not snapshot['endpoints']:
+        lines.append("暂无请求")
+    for endpoint, data in sorted(snapshot['endpoints'].items()):
+        latency = data['latency']
+        requests_text = ', '.join(f"{klass}={count}" for klass, count in sorted(data['requests'].items())) or "无"
+        cache_text = ', '.join(f"{state}={count}" for state, count in sorted(data['cache'].items())) or "无"
+        retries_text = ', '.join(f"{reason}={count}" for reason, count in sorted(data['retries'].items())) or "无"
+        lines.extend([
+            f"[{endpoint}]",
+            f"  请求: {requests_text}",
+            f"  接收: {data['bytes'] / 1024:.1f} KB",
+            f"  缓存: {cache_text}",
+            f"  重试: {retries_text}",
+            f"  合并: {data['coalesced']}",
+            f"  延迟: p50={latency['p50'] * 1000:.1f}ms  p95={latency['p95'] * 1000:.1f}ms  "
+            f"p99={latency['p99'] * 1000:.1f}ms  max={latency['max'] * 1000:.1f}ms",
+            "",
+        ])
+    
+    degraded = [item for item in get_default_circuit_breaker().snapshot() if item.state != 'closed']
+    lines.append("店面熔断: " + (', '.join(
+        f"{item.country}{item.endpoint}({item.state}, 失败率{item.failure_rate:.0%})" for item in degraded
+    ) if degraded else "全部正常"))
+    return '\n'.join(lines)
+
+
+class MetricsDialog(QDialog):
+    """指标对话框"""
+    
+    def __init__(self, parent=None, metrics: MetricsRegistry = None):
+        super().__init__(parent)
+        self.metrics = metrics or get_default_metrics()
+        self.init_ui()
+        self.refresh()
+    
+    def init_ui(self):
+        """初始化UI"""
+        self.setWindowTitle("请求指标")
+        self.resize(640, 480)
+        layout = QVBoxLayout(self)
+        
+        self.report_edit = QPlainTextEdit()
+        self.report_edit.setReadOnly(True)
+        self.report_edit.setFont(FontConfig.get_monospace_font())
+        layout.addWidget(self.report_edit)
+        
+        button_layout = QHBoxLayout()
+        refresh_button = QPushButton("刷新")
+        refresh_button.clicked.connect(self.refresh)
+        button_layout.addWidget(refresh_button)
+        
+        prometheus_button = QPushButton("导出Prometheus文本")
+        prometheus_button.clicked.connect(lambda: self.export(self.metrics.to_prometheus(), "metrics.prom"))
+        button_layout.addWidget(prometheus_button)
+        
+        json_button = QPushButton("导出JSON")
+        json_button.clicked.connect(lambda: self.export(self.metrics.to_json(), "metrics.json"))
+        button_layout.addWidget(json_button)
+        
+        # Chrome trace-event格式，可在 chrome://tracing 或 Perfetto 中打开
+        trace_button = QPushButton("导出追踪")
+        trace_button.clicked.connect(
+            lambda: self.export(json.dumps(get_tracer().to_chrome_trace(), ensure_ascii=False), "trace.json")
+        )
+        button_layout.addWidget(trace_button)
+        
+        button_layout.addStretch()
+        close_button = QPushButton("关闭")
+        close_button.clicked.connect(self.accept)
+        button_layout.addWidget(close_button)
+        layout.addLayout(button_layout)
+    
+    def refresh(self):
+        """刷新指标显示"""
+        self.report_edit.setPlainText(format_metrics_report(self.metrics))
+    
+    def export(self, content: str, default_name: str):
+        """导出指标到文件"""
+        path, _ = QFileDialog.getSaveFileName(self, "导出指标", default_name)
+        if not path:
+            return
+        try:
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(content)
+        except OSError as e:
+            QMessageBox.critical(self, "错误", f"导出失败：{e}")
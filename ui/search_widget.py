@@ -5,7 +5,7 @@
 
 from PySide6.QtWidgets import (
     QWidget, QHBoxLayout, QVBoxLayout, QLineEdit,
-    QComboBox, QPushButton, QLabel, QProgressBar
+    QComboBox, QPushButton, QLabel, QProgressBar, QCheckBox
 )
 
 from ui.font_config import FontConfig
@@ -135,6 +135,13 @@ class SearchWidget(QWidget):
         """)
         search_layout.addWidget(self.search_button)
         
+        # 离线模式：由本地快照回答查询，不访问网络
+        self.offline_checkbox = QCheckBox("离线模式")
+        self.offline_checkbox.setFont(FontConfig.get_label_font())
+        self.offline_checkbox.setStyleSheet("color: #2c3e50;")
+        self.offline_checkbox.setToolTip("使用本地应用库和已缓存的查询结果，不发送网络请求")
+        search_layout.addWidget(self.offline_checkbox)
+        
         # 进度条 - 现代化样式
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
@@ -172,6 +179,10 @@ class SearchWidget(QWidget):
         if show:
             self.progress_bar.setRange(0, 0)  # 不确定进度
     
+    def is_offline_mode(self):
+        """是否勾选了离线模式"""
+        return self.offline_checkbox.isChecked()
+    
     def set_app_id(self, app_id):
         """设置应用ID"""
         self.app_id_input.setText(app_id)
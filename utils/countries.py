@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+国家/地区配置模块
+加载App Store店面（国家代码）映射，不依赖Qt，可供API层和批处理工具使用
+"""
+
+import json
+import os
+
+
+def load_country_mapping() -> dict:
+    """
+    从配置文件加载国家代码映射
+    
+    Returns:
+        国家代码映射字典
+    """
+    config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'countries.json')
+    
+    try:
+        with open(config_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"警告: 配置文件 {config_path} 不存在，使用默认国家映射")
+        return {
+            'cn': '中国',
+            'us': '美国',
+            'jp': '日本',
+            'kr': '韩国',
+            'gb': '英国',
+            'de': '德国',
+            'fr': '法国',
+            'ca': '加拿大',
+            'au': '澳大利亚',
+            'in': '印度'
+        }
+    except Exception as e:
+        print(f"加载国家配置错误: {e}")
+        return {}
+
+
+def get_country_name(country_code: str) -> str:
+    """
+    根据国家代码获取国家名称
+    
+    Args:
+        country_code: 国家代码
+        
+    Returns:
+        国家名称
+    """
+    country_map = load_country_mapping()
+    return country_map.get(country_code.lower(), country_code.upper())
@@ -11,6 +11,11 @@ from PySide6.QtGui import QPixmap
 from PySide6.QtNetwork import QNetworkAccessManager, QNetworkRequest
 from PySide6.QtCore import QUrl, QEventLoop
 
+from api.icon_cache import get_default_icon_cache
+
+# 国家映射函数已移至不依赖Qt的 utils.countries，此处保留导入以兼容旧调用
+from utils.countries import load_country_mapping, get_country_name  # noqa: F401
+
 
 def is_valid_app_id(app_id: str) -> bool:
     """
@@ -74,7 +79,7 @@ def truncate_text(text: Optional[str], max_length: int = 100) -> str:
 
 def load_image_from_url(url: str) -> Optional[QPixmap]:
     """
-    从URL加载图片
+    从URL加载图片（经过图标缓存，已缓存的图片不再下载）
     
     Args:
         url: 图片URL
@@ -86,12 +91,12 @@ def load_image_from_url(url: str) -> Optional[QPixmap]:
         return None
     
     try:
-        import requests
-        response = requests.get(url, timeout=10)
-        response.raise_for_status()
+        content = get_default_icon_cache().fetch(url)
+        if content is None:
+            return None
         
         pixmap = QPixmap()
-        pixmap.loadFromData(response.content)
+        pixmap.loadFromData(content)
         return pixmap if not pixmap.isNull() else None
         
     except Exception as e:
@@ -99,55 +104,6 @@ def load_image_from_url(url: str) -> Optional[QPixmap]:
         return None
 
 
-import json
-import os
-
-
-def load_country_mapping() -> dict:
-    """
-    从配置文件加载国家代码映射
-    
-    Returns:
-        国家代码映射字典
-    """
-    config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config', 'countries.json')
-    
-    try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        print(f"警告: 配置文件 {config_path} 不存在，使用默认国家映射")
-        return {
-            'cn': '中国',
-            'us': '美国',
-            'jp': '日本',
-            'kr': '韩国',
-            'gb': '英国',
-            'de': '德国',
-            'fr': '法国',
-            'ca': '加拿大',
-            'au': '澳大利亚',
-            'in': '印度'
-        }
-    except Exception as e:
-        print(f"加载国家配置错误: {e}")
-        return {}
-
-
-def get_country_name(country_code: str) -> str:
-    """
-    根据国家代码获取国家名称
-    
-    Args:
-        country_code: 国家代码
-        
-    Returns:
-        国家名称
-    """
-    country_map = load_country_mapping()
-    return country_map.get(country_code.lower(), country_code.upper())
-
-
 def validate_url(url: str) -> bool:
     """
     验证URL是否有效
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+查询历史模块
+记录最近成功查询的应用（应用ID + 国家代码），保存在用户目录下的JSON文件中
+"""
+
+import json
+import os
+import threading
+import time
+from typing import List, Tuple
+
+
+DEFAULT_HISTORY_PATH = os.path.join(os.path.expanduser('~'), '.apple_app_bundle_finder', 'history.json')
+
+
+class SearchHistory:
+    """查询历史类（线程安全）"""
+    
+    def __init__(self, path: str = DEFAULT_HISTORY_PATH, max_entries: int = 100):
+        """
+        初始化查询历史
+        
+        Args:
+            path: 历史文件路径
+            max_entries: 保留的最大条数
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries = self._load()
+    
+    def _load(self) -> List[dict]:
+        """读取历史文件"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            print(f"加载查询历史错误: {e}")
+            return []
+    
+    def add(self, app_id: str, country: str):
+        """
+        记录一次查询（重复查询移到最前）
+        
+        Args:
+            app_id: 应用ID
+            country: 国家代码
+        """
+        with self._lock:
+            self._entries = [
+                entry for entry in self._entries
+                if (entry['app_id'], entry['country']) != (app_id, country)
+            ]
+            self._entries.insert(0, {'app_id': app_id, 'country': country, 'time': time.time()})
+            del self._entries[self.max_entries:]
+            entries = list(self._entries)
+        
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"保存查询历史错误: {e}")
+    
+    def recent(self, limit: int = 20) -> List[Tuple[str, str]]:
+        """
+        获取最近的查询
+        
+        Args:
+            limit: 返回条数
+        
+        Returns:
+            按时间倒序的 (应用ID, 国家代码) 列表
+        """
+        with self._lock:
+            return [(entry['app_id'], entry['country']) for entry in self._entries[:limit]]
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+示例数据模块
+生成字段和体积接近真实iTunes API响应的应用记录，供性能测试和本地模拟服务器使用
+"""
+
+import json
+import random
+from typing import Any, Dict, List
+
+
+_GENRES = [
+    (6000, '商务'), (6002, '工具'), (6005, '社交'), (6007, '效率'), (6008, '摄影与录像'),
+    (6012, '生活'), (6014, '游戏'), (6015, '财务'), (6016, '娱乐'), (6017, '教育'),
+]
+_DEVICES = [
+    'iPhone5s-iPhone5s', 'iPadAir-iPadAir', 'iPhone6-iPhone6', 'iPhone7-iPhone7',
+    'iPhoneX-iPhoneX', 'iPhone11-iPhone11', 'iPhone12-iPhone12', 'iPhone13-iPhone13',
+    'iPhone14-iPhone14', 'iPhone15-iPhone15', 'iPadPro11-iPadPro11', 'iPadMini6-iPadMini6',
+]
+_WORDS = [
+    'fast', 'secure', 'photo', 'chat', 'cloud', 'sync', 'music', 'video', 'note', 'task',
+    'game', 'map', 'travel', 'health', 'money', 'shop', 'news', 'read', 'learn', 'focus',
+]
+
+
+def make_app_record(index: int, seed: int = 0) -> Dict[str, Any]:
+    """
+    生成一条应用记录（键名与iTunes API一致）
+    
+    Args:
+        index: 记录序号，同一序号总是生成相同的trackId和bundleId
+        seed: 随机种子，用于生成不同的语料
+        
+    Returns:
+        应用记录字典
+    """
+    rng = random.Random(seed * 1000003 + index)
+    track_id = 300000000 + index
+    artist_id = 280000000 + index // 5
+    genre_id, genre_name = _GENRES[index % len(_GENRES)]
+    name_words = rng.sample(_WORDS, 2)
+    track_name = ' '.join(word.capitalize() for word in name_words) + f' {index}'
+    bundle_id = f'com.example{index // 5}.{name_words[0]}{index}'
+    price = rng.choice([0.0, 0.0, 0.0, 0.99, 1.99, 4.99, 9.99])
+    art = f'https://is1-ssl.mzstatic.com/image/thumb/Purple/v4/{track_id:x}/AppIcon'
+    sentences = ' '.join(' '.join(rng.choices(_WORDS, k=12)) + '.' for _ in range(rng.randint(20, 60)))
+    
+    return {
+        'wrapperType': 'software',
+        'kind': 'software',
+        'trackId': track_id,
+        'trackName': track_name,
+        'trackCensoredName': track_name,
+        'bundleId': bundle_id,
+        'artistName': f'Example Developer {index // 5}',
+        'artistId': artist_id,
+        'artistViewUrl': f'https://apps.apple.com/us/developer/id{artist_id}?uo=4',
+        'sellerName': f'Example Developer {index // 5} Ltd.',
+        'sellerUrl': f'https://example{index // 5}.com',
+        'description': sentences,
+        'releaseNotes': ' '.join(rng.choices(_WORDS, k=rng.randint(10, 80))),
+        'version': f'{rng.randint(1, 9)}.{rng.randint(0, 20)}.{rng.randint(0, 9)}',
+        'releaseDate': '2015-03-12T07:00:00Z',
+        'currentVersionReleaseDate': f'2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}T08:00:00Z',
+        'minimumOsVersion': rng.choice(['12.0', '13.0', '14.0', '15.0', '16.0']),
+        'price': price,
+        'currency': 'USD',
+        'formattedPrice': 'Free' if price == 0 else f'${price}',
+        'primaryGenreName': genre_name,
+        'primaryGenreId': genre_id,
+        'genres': [genre_name, '娱乐'],
+        'genreIds': [str(genre_id), '6016'],
+        'averageUserRating': round(rng.uniform(1.0, 5.0), 5),
+        'userRatingCount': rng.randint(0, 2000000),
+        'averageUserRatingForCurrentVersion': round(rng.uniform(1.0, 5.0), 5),
+        'userRatingCountForCurrentVersion': rng.randint(0, 2000000),
+        'artworkUrl60': f'{art}/60x60bb.jpg',
+        'artworkUrl100': f'{art}/100x100bb.jpg',
+        'artworkUrl512': f'{art}/512x512bb.jpg',
+        'screenshotUrls': [f'{art}/screen{i}/392x696bb.jpg' for i in range(rng.randint(3, 10))],
+        'ipadScreenshotUrls': [f'{art}/ipad{i}/576x768bb.jpg' for i in range(rng.randint(0, 8))],
+        'appletvScreenshotUrls': [],
+        'fileSizeBytes': str(rng.randint(5, 3000) * 1024 * 1024),
+        'contentAdvisoryRating': rng.choice(['4+', '9+', '12+', '17+']),
+        'trackContentRating': '4+',
+        'supportedDevices': rng.sample(_DEVICES, rng.randint(4, len(_DEVICES))),
+        'features': ['iosUniversal'],
+        'advisories': [],
+        'languageCodesISO2A': ['EN', 'ZH', 'JA'],
+        'isGameCenterEnabled': genre_id == 6014,
+        'isVppDeviceBasedLicensingEnabled': True,
+        'trackViewUrl': f'https://apps.apple.com/us/app/id{track_id}?uo=4',
+        'supportUrl': f'https://example{index // 5}.com/support',
+    }
+
+
+def make_corpus(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    生成一组应用记录
+    
+    Args:
+        count: 记录数量
+        seed: 随机种子
+        
+    Returns:
+        应用记录列表
+    """
+    return [make_app_record(index, seed) for index in range(count)]
+
+
+def make_response_body(records: List[Dict[str, Any]]) -> bytes:
+    """
+    将记录包装为iTunes API响应体
+    
+    Args:
+        records: 应用记录列表
+        
+    Returns:
+        JSON响应体字节串
+    """
+    return json.dumps({'resultCount': len(records), 'results': records}, ensure_ascii=False).encode('utf-8')
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+追踪模块
+记录查询从工作线程、API请求、JSON解码、模型构建到界面渲染各阶段的耗时区间，
+导出为Chrome trace-event JSON（可在 chrome://tracing 或 Perfetto 中按时间轴查看）
+
+设置环境变量 APP_FINDER_TRACE=<文件路径> 时自动启用，并在进程退出时写入该文件。
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Optional, Dict, Any, Callable
+
+
+TRACE_ENV_VAR = 'APP_FINDER_TRACE'
+
+
+class _NullSpan:
+    """追踪关闭时使用的空区间"""
+    
+    def __enter__(self) -> '_NullSpan':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+    
+    def set(self, **attrs):
+        """追踪关闭时忽略属性"""
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Span:
+    """一个计时区间，退出时写入追踪器"""
+    
+    __slots__ = ('tracer', 'name', 'attrs', 'start')
+    
+    def __init__(self, tracer: 'Tracer', name: str, attrs: Dict[str, Any]):
+        self.tracer = tracer
+        self.name = name
+        self.attrs = attrs
+        self.start = 0.0
+    
+    def __enter__(self) -> 'Span':
+        self.start = time.perf_counter()
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.attrs['error'] = exc_type.__name__
+        self.tracer.record(self.name, self.start, time.perf_counter(), **self.attrs)
+        return False
+    
+    def set(self, **attrs):
+        """在区间内补充属性（如状态码、结果数量）"""
+        self.attrs.update(attrs)
+
+
+class Tracer:
+    """进程内追踪器（线程安全，事件保存在有界环形缓冲区中）"""
+    
+    def __init__(self, enabled: bool = False, max_events: int = 20000):
+        """
+        初始化追踪器
+        
+        Args:
+            enabled: 是否启用
+            max_events: 保留的最大事件数，超出后丢弃最早的事件
+        """
+        self.enabled = enabled
+        self._events = deque(maxlen=max_events)
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        # 事件时间戳相对于追踪器创建时刻
+        self._origin = time.perf_counter()
+    
+    def enable(self):
+        """启用追踪"""
+        self.enabled = True
+    
+    def disable(self):
+        """关闭追踪"""
+        self.enabled = False
+    
+    def span(self, name: str, **attrs):
+        """
+        创建计时区间，用于 with 语句
+        
+        Args:
+            name: 区间名称
+            attrs: 附加属性
+        
+        Returns:
+            区间对象（追踪关闭时为空区间）
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return Span(self, name, attrs)
+    
+    def record(self, name: str, start: float, end: float, **attrs):
+        """
+        直接记录一个已完成的区间（用于跨线程的阶段，如线程启动等待）
+        
+        Args:
+            name: 区间名称
+            start: 开始时间（time.perf_counter）
+            end: 结束时间（time.perf_counter）
+            attrs: 附加属性
+        """
+        if not self.enabled:
+            return
+        thread = threading.current_thread()
+        event = {
+            'name': name,
+            'ph': 'X',
+            'ts': (start - self._origin) * 1e6,
+            'dur': (end - start) * 1e6,
+            'pid': self._pid,
+            'tid': thread.ident,
+            'args': attrs,
+        }
+        with self._lock:
+            self._events.append((event, thread.name))
+    
+    def clear(self):
+        """清空已记录的事件"""
+        with self._lock:
+            self._events.clear()
+    
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """
+        导出为Chrome trace-event格式
+        
+        Returns:
+            {'traceEvents': [...], 'displayTimeUnit': 'ms'} 字典
+        """
+        with self._lock:
+            records = list(self._events)
+        thread_names = {event['tid']: thread_name for event, thread_name in records}
+        metadata = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': self._pid, 'tid': tid, 'args': {'name': thread_name}}
+            for tid, thread_name in thread_names.items()
+        ]
+        return {'traceEvents': metadata + [event for event, _ in records], 'displayTimeUnit': 'ms'}
+    
+    def export(self, path: str):
+        """
+        将追踪写入文件
+        
+        Args:
+            path: 输出的JSON文件路径
+        """
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False)
+
+
+def traced(name: Optional[str] = None) -> Callable:
+    """
+    为函数添加追踪区间的装饰器（追踪关闭时只多一次属性判断）
+    
+    Args:
+        name: 区间名称，默认为函数的限定名
+    
+    Returns:
+        装饰器
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            tracer = get_tracer()
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with tracer.span(span_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """
+    获取进程内共享的追踪器；设置了 APP_FINDER_TRACE 时自动启用并在退出时导出
+    
+    Returns:
+        Tracer实例
+    """
+    global _tracer
+    if _tracer is not None:
+        return _tracer
+    with _tracer_lock:
+        if _tracer is None:
+            path = os.environ.get(TRACE_ENV_VAR)
+            tracer = Tracer(enabled=bool(path))
+            if path:
+                atexit.register(tracer.export, path)
+            _tracer = tracer
+        return _tracer